@@ -3,13 +3,26 @@
 Convert PNG files with black backgrounds to transparent backgrounds
 """
 
+import io
+import json
 import sys
 from pathlib import Path
 from PIL import Image
 import numpy as np
 
-def convert_to_transparent(input_path: Path, output_path: Path = None, threshold: int = 30):
-    """Convert PNG with black background to transparent background."""
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent))
+
+from src.processors.blobs import save_image, write_file
+from src.processors.png import scale_placement, trim
+
+def convert_to_transparent(input_path: Path, output_path: Path = None, threshold: int = 30,
+                           trim_padding: int = None):
+    """Convert PNG with black background to transparent background.
+
+    With trim_padding set, empty borders are cropped to that margin and the
+    canvas offset is recorded in the glyph metadata.
+    """
     try:
         # Load the image
         img = Image.open(input_path)
@@ -35,7 +48,12 @@ def convert_to_transparent(input_path: Path, output_path: Path = None, threshold
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_transparent{input_path.suffix}"
         
-        transparent_img.save(output_path, 'PNG')
+        # Crop to the alpha bounding box just computed
+        if trim_padding is not None:
+            transparent_img, placement = trim(transparent_img, trim_padding, threshold)
+            record_trim_metadata(input_path.stem, Path(output_path), placement, trimmed_from=input_path)
+        
+        save_image(transparent_img, output_path, 'PNG')
         
         print(f"✅ Converted {input_path.name} to transparent background")
         return output_path
@@ -44,6 +62,113 @@ def convert_to_transparent(input_path: Path, output_path: Path = None, threshold
         print(f"❌ Error converting {input_path.name}: {e}")
         return None
 
+def record_trim_metadata(name: str, path: Path, placement: dict, trimmed_from: Path = None,
+                         rendition_size: tuple = None, metadata_dir: Path = Path("assets/metadata")):
+    """Record a trimmed file's placement on its original canvas in glyph metadata.
+
+    Placements are keyed by file path, since several directories hold files
+    with the same name, and every file cut from one glyph is recorded in that
+    glyph's metadata (name). When the image that was trimmed (trimmed_from,
+    default path itself) was already trimmed, the placement composes with
+    its entry so the offset always refers to the original full canvas. A
+    rendition resized after trimming passes rendition_size, and its
+    placement is scaled to the rendition's pixels.
+    """
+    metadata_file = metadata_dir / f"{name}.json"
+    metadata = load_metadata(metadata_file, name)
+    trims = load_trims(metadata)
+    
+    source = Path(trimmed_from or path)
+    previous = trims.get(str(source))
+    if previous is None and source.stem != name:
+        previous = load_trims(load_metadata(metadata_dir / f"{source.stem}.json", source.stem)).get(str(source))
+    if previous:
+        placement = {
+            'canvas': previous['canvas'],
+            'offset': [previous['offset'][0] + placement['offset'][0], previous['offset'][1] + placement['offset'][1]],
+            'size': placement['size']
+        }
+    if rendition_size is not None:
+        placement = scale_placement(placement, rendition_size)
+    
+    trims[str(path)] = placement
+    metadata["trim"] = trims
+    metadata_dir.mkdir(parents=True, exist_ok=True)
+    with open(metadata_file, 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+def load_metadata(metadata_file: Path, name: str) -> dict:
+    """Load a glyph's metadata file, or start a new one."""
+    if not metadata_file.exists():
+        return {"name": name}
+    with open(metadata_file, 'r') as f:
+        return json.load(f)
+
+def load_trims(metadata: dict) -> dict:
+    """Get the per-path trim placements from glyph metadata."""
+    trims = metadata.get("trim")
+    if not isinstance(trims, dict) or "offset" in trims:
+        # Entries from before per-path keys cannot be attributed to a file
+        return {}
+    return trims
+
+def trim_codex(directories: list = None, padding: int = 4, threshold: int = 30, write: bool = False):
+    """Trim empty borders from codex PNGs and report pixel and byte savings."""
+    directories = directories or [Path("assets/glyphs/celtic/png/original"), Path("assets/glyphs/archetypal/png")]
+    png_files = sorted(f for directory in directories for f in Path(directory).glob("*.png"))
+    
+    if not png_files:
+        print("❌ No PNG files found")
+        return None
+    
+    print(f"✂️ Trimming {len(png_files)} PNG files (padding {padding}px)...")
+    
+    totals = {'files': 0, 'pixels': 0, 'trimmed_pixels': 0, 'bytes': 0, 'trimmed_bytes': 0}
+    
+    for png_file in png_files:
+        try:
+            img = Image.open(png_file)
+            img.load()
+            trimmed, placement = trim(img, padding, threshold)
+            
+            buffer = io.BytesIO()
+            trimmed.save(buffer, 'PNG', optimize=True, compress_level=9)
+            original_bytes = png_file.stat().st_size
+            trimmed_bytes = len(buffer.getvalue())
+            if trimmed_bytes >= original_bytes:
+                # Re-encoding would grow the file; leave it untouched
+                trimmed, trimmed_bytes = img, original_bytes
+            
+            totals['files'] += 1
+            totals['pixels'] += img.width * img.height
+            totals['trimmed_pixels'] += trimmed.width * trimmed.height
+            totals['bytes'] += original_bytes
+            totals['trimmed_bytes'] += trimmed_bytes
+            
+            print(f"   {png_file.name}: {img.width}x{img.height} → {trimmed.width}x{trimmed.height} "
+                  f"at {tuple(placement['offset'])}, {original_bytes/1024:.1f}KB → {trimmed_bytes/1024:.1f}KB")
+            
+            if write and trimmed is not img:
+                write_file(png_file, buffer.getvalue())
+                record_trim_metadata(png_file.stem, png_file, placement)
+        
+        except Exception as e:
+            print(f"❌ Error trimming {png_file.name}: {e}")
+    
+    pixels_saved = totals['pixels'] - totals['trimmed_pixels']
+    bytes_saved = totals['bytes'] - totals['trimmed_bytes']
+    
+    print(f"\n{'='*50}")
+    print(f"📊 TRIM SUMMARY")
+    print(f"{'='*50}")
+    print(f"Files: {totals['files']}")
+    print(f"Pixels saved: {pixels_saved} ({pixels_saved/max(totals['pixels'], 1)*100:.1f}%)")
+    print(f"Bytes saved: {bytes_saved} ({bytes_saved/max(totals['bytes'], 1)*100:.1f}%)")
+    if not write:
+        print(f"ℹ️ Dry run - pass --write to crop files and record offsets")
+    
+    return {**totals, 'pixels_saved': pixels_saved, 'bytes_saved': bytes_saved}
+
 def batch_convert_pngs():
     """Convert all PNG files in the archetypal directory."""
     png_dir = Path("assets/glyphs/archetypal/png")
@@ -105,5 +230,8 @@ def test_conversion():
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         test_conversion()
+    elif len(sys.argv) > 1 and sys.argv[1] == "trim":
+        padding = int(sys.argv[sys.argv.index("--padding") + 1]) if "--padding" in sys.argv else 4
+        trim_codex(padding=padding, write="--write" in sys.argv)
     else:
         batch_convert_pngs() 
\ No newline at end of file
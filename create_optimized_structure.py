@@ -7,9 +7,15 @@ with multiple PNG sizes for dreamscape performance
 import sys
 from pathlib import Path
 from PIL import Image
-import shutil
 import json
 
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent))
+
+from src.processors.blobs import copy_file, save_image
+from src.processors.png import trim
+from convert_to_transparent import record_trim_metadata
+
 def create_folder_structure():
     """Create the optimized folder structure."""
     
@@ -76,7 +82,7 @@ def create_folder_structure():
     print(f"\n🎉 Folder structure created successfully!")
     return base_path
 
-def optimize_and_copy_symbols():
+def optimize_and_copy_symbols(trim_padding: int = None):
     """Optimize existing symbols and copy to new structure."""
     
     # Source paths
@@ -108,7 +114,7 @@ def optimize_and_copy_symbols():
                 style = "meru"
             
             # Create multiple sizes
-            create_multiple_sizes(png_file, target_base, style)
+            create_multiple_sizes(png_file, target_base, style, trim_padding)
             
             # Create WebP version
             create_webp_version(png_file, target_base.parent / "webp", style)
@@ -131,11 +137,11 @@ def optimize_and_copy_symbols():
             
             # Copy to appropriate location
             target_file = target_base / webp_file.name
-            shutil.copy2(webp_file, target_file)
+            copy_file(webp_file, target_file)
             print(f"   ✅ Copied to {target_file}")
 
-def create_multiple_sizes(input_path: Path, target_base: Path, style: str):
-    """Create multiple sizes for a symbol."""
+def create_multiple_sizes(input_path: Path, target_base: Path, style: str, trim_padding: int = None):
+    """Create multiple sizes for a symbol, trimmed to trim_padding first when set."""
     try:
         # Load the image
         img = Image.open(input_path)
@@ -144,6 +150,11 @@ def create_multiple_sizes(input_path: Path, target_base: Path, style: str):
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
         
+        # Crop empty borders once, before any size is made
+        placement = None
+        if trim_padding is not None:
+            img, placement = trim(img, trim_padding)
+        
         # Define sizes
         sizes = {
             "64x64": (64, 64),
@@ -160,14 +171,17 @@ def create_multiple_sizes(input_path: Path, target_base: Path, style: str):
             
             # Save optimized version
             output_path = target_base / size_name / input_path.name
-            resized.save(output_path, 'PNG', optimize=True, compress_level=9)
+            save_image(resized, output_path, 'PNG', optimize=True, compress_level=9)
+            if placement is not None:
+                record_trim_metadata(input_path.stem, output_path, placement, trimmed_from=input_path,
+                                     rendition_size=resized.size)
             
             file_size = output_path.stat().st_size
             print(f"   ✅ {size_name}: {file_size/1024:.1f}KB")
         
         # Copy original to original folder
         original_path = target_base / "original" / input_path.name
-        shutil.copy2(input_path, original_path)
+        copy_file(input_path, original_path)
         original_size = original_path.stat().st_size
         print(f"   ✅ original: {original_size/1024:.1f}KB")
         
@@ -189,7 +203,7 @@ def create_webp_version(input_path: Path, target_base: Path, style: str):
         output_path = target_base / webp_name
         
         # Save as WebP with transparency
-        img.save(output_path, 'WEBP', quality=85, method=6)
+        save_image(img, output_path, 'WEBP', quality=85, method=6)
         
         file_size = output_path.stat().st_size
         print(f"   ✅ webp: {file_size/1024:.1f}KB")
@@ -297,7 +311,7 @@ def create_performance_config():
     
     print(f"   ✅ Dreamscape config: {config_path}")
 
-def main():
+def main(trim_padding: int = None):
     """Main function to create the optimized structure."""
     
     print("🎨 Creating Optimized Symbol Structure")
@@ -313,7 +327,7 @@ def main():
     create_performance_config()
     
     # Process existing symbols
-    optimize_and_copy_symbols()
+    optimize_and_copy_symbols(trim_padding)
     
     print("\n" + "=" * 50)
     print("🎉 OPTIMIZED STRUCTURE CREATED SUCCESSFULLY!")
@@ -348,4 +362,4 @@ def main():
     print("• 500 symbols: ~8MB total (vs ~200MB original)")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main(trim_padding=int(sys.argv[sys.argv.index("--trim-padding") + 1]) if "--trim-padding" in sys.argv else None) 
\ No newline at end of file
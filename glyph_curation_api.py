@@ -3,10 +3,11 @@
 Flask API for Glyph Curation with Custom Feedback
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import json
 import os
+import zlib
 from pathlib import Path
 from datetime import datetime
 
@@ -19,6 +20,14 @@ CORS(app)  # Enable CORS for all routes
 # Initialize the backend
 backend = GlyphCurationBackend()
 
+# Longest analytics windows served
+MAX_WINDOW_DAYS = 366
+MAX_TREND_PERIODS = {'day': 366, 'hour': 24 * 30}
+
+# Page size bounds of the streaming export
+EXPORT_PAGE_SIZE = 1000
+EXPORT_MAX_PAGE_SIZE = 10000
+
 @app.route('/api/regenerate', methods=['POST'])
 def regenerate_glyph():
     """Regenerate glyph variants with custom feedback."""
@@ -110,6 +119,68 @@ def get_insights():
         print(f"❌ Error in get_insights: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/insights/verify', methods=['GET'])
+def verify_insights():
+    """Check insights against curation history (?rebuild=1 repairs them)."""
+    try:
+        rebuild = request.args.get('rebuild', '').lower() in ('1', 'true', 'yes')
+        report = backend.verify_insights(rebuild=rebuild)
+        
+        return jsonify({
+            'success': True,
+            'report': report
+        })
+        
+    except Exception as e:
+        print(f"❌ Error in verify_insights: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/compare', methods=['GET'])
+def analytics_compare():
+    """Compare the last N days with the N days before (?days=7&model=&style=)."""
+    try:
+        days = int(request.args.get('days', 7))
+        if not 1 <= days <= MAX_WINDOW_DAYS:
+            return jsonify({'error': f'days must be between 1 and {MAX_WINDOW_DAYS}'}), 400
+        
+        comparison = backend.compare_windows(days, request.args.get('model'), request.args.get('style'))
+        
+        return jsonify({
+            'success': True,
+            'comparison': comparison
+        })
+        
+    except ValueError:
+        return jsonify({'error': 'days must be an integer'}), 400
+    except Exception as e:
+        print(f"❌ Error in analytics_compare: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/analytics/trend', methods=['GET'])
+def analytics_trend():
+    """Get a curation metrics series (?granularity=day|hour&periods=30&model=&style=)."""
+    try:
+        granularity = request.args.get('granularity', 'day')
+        if granularity not in MAX_TREND_PERIODS:
+            return jsonify({'error': 'granularity must be day or hour'}), 400
+        periods = int(request.args.get('periods', 30))
+        if not 1 <= periods <= MAX_TREND_PERIODS[granularity]:
+            return jsonify({'error': f'periods must be between 1 and {MAX_TREND_PERIODS[granularity]}'}), 400
+        
+        trend = backend.get_trend(periods, granularity, request.args.get('model'), request.args.get('style'))
+        
+        return jsonify({
+            'success': True,
+            'granularity': granularity,
+            'trend': trend
+        })
+        
+    except ValueError:
+        return jsonify({'error': 'periods must be an integer'}), 400
+    except Exception as e:
+        print(f"❌ Error in analytics_trend: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/progress', methods=['GET'])
 def get_progress():
     """Get curation progress."""
@@ -125,6 +196,53 @@ def get_progress():
         print(f"❌ Error in get_progress: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/glyphs/status', methods=['GET'])
+def glyph_status():
+    """Get the curation status of every target glyph."""
+    try:
+        return jsonify({
+            'success': True,
+            'progress': backend.get_curation_progress(),
+            'glyphs': backend.get_glyph_status()
+        })
+        
+    except Exception as e:
+        print(f"❌ Error in glyph_status: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/glyphs/next', methods=['GET'])
+def next_uncurated():
+    """Get the next glyph that still needs curating."""
+    try:
+        glyph = backend.next_uncurated_glyph()
+        
+        return jsonify({
+            'success': True,
+            'complete': glyph is None,
+            'glyph': glyph
+        })
+        
+    except Exception as e:
+        print(f"❌ Error in next_uncurated: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/glyphs/<name>', methods=['GET'])
+def glyph_lookup(name):
+    """Get one glyph's curation status."""
+    try:
+        glyph = backend.get_glyph_status(name)
+        if glyph is None:
+            return jsonify({'error': f'Unknown glyph: {name}'}), 404
+        
+        return jsonify({
+            'success': True,
+            'glyph': glyph
+        })
+        
+    except Exception as e:
+        print(f"❌ Error in glyph_lookup: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/export', methods=['GET'])
 def export_data():
     """Export complete curation data."""
@@ -140,6 +258,50 @@ def export_data():
         print(f"❌ Error in export_data: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/export/stream', methods=['GET'])
+def export_stream():
+    """Stream one page of curation history as NDJSON.
+    
+    Query: cursor (seq to start from), limit, since (ISO timestamp), gzip=1.
+    Pass the X-Next-Cursor header back as cursor while X-Has-More is true.
+    """
+    try:
+        cursor = int(request.args.get('cursor', 0))
+        limit = min(int(request.args.get('limit', EXPORT_PAGE_SIZE)), EXPORT_MAX_PAGE_SIZE)
+        since = request.args.get('since')
+        if cursor < 0 or limit < 1:
+            return jsonify({'error': 'cursor must be >= 0 and limit >= 1'}), 400
+        
+        page = backend.history_page(cursor=cursor, limit=limit, since=since)
+        use_gzip = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+        
+        def generate():
+            compressor = zlib.compressobj(wbits=31) if use_gzip else None
+            for record in page['records']:
+                line = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+                chunk = compressor.compress(line) if compressor else line
+                if chunk:
+                    yield chunk
+            if compressor:
+                yield compressor.flush()
+        
+        headers = {
+            'X-Next-Cursor': str(page['next_cursor']),
+            'X-Has-More': 'true' if page['has_more'] else 'false',
+            'X-Record-Count': str(len(page['records'])),
+            'Access-Control-Expose-Headers': 'X-Next-Cursor, X-Has-More, X-Record-Count'
+        }
+        if use_gzip:
+            headers['Content-Encoding'] = 'gzip'
+        
+        return Response(generate(), mimetype='application/x-ndjson', headers=headers)
+        
+    except ValueError:
+        return jsonify({'error': 'cursor and limit must be integers'}), 400
+    except Exception as e:
+        print(f"❌ Error in export_stream: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -156,8 +318,15 @@ if __name__ == '__main__':
     print("  POST /api/regenerate - Regenerate glyph variants with feedback")
     print("  POST /api/select - Record variant selection")
     print("  GET  /api/insights - Get reinforcement learning insights")
+    print("  GET  /api/insights/verify - Check insights against curation history")
+    print("  GET  /api/analytics/compare - Last N days vs the N days before")
+    print("  GET  /api/analytics/trend - Hourly or daily curation metrics")
     print("  GET  /api/progress - Get curation progress")
+    print("  GET  /api/glyphs/status - Curation status of every target glyph")
+    print("  GET  /api/glyphs/next - Next glyph to curate")
+    print("  GET  /api/glyphs/<name> - One glyph's curation status")
     print("  GET  /api/export - Export curation data")
+    print("  GET  /api/export/stream - Stream history as NDJSON (cursor, limit, since, gzip)")
     print("  GET  /api/health - Health check")
     print("=" * 50)
     print("🌐 Server will run on: http://localhost:5002")
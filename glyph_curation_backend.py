@@ -3,9 +3,9 @@
 Glyph Curation Backend - Handles generation, selection, and model reinforcement
 """
 
-import json
-import os
-from pathlib import Path
+import atexit
+import threading
+from bisect import bisect_left
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import replicate
@@ -14,6 +14,14 @@ from dotenv import load_dotenv
 # Import our existing modules
 from src.utils.model_interface import get_model
 from src.generators.archetypal import ArchetypalGenerator
+from src.curation.analytics import TimeBuckets
+from src.curation.commit import GroupCommitWriter
+from src.curation.feedback import FeedbackStore
+from src.curation.insights import InsightsAggregator
+from src.curation.reinforcement import apply_increments, increments, model_for
+from src.curation.status import GlyphStatusIndex, load_targets
+from src.curation.storage import open_storage
+from src.curation.themes import match_themes, suggest_improvements
 
 class GlyphCurationBackend:
     """Backend for glyph curation with model reinforcement learning."""
@@ -26,58 +34,90 @@ class GlyphCurationBackend:
         self.celtic_generator = ArchetypalGenerator(model_name="celtic")
         self.meru_generator = ArchetypalGenerator(model_name="meru")
         
-        # Curation data storage
-        self.curation_data_path = Path("data/curation")
-        self.curation_data_path.mkdir(parents=True, exist_ok=True)
-        
-        # Model reinforcement data
-        self.reinforcement_data_path = Path("data/reinforcement")
-        self.reinforcement_data_path.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing data
+        # Curation and reinforcement data storage (CURATION_STORAGE=json|sqlite)
+        self.storage = open_storage()
         self.curation_history = self.load_curation_history()
         self.reinforcement_data = self.load_reinforcement_data()
+        self.aggregates = InsightsAggregator(self.reinforcement_data)
+        self.analytics = TimeBuckets()
+        self.analytics.load(self.curation_history)
+        self.glyph_status = GlyphStatusIndex(load_targets())
+        self.glyph_status.load(self.curation_history)
+        
+        # lock guards in-memory state; _commit_lock serialises catching up with
+        # other processes and writing, which also hold the storage file lock
+        self.lock = threading.RLock()
+        self._commit_lock = threading.Lock()
+        
+        # Concurrent selections are batched into one durable write
+        self.writer = GroupCommitWriter(self._commit_selections)
+        
+        # Custom feedback is served from memory and written behind
+        self.feedback = FeedbackStore(self.storage)
+        
+        # atexit runs in reverse: drain writers before storage closes
+        atexit.register(self.storage.close)
+        atexit.register(self.feedback.close)
+        atexit.register(self.writer.close)
     
     def load_curation_history(self) -> List[Dict]:
         """Load existing curation history."""
-        history_file = self.curation_data_path / "curation_history.json"
-        if history_file.exists():
-            with open(history_file, 'r') as f:
-                return json.load(f)
-        return []
+        return self.storage.load_history()
     
     def load_reinforcement_data(self) -> Dict:
         """Load model reinforcement data."""
-        reinforcement_file = self.reinforcement_data_path / "reinforcement_data.json"
-        if reinforcement_file.exists():
-            with open(reinforcement_file, 'r') as f:
-                return json.load(f)
-        return {
-            "celtic": {
-                "preferred_styles": {},
-                "quality_feedback": {},
-                "regeneration_patterns": {},
-                "selection_patterns": {}
-            },
-            "meru": {
-                "preferred_styles": {},
-                "quality_feedback": {},
-                "regeneration_patterns": {},
-                "selection_patterns": {}
-            }
-        }
+        return self.storage.load_reinforcement()
+    
+    def selections_for(self, glyph_name: str, style: Optional[str] = None) -> List[Dict]:
+        """Get recorded selections of a glyph, optionally under one style."""
+        self.refresh()
+        with self.lock:
+            return self.storage.selections_for(glyph_name, style)
+    
+    def refresh(self):
+        """Catch up with selections committed by other worker processes."""
+        with self._commit_lock, self.storage.lock():
+            self._catch_up()
     
-    def save_curation_history(self):
-        """Save curation history to file."""
-        history_file = self.curation_data_path / "curation_history.json"
-        with open(history_file, 'w') as f:
-            json.dump(self.curation_history, f, indent=2)
+    def _catch_up(self):
+        """Apply selections other processes stored since ours (hold the commit and storage locks)."""
+        records = self.storage.refresh(len(self.curation_history))
+        if not records:
+            return
+        with self.lock:
+            for record in records:
+                self._apply_selection(record)
+        print(f"🔄 Caught up with {len(records)} selections from other workers")
     
-    def save_reinforcement_data(self):
-        """Save reinforcement data to file."""
-        reinforcement_file = self.reinforcement_data_path / "reinforcement_data.json"
-        with open(reinforcement_file, 'w') as f:
-            json.dump(self.reinforcement_data, f, indent=2)
+    def _commit_selections(self, records: List[Dict]):
+        """Durably store a batch of selections, then apply it in memory (runs on the group commit thread)."""
+        with self._commit_lock, self.storage.lock():
+            self._catch_up()
+            
+            # Sequence numbers and timestamps are assigned under the storage lock, so they are unique
+            # across workers and history stays in timestamp order (even if the clock steps back)
+            known = len(self.curation_history)
+            timestamp = datetime.now().isoformat()
+            if self.curation_history:
+                timestamp = max(timestamp, self.curation_history[-1]["timestamp"])
+            batch = []
+            for offset, record in enumerate(records):
+                record["seq"] = known + offset
+                record["timestamp"] = timestamp
+                batch.append((record, increments(record)))
+            self.storage.append_selections(batch)
+            
+            with self.lock:
+                for record in records:
+                    self._apply_selection(record)
+                self.storage.checkpoint()
+    
+    def _apply_selection(self, record: Dict):
+        """Add a stored selection to in-memory history, counters and analytics (hold lock)."""
+        self.curation_history.append(record)
+        self.update_reinforcement_data(record)
+        self.analytics.add(record)
+        self.glyph_status.add(record)
     
     def generate_glyph_variants(self, glyph_info: Dict) -> Dict:
         """Generate 4 variants for a glyph."""
@@ -187,7 +227,7 @@ class GlyphCurationBackend:
                         custom_feedback: Optional[str] = None):
         """Record user selection for model reinforcement."""
         
-        # Create selection record
+        # Create selection record (seq and the final timestamp are assigned when it is committed)
         selection_record = {
             "timestamp": datetime.now().isoformat(),
             "glyph_info": glyph_info,
@@ -195,16 +235,11 @@ class GlyphCurationBackend:
             "feedback": feedback,
             "regeneration_count": regeneration_count,
             "custom_feedback": custom_feedback,
-            "model_used": "celtic" if glyph_info.get('style', '').startswith('celtic') else "meru"
+            "model_used": model_for(glyph_info)
         }
         
-        # Add to curation history
-        self.curation_history.append(selection_record)
-        self.save_curation_history()
-        
-        # Update reinforcement data
-        self.update_reinforcement_data(selection_record)
-        self.save_reinforcement_data()
+        # Wait until the group commit writer has stored and applied the selection
+        self.writer.write(selection_record)
         
         # Process custom feedback for prompt improvement
         if custom_feedback:
@@ -214,89 +249,42 @@ class GlyphCurationBackend:
         if custom_feedback:
             print(f"📝 Custom feedback: {custom_feedback}")
     
-    def update_reinforcement_data(self, selection_record: Dict):
-        """Update reinforcement learning data based on selection."""
-        
-        model = selection_record["model_used"]
-        glyph_info = selection_record["glyph_info"]
-        style = glyph_info.get('style', 'default')
-        feedback = selection_record.get('feedback')
-        
-        # Update style preferences
-        if style not in self.reinforcement_data[model]["preferred_styles"]:
-            self.reinforcement_data[model]["preferred_styles"][style] = 0
-        self.reinforcement_data[model]["preferred_styles"][style] += 1
-        
-        # Update quality feedback
-        if feedback:
-            if feedback not in self.reinforcement_data[model]["quality_feedback"]:
-                self.reinforcement_data[model]["quality_feedback"][feedback] = 0
-            self.reinforcement_data[model]["quality_feedback"][feedback] += 1
-        
-        # Update regeneration patterns
-        regeneration_count = selection_record.get('regeneration_count', 0)
-        if regeneration_count > 0:
-            if regeneration_count not in self.reinforcement_data[model]["regeneration_patterns"]:
-                self.reinforcement_data[model]["regeneration_patterns"][regeneration_count] = 0
-            self.reinforcement_data[model]["regeneration_patterns"][regeneration_count] += 1
-        
-        # Update selection patterns
-        selected_variant = selection_record["selected_variant"]
-        if selected_variant not in self.reinforcement_data[model]["selection_patterns"]:
-            self.reinforcement_data[model]["selection_patterns"][selected_variant] = 0
-        self.reinforcement_data[model]["selection_patterns"][selected_variant] += 1
+    def update_reinforcement_data(self, selection_record: Dict) -> List:
+        """Update reinforcement learning data based on selection; returns the counter increments."""
+        
+        # Style preferences, quality feedback, regeneration and selection patterns
+        changes = increments(selection_record)
+        apply_increments(self.reinforcement_data, changes)
+        self.aggregates.apply(changes)
+        return changes
     
     def get_reinforcement_insights(self) -> Dict:
         """Get insights from reinforcement learning data."""
         
-        insights = {
-            "celtic": self.analyze_model_insights("celtic"),
-            "meru": self.analyze_model_insights("meru"),
-            "recommendations": self.generate_recommendations()
-        }
+        self.refresh()
+        with self.lock:
+            insights = {
+                "celtic": self.analyze_model_insights("celtic"),
+                "meru": self.analyze_model_insights("meru"),
+                "recommendations": self.generate_recommendations()
+            }
         
         return insights
     
     def analyze_model_insights(self, model: str) -> Dict:
-        """Analyze insights for a specific model."""
-        
-        data = self.reinforcement_data[model]
-        
-        # Find most preferred styles
-        preferred_styles = sorted(
-            data["preferred_styles"].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:3]
-        
-        # Find most common feedback
-        quality_feedback = sorted(
-            data["quality_feedback"].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:3]
-        
-        # Find most selected variants
-        selection_patterns = sorted(
-            data["selection_patterns"].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        
-        # Calculate average regenerations
-        total_regenerations = sum(
-            count * frequency for count, frequency in data["regeneration_patterns"].items()
-        )
-        total_selections = sum(data["selection_patterns"].values())
-        avg_regenerations = total_regenerations / total_selections if total_selections > 0 else 0
-        
-        return {
-            "preferred_styles": preferred_styles,
-            "quality_feedback": quality_feedback,
-            "selection_patterns": selection_patterns,
-            "avg_regenerations": avg_regenerations,
-            "total_selections": total_selections
-        }
+        """Analyze insights for a specific model from the running aggregates."""
+        return self.aggregates.model_insights(model)
+    
+    def verify_insights(self, rebuild: bool = False) -> Dict:
+        """Check the running aggregates against raw curation history, optionally rebuilding them."""
+        self.refresh()
+        with self.lock:
+            report = self.aggregates.verify(self.curation_history, rebuild=rebuild)
+        if report["consistent"]:
+            print(f"✅ Insights consistent with {report['records_checked']} selections")
+        else:
+            print(f"⚠️ Insights drifted from history: {', '.join(report['mismatches'])}")
+        return report
     
     def generate_recommendations(self) -> List[str]:
         """Generate recommendations based on reinforcement data."""
@@ -328,64 +316,45 @@ class GlyphCurationBackend:
     def process_custom_feedback(self, glyph_info: Dict, custom_feedback: str):
         """Process custom feedback to improve prompts."""
         
-        # Load existing custom feedback data
-        custom_feedback_file = self.reinforcement_data_path / "custom_feedback.json"
-        if custom_feedback_file.exists():
-            with open(custom_feedback_file, 'r') as f:
-                custom_feedback_data = json.load(f)
-        else:
-            custom_feedback_data = {
-                "feedback_entries": [],
-                "prompt_improvements": {},
-                "common_themes": {}
-            }
-        
         # Add new feedback entry
         feedback_entry = {
             "timestamp": datetime.now().isoformat(),
             "glyph_name": glyph_info['name'],
             "glyph_info": glyph_info,
             "feedback": custom_feedback,
-            "model_used": "celtic" if glyph_info.get('style', '').startswith('celtic') else "meru"
+            "model_used": model_for(glyph_info)
         }
         
-        custom_feedback_data["feedback_entries"].append(feedback_entry)
-        
-        # Analyze feedback for common themes
-        self.analyze_custom_feedback(custom_feedback_data, custom_feedback)
-        
-        # Generate prompt improvements
-        self.generate_prompt_improvements(custom_feedback_data, glyph_info, custom_feedback)
-        
-        # Save updated custom feedback data
-        with open(custom_feedback_file, 'w') as f:
-            json.dump(custom_feedback_data, f, indent=2)
+        with self.feedback.lock:
+            custom_feedback_data = self.feedback.data
+            custom_feedback_data["feedback_entries"].append(feedback_entry)
+            
+            # Analyze feedback for common themes
+            themes = self.analyze_custom_feedback(custom_feedback_data, custom_feedback)
+            
+            # Generate prompt improvements
+            improvement = self.generate_prompt_improvements(custom_feedback_data, glyph_info, custom_feedback)
+            
+            # Queue for the background flusher
+            self.feedback.mark_dirty(feedback_entry, improvement, themes)
         
         print(f"📝 Processed custom feedback for {glyph_info['name']}")
     
-    def analyze_custom_feedback(self, custom_feedback_data: Dict, feedback: str):
-        """Analyze custom feedback for common themes."""
-        
-        # Common improvement themes
-        themes = {
-            "detail": ["more detail", "intricate", "complex", "detailed", "fine lines"],
-            "balance": ["balance", "symmetry", "proportion", "harmony", "centered"],
-            "movement": ["dynamic", "flow", "movement", "energy", "rhythm"],
-            "style": ["celtic", "tribal", "knotwork", "spiral", "ornament"],
-            "contrast": ["contrast", "bold", "strong", "clear", "sharp"],
-            "composition": ["composition", "layout", "arrangement", "design", "structure"]
-        }
+    def analyze_custom_feedback(self, custom_feedback_data: Dict, feedback: str) -> List[str]:
+        """Analyze custom feedback for common themes; returns the themes it matched."""
         
-        feedback_lower = feedback.lower()
+        # Themes are matched in one pass of the compiled matcher
+        matched = match_themes(feedback)
         
-        for theme, keywords in themes.items():
-            if any(keyword in feedback_lower for keyword in keywords):
-                if theme not in custom_feedback_data["common_themes"]:
-                    custom_feedback_data["common_themes"][theme] = 0
-                custom_feedback_data["common_themes"][theme] += 1
+        for theme in matched:
+            if theme not in custom_feedback_data["common_themes"]:
+                custom_feedback_data["common_themes"][theme] = 0
+            custom_feedback_data["common_themes"][theme] += 1
+        
+        return matched
     
-    def generate_prompt_improvements(self, custom_feedback_data: Dict, glyph_info: Dict, feedback: str):
-        """Generate prompt improvements based on custom feedback."""
+    def generate_prompt_improvements(self, custom_feedback_data: Dict, glyph_info: Dict, feedback: str) -> Dict:
+        """Generate prompt improvements based on custom feedback; returns the new entry."""
         
         style = glyph_info.get('style', 'celtic_enhanced')
         model = "celtic" if style.startswith('celtic') else "meru"
@@ -403,55 +372,20 @@ class GlyphCurationBackend:
             custom_feedback_data["prompt_improvements"][model] = []
         
         custom_feedback_data["prompt_improvements"][model].append(improvement_entry)
+        return improvement_entry
     
     def suggest_prompt_improvements(self, feedback: str, style: str) -> List[str]:
         """Suggest specific prompt improvements based on feedback."""
-        
-        suggestions = []
-        feedback_lower = feedback.lower()
-        
-        # Detail improvements
-        if any(word in feedback_lower for word in ["detail", "intricate", "complex"]):
-            suggestions.append("Add 'highly detailed' and 'intricate patterns' to prompts")
-            suggestions.append("Emphasize 'fine line work' and 'precise ornamentation'")
-        
-        # Balance improvements
-        if any(word in feedback_lower for word in ["balance", "symmetry", "proportion"]):
-            suggestions.append("Add 'perfect symmetry' and 'balanced composition' to prompts")
-            suggestions.append("Emphasize 'harmonious proportions' and 'centered design'")
-        
-        # Movement improvements
-        if any(word in feedback_lower for word in ["dynamic", "flow", "movement"]):
-            suggestions.append("Add 'dynamic movement' and 'flowing lines' to prompts")
-            suggestions.append("Emphasize 'rhythmic patterns' and 'energetic composition'")
-        
-        # Style improvements
-        if any(word in feedback_lower for word in ["celtic", "knotwork", "spiral"]):
-            suggestions.append("Strengthen Celtic knotwork and spiral motifs in prompts")
-            suggestions.append("Add 'traditional Celtic patterns' and 'ancient knotwork'")
-        
-        # Contrast improvements
-        if any(word in feedback_lower for word in ["contrast", "bold", "strong"]):
-            suggestions.append("Emphasize 'strong contrast' and 'bold lines' in prompts")
-            suggestions.append("Add 'high contrast' and 'sharp definition'")
-        
-        # Composition improvements
-        if any(word in feedback_lower for word in ["composition", "layout", "design"]):
-            suggestions.append("Focus on 'strong composition' and 'balanced layout'")
-            suggestions.append("Emphasize 'well-structured design' and 'harmonious arrangement'")
-        
-        return suggestions
+        return suggest_improvements(feedback)
     
     def get_custom_feedback_insights(self) -> Dict:
         """Get insights from custom feedback data."""
         
-        custom_feedback_file = self.reinforcement_data_path / "custom_feedback.json"
-        if not custom_feedback_file.exists():
+        self.feedback.refresh()
+        custom_feedback_data = self.feedback.snapshot()
+        if not custom_feedback_data["feedback_entries"]:
             return {"message": "No custom feedback data available"}
         
-        with open(custom_feedback_file, 'r') as f:
-            custom_feedback_data = json.load(f)
-        
         insights = {
             "total_feedback_entries": len(custom_feedback_data["feedback_entries"]),
             "common_themes": custom_feedback_data["common_themes"],
@@ -464,32 +398,81 @@ class GlyphCurationBackend:
     def export_curation_data(self) -> Dict:
         """Export complete curation data for analysis."""
         
+        insights = self.get_reinforcement_insights()
+        
+        # Copy under the lock so serialisation never races the group commit writer
+        with self.lock:
+            curation_history = list(self.curation_history)
+            reinforcement_data = {model: {category: dict(counters) for category, counters in data.items()}
+                                  for model, data in self.reinforcement_data.items()}
+        
         return {
-            "curation_history": self.curation_history,
-            "reinforcement_data": self.reinforcement_data,
-            "insights": self.get_reinforcement_insights(),
+            "curation_history": curation_history,
+            "reinforcement_data": reinforcement_data,
+            "insights": insights,
             "custom_feedback_insights": self.get_custom_feedback_insights(),
             "export_timestamp": datetime.now().isoformat(),
-            "total_curated": len(self.curation_history),
+            "total_curated": len(curation_history),
             "models_used": {
-                "celtic": len([r for r in self.curation_history if r["model_used"] == "celtic"]),
-                "meru": len([r for r in self.curation_history if r["model_used"] == "meru"])
+                "celtic": len([r for r in curation_history if r["model_used"] == "celtic"]),
+                "meru": len([r for r in curation_history if r["model_used"] == "meru"])
             }
         }
     
-    def get_curation_progress(self) -> Dict:
-        """Get current curation progress."""
-        
-        total_curated = len(self.curation_history)
-        total_target = 108  # Target number of glyphs
+    def compare_windows(self, days: int = 7, model: Optional[str] = None, style: Optional[str] = None) -> Dict:
+        """Compare the last `days` days of curation with the `days` before them."""
+        self.refresh()
+        with self.lock:
+            return self.analytics.compare(days, model, style)
+    
+    def get_trend(self, periods: int = 30, granularity: str = "day",
+                  model: Optional[str] = None, style: Optional[str] = None) -> List[Dict]:
+        """Get a per-hour or per-day series of curation metrics."""
+        self.refresh()
+        with self.lock:
+            return self.analytics.trend(periods, granularity, model, style)
+    
+    def history_page(self, cursor: int = 0, limit: int = 1000, since: Optional[str] = None) -> Dict:
+        """Get up to limit selections with seq >= cursor (and timestamp >= since) for incremental export."""
+        
+        self.refresh()
+        with self.lock:
+            # seq is the record's index in history, so the cursor is a direct offset; timestamps
+            # are stamped at commit under the storage lock, so since is one too
+            position = max(cursor, 0)
+            if since is not None:
+                position = max(position, bisect_left(self.curation_history, since, key=lambda record: record["timestamp"]))
+            records = self.curation_history[position:position + limit]
+            position += len(records)
+            total = len(self.curation_history)
         
         return {
-            "total_curated": total_curated,
-            "total_target": total_target,
-            "completion_percentage": round((total_curated / total_target) * 100, 1),
-            "remaining": total_target - total_curated,
-            "last_curated": self.curation_history[-1] if self.curation_history else None
+            "records": records,
+            "next_cursor": position,
+            "has_more": position < total
         }
+    
+    def get_curation_progress(self) -> Dict:
+        """Get current curation progress."""
+        
+        # Distinct target glyphs with a real selection (regenerations and repeats excluded)
+        self.refresh()
+        with self.lock:
+            return self.glyph_status.progress()
+    
+    def get_glyph_status(self, name: Optional[str] = None) -> Optional[Any]:
+        """Get one glyph's curation status, or every target glyph's when name is None."""
+        self.refresh()
+        with self.lock:
+            if name is None:
+                return self.glyph_status.summary()
+            return self.glyph_status.get(name)
+    
+    def next_uncurated_glyph(self) -> Optional[Dict]:
+        """Get the next glyph in list order that has not been curated."""
+        self.refresh()
+        with self.lock:
+            return self.glyph_status.next_uncurated()
 
 def main():
     """Test the curation backend."""
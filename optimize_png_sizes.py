@@ -8,9 +8,19 @@ from pathlib import Path
 from PIL import Image
 import numpy as np
 
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent))
+
+from src.processors.blobs import save_image, write_file
+from src.processors.png import PNGEncoder, trim
+from convert_to_transparent import record_trim_metadata
+
 def optimize_png_size(input_path: Path, output_path: Path = None, 
-                     max_size: tuple = (256, 256), quality: int = 85):
-    """Optimize PNG size while maintaining transparency."""
+                     max_size: tuple = (256, 256), quality: int = 85, encoding: str = 'rgba'):
+    """Optimize PNG size while maintaining transparency.
+
+    encoding is 'rgba' (default), 'palette' or 'smallest'.
+    """
     try:
         # Load the image
         img = Image.open(input_path)
@@ -28,7 +38,13 @@ def optimize_png_size(input_path: Path, output_path: Path = None,
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_optimized{input_path.suffix}"
         
-        img.save(output_path, 'PNG', optimize=True, compress_level=9)
+        if encoding == 'rgba':
+            save_image(img, output_path, 'PNG', optimize=True, compress_level=9)
+        else:
+            result = PNGEncoder(webp_quality=quality).save(img, output_path, encoding)
+            if result is None:
+                return None
+            output_path = result['path']
         
         # Get file sizes
         original_size = input_path.stat().st_size
@@ -61,7 +77,7 @@ def create_webp_version(input_path: Path, output_path: Path = None, quality: int
             output_path = input_path.parent / f"{input_path.stem}.webp"
         
         # Save as WebP with transparency
-        img.save(output_path, 'WEBP', quality=quality, method=6)
+        save_image(img, output_path, 'WEBP', quality=quality, method=6)
         
         # Get file sizes
         original_size = input_path.stat().st_size
@@ -79,14 +95,24 @@ def create_webp_version(input_path: Path, output_path: Path = None, quality: int
         print(f"❌ Error creating WebP {input_path.name}: {e}")
         return None
 
-def create_multiple_sizes(input_path: Path, sizes: list = [(256, 256), (128, 128), (64, 64)]):
-    """Create multiple sizes for different zoom levels."""
+def create_multiple_sizes(input_path: Path, sizes: list = [(256, 256), (128, 128), (64, 64)],
+                          encoding: str = 'rgba', trim_padding: int = None):
+    """Create multiple sizes for different zoom levels.
+
+    With trim_padding set, empty borders are cropped once before resizing
+    and each size's placement is recorded in the glyph metadata.
+    """
     try:
         img = Image.open(input_path)
+        encoder = PNGEncoder()
         
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
         
+        placement = None
+        if trim_padding is not None:
+            img, placement = trim(img, trim_padding)
+        
         results = {}
         
         for size in sizes:
@@ -96,7 +122,17 @@ def create_multiple_sizes(input_path: Path, sizes: list = [(256, 256), (128, 128
             
             # Save optimized version
             output_path = input_path.parent / f"{input_path.stem}_{size[0]}x{size[1]}.png"
-            resized.save(output_path, 'PNG', optimize=True, compress_level=9)
+            if encoding == 'rgba':
+                save_image(resized, output_path, 'PNG', optimize=True, compress_level=9)
+            else:
+                result = encoder.save(resized, output_path, encoding)
+                if result is None:
+                    continue
+                output_path = result['path']
+            
+            if placement is not None:
+                record_trim_metadata(input_path.stem, output_path, placement, trimmed_from=input_path,
+                                     rendition_size=resized.size)
             
             file_size = output_path.stat().st_size
             results[f"{size[0]}x{size[1]}"] = {
@@ -113,7 +149,7 @@ def create_multiple_sizes(input_path: Path, sizes: list = [(256, 256), (128, 128
         print(f"❌ Error creating multiple sizes: {e}")
         return None
 
-def batch_optimize():
+def batch_optimize(trim_padding: int = None):
     """Optimize all PNG files in the archetypal directory."""
     png_dir = Path("assets/glyphs/archetypal/png")
     
@@ -144,7 +180,7 @@ def batch_optimize():
         # Create optimized versions
         optimized_png = optimize_png_size(png_file, max_size=(256, 256))
         webp_version = create_webp_version(png_file, quality=85)
-        multiple_sizes = create_multiple_sizes(png_file)
+        multiple_sizes = create_multiple_sizes(png_file, trim_padding=trim_padding)
         
         if optimized_png:
             total_optimized_size += optimized_png.stat().st_size
@@ -165,6 +201,74 @@ def batch_optimize():
     print(f"• Use WebP for modern browsers (smallest size)")
     print(f"• Implement lazy loading for symbols outside viewport")
 
+def palette_optimize_codex(root: Path = Path("assets/glyphs"), write: bool = False):
+    """Re-encode every PNG in the codex with the smallest encoding and report savings.
+
+    PNG winners (palette or RGBA) replace the file in place. When WebP wins, the
+    WebP is written alongside and the PNG keeps its best PNG encoding as the
+    fallback format.
+    """
+    png_files = sorted(root.rglob("*.png"))
+    
+    if not png_files:
+        print(f"❌ No PNG files found under {root}")
+        return None
+    
+    print(f"🎨 Evaluating palette encoding for {len(png_files)} PNG files...")
+    
+    encoder = PNGEncoder()
+    totals = {'original': 0, 'best': 0, 'best_png': 0}
+    winners = {encoding: 0 for encoding in ('palette', 'rgba', 'webp')}
+    
+    for png_file in png_files:
+        try:
+            original_size = png_file.stat().st_size
+            img = Image.open(png_file)
+            img.load()
+            
+            best, data, candidates = encoder.encode_smallest(img)
+            best_png = min(('palette', 'rgba'), key=lambda encoding: candidates[encoding])
+            
+            # Never grow a file that is already smaller than every candidate
+            best_size = min(candidates[best], original_size)
+            best_png_size = min(candidates[best_png], original_size)
+            
+            totals['original'] += original_size
+            totals['best'] += best_size
+            totals['best_png'] += best_png_size
+            winners[best] += 1
+            
+            print(f"   {png_file.relative_to(root)}: {original_size/1024:.1f}KB → "
+                  f"{best} {candidates[best]/1024:.1f}KB "
+                  f"(palette {candidates['palette']/1024:.1f}KB, rgba {candidates['rgba']/1024:.1f}KB, "
+                  f"webp {candidates['webp']/1024:.1f}KB)")
+            
+            if write:
+                if candidates[best_png] < original_size:
+                    png_data = data if best == best_png else encoder.encode(img, best_png)
+                    write_file(png_file, png_data)
+                if best == 'webp' and candidates['webp'] < original_size:
+                    write_file(png_file.with_suffix('.webp'), data)
+        
+        except Exception as e:
+            print(f"❌ Error evaluating {png_file.name}: {e}")
+    
+    saved = totals['original'] - totals['best']
+    saved_png = totals['original'] - totals['best_png']
+    
+    print(f"\n{'='*50}")
+    print(f"📊 PALETTE ENCODING SUMMARY")
+    print(f"{'='*50}")
+    print(f"Files: {len(png_files)} (palette {winners['palette']}, rgba {winners['rgba']}, webp {winners['webp']})")
+    print(f"Total original size: {totals['original']/1024/1024:.2f}MB")
+    print(f"Total smallest size: {totals['best']/1024/1024:.2f}MB")
+    print(f"Bytes saved: {saved} ({saved/max(totals['original'], 1)*100:.1f}%)")
+    print(f"Bytes saved (PNG only): {saved_png} ({saved_png/max(totals['original'], 1)*100:.1f}%)")
+    if not write:
+        print(f"ℹ️ Dry run - pass --write to re-encode files")
+    
+    return {**totals, 'saved': saved, 'saved_png': saved_png, 'winners': winners}
+
 def test_optimization():
     """Test optimization on a single file."""
     test_file = Path("assets/glyphs/archetypal/png/celtic_png_test_house_transparent.png")
@@ -193,5 +297,8 @@ def test_optimization():
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         test_optimization()
+    elif len(sys.argv) > 1 and sys.argv[1] == "palette":
+        palette_optimize_codex(write="--write" in sys.argv)
     else:
-        batch_optimize() 
\ No newline at end of file
+        trim_padding = int(sys.argv[sys.argv.index("--trim-padding") + 1]) if "--trim-padding" in sys.argv else None
+        batch_optimize(trim_padding=trim_padding) 
\ No newline at end of file
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Blob Store Script
+Deduplicates generated assets into a content-addressed store and garbage-collects unreferenced blobs.
+
+Usage:
+    python scripts/blob_store.py stats
+    python scripts/blob_store.py dedupe [--write]
+    python scripts/blob_store.py gc [--write]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.blobs import BlobStore
+
+def main():
+    """Run a blob store command."""
+    parser = argparse.ArgumentParser(description="Content-addressed asset store")
+    parser.add_argument("command", choices=["stats", "dedupe", "gc"], help="Command to run")
+    parser.add_argument("--root", type=Path, default=Path("assets"), help="Asset tree")
+    parser.add_argument("--write", action="store_true", help="Apply changes (default is a dry run)")
+    args = parser.parse_args()
+    
+    print("\n🧬 ASSET BLOB STORE")
+    print("=" * 50)
+    
+    store = BlobStore(args.root)
+    if args.command == "stats":
+        store.stats()
+    elif args.command == "dedupe":
+        store.dedupe(write=args.write)
+    else:
+        store.gc(write=args.write)
+
+if __name__ == "__main__":
+    main()
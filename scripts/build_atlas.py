@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Atlas Build Script
+Packs glyph renditions into sprite sheets for far-zoom dreamscape rendering.
+
+Usage:
+    python scripts/build_atlas.py [style ...] [--tier 64] [--force]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.atlas import AtlasBuilder, list_tiers
+
+def main():
+    """Build atlases for the requested styles and tiers."""
+    parser = argparse.ArgumentParser(description="Build glyph sprite sheet atlases")
+    parser.add_argument("styles", nargs="*", default=["celtic", "meru"], help="Glyph styles to pack")
+    parser.add_argument("--tier", type=int, action="append", help="Size tier to pack (default: all tiers)")
+    parser.add_argument("--sheet-size", type=int, default=2048, help="Maximum sheet width in pixels")
+    parser.add_argument("--force", action="store_true", help="Repack from scratch")
+    args = parser.parse_args()
+    
+    print("\n🗺️ GLYPH ATLAS BUILDER")
+    print("=" * 50)
+    
+    for style in args.styles:
+        tiers = args.tier or list_tiers(style)
+        if not tiers:
+            print(f"⚠️ No size tiers found for {style}")
+            continue
+        
+        for tier in tiers:
+            builder = AtlasBuilder(style, tier, sheet_size=args.sheet_size)
+            builder.build(force=args.force)
+
+if __name__ == "__main__":
+    main()
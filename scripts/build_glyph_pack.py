@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Glyph Pack Build Script
+Packs every rendition and metadata file under assets/ into one mmap-able file for single-file deploys.
+
+Usage:
+    python scripts/build_glyph_pack.py [--pack assets/glyphs.pack] [--compact] [--list]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.pack import GlyphPack
+
+def main():
+    """Build or update the glyph pack."""
+    parser = argparse.ArgumentParser(description="Build a single-file glyph pack")
+    parser.add_argument("--pack", type=Path, default=Path("assets/glyphs.pack"), help="Pack file")
+    parser.add_argument("--root", type=Path, default=Path("assets"), help="Asset tree to pack")
+    parser.add_argument("--compact", action="store_true", help="Reclaim space from replaced files")
+    parser.add_argument("--list", action="store_true", help="List packed files")
+    args = parser.parse_args()
+    
+    print("\n📦 GLYPH PACK")
+    print("=" * 50)
+    
+    pack = GlyphPack(args.pack, args.root)
+    pack.update()
+    
+    if args.compact:
+        pack.compact()
+    
+    if args.list:
+        for key in pack.keys():
+            entry = pack.entry(key)
+            print(f"   {key}: {entry['length']/1024:.1f}KB ({entry['format']}, tier {entry['tier']})")
+    
+    print(f"📁 Pack: {args.pack} ({args.pack.stat().st_size/1024/1024:.1f}MB, "
+          f"{pack.index['garbage']/1024:.1f}KB reclaimable)")
+    pack.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Lean Zip Build Script
+Incrementally packs the servable assets into one zip that serve_celtic_dreamscape.py --zip serves without extraction.
+
+Usage:
+    python scripts/build_lean_zip.py [--output mythra_glyphnet_lean.zip]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.archive import LEAN_MEMBERS, update_zip
+
+def main():
+    """Build or update the lean zip."""
+    parser = argparse.ArgumentParser(description="Build the lean asset zip")
+    parser.add_argument("--output", type=Path, default=Path("mythra_glyphnet_lean.zip"), help="Zip file")
+    parser.add_argument("members", nargs="*", default=list(LEAN_MEMBERS), help="Files and folders to pack")
+    args = parser.parse_args()
+    
+    print("\n🗜️ LEAN ZIP")
+    print("=" * 50)
+    
+    stats = update_zip(args.output, Path("."), tuple(args.members))
+    if stats is None:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
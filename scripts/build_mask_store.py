@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Mask Store Build Script
+Incrementally rebuilds the memory-mapped glyph coverage-mask store from assets/glyphs.
+
+Usage:
+    python scripts/build_mask_store.py [--compact]
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.masks import MaskStore
+
+def main():
+    """Build the mask store."""
+    print("\n🎭 GLYPH MASK STORE")
+    print("=" * 50)
+    
+    store = MaskStore()
+    store.build()
+    
+    if "--compact" in sys.argv:
+        store.compact()
+    
+    data_size = store.data_file.stat().st_size if store.data_file.exists() else 0
+    print(f"📁 Data: {store.data_file} ({data_size/1024/1024:.1f}MB)")
+    print(f"📋 Index: {store.index_file}")
+    print(f"📏 Tiers: {', '.join(f'{t}x{t}' for t in store.tiers)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+SDF Build Script
+Builds one signed distance field texture per glyph and benchmarks it against the per-tier PNG ladder.
+
+Usage:
+    python scripts/build_sdf.py [style ...] [--size 512] [--spread 8] [--benchmark]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.sdf import DEFAULT_SIZE, DEFAULT_SPREAD, MIN_FIDELITY, benchmark_ladder, build_sdf_codex
+
+def main():
+    """Build SDF textures or benchmark them against the PNG ladder."""
+    parser = argparse.ArgumentParser(description="Build signed distance field glyph textures")
+    parser.add_argument("styles", nargs="*", help="Glyph styles (default: all)")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Texture edge in pixels")
+    parser.add_argument("--spread", type=float, default=DEFAULT_SPREAD, help="Distance range in texture pixels")
+    parser.add_argument("--benchmark", action="store_true", help="Compare bytes and fidelity against the ladder")
+    args = parser.parse_args()
+    if args.spread <= 0 or args.size <= 2 * args.spread:
+        parser.error("--size must be larger than twice --spread, and --spread positive")
+    
+    print("\n📐 SDF GLYPH TEXTURES")
+    print("=" * 50)
+    
+    if not args.benchmark:
+        build_sdf_codex(styles=args.styles or None, size=args.size, spread=args.spread)
+        return
+    
+    totals = benchmark_ladder(styles=args.styles or None, size=args.size, spread=args.spread)
+    if not totals['glyphs']:
+        print("⚠️ No glyphs with a complete 64-512 ladder found")
+        return
+    
+    print(f"\n{'='*50}")
+    print(f"📊 SDF vs LADDER")
+    print(f"{'='*50}")
+    print(f"Glyphs: {totals['glyphs']}")
+    print(f"Ladder: {totals['ladder_bytes']/1024:.1f}KB")
+    print(f"SDF {args.size}x{args.size}: {totals['sdf_bytes']/1024:.1f}KB "
+          f"({(1 - totals['sdf_bytes']/totals['ladder_bytes'])*100:.1f}% smaller)")
+    for tier, iou in totals['iou'].items():
+        marker = "✅" if totals['passed'][tier] else "⚠️"
+        print(f"{marker} Outline IoU at {tier}x{tier}: {iou:.3f} "
+              f"(exact coverage {totals['exact_iou'][tier]:.3f}, pass at {MIN_FIDELITY:.0%} of it)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+SVG Sprite Build Script
+Packs every glyph SVG into one <symbol> sprite so the constellation loads the codex in a single request.
+
+Usage:
+    python scripts/build_svg_sprite.py [--source DIR] [--output DIR] [--precision 1] [--force]
+
+Use a glyph with CSS color:
+    <svg style="color: #FFD700"><use href="glyphs.svg#glyph-sun"/></svg>
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.svg_sprite import SVGSpriteBuilder
+
+def main():
+    """Build or update the glyph sprite."""
+    parser = argparse.ArgumentParser(description="Build a currentColor SVG symbol sprite")
+    parser.add_argument("--source", type=Path, default=Path("assets/glyphs/archetypal/svg"), help="Glyph SVG directory")
+    parser.add_argument("--output", type=Path, default=Path("assets/glyphs/archetypal/sprite"), help="Sprite output directory")
+    parser.add_argument("--precision", type=int, default=1, help="Path coordinate decimals (-1 keeps path data as-is)")
+    parser.add_argument("--force", action="store_true", help="Rebuild from scratch")
+    args = parser.parse_args()
+    
+    print("\n🧩 SVG SPRITE BUILDER")
+    print("=" * 50)
+    
+    precision = None if args.precision < 0 else args.precision
+    builder = SVGSpriteBuilder(args.source, args.output, precision=precision)
+    builder.build(force=args.force)
+
+if __name__ == "__main__":
+    main()
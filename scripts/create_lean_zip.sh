@@ -1 +1,9 @@
- 
\ No newline at end of file
+#!/bin/bash
+# Build or incrementally update the lean asset zip.
+# PNG/WebP members are stored uncompressed so the server can send them as-is:
+#   python serve_celtic_dreamscape.py --zip mythra_glyphnet_lean.zip
+
+set -e
+
+cd "$(dirname "$0")/.."
+python3 scripts/build_lean_zip.py "$@"
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Curation Storage Migration Script
+One-shot import of the JSON curation history, reinforcement data and custom feedback into SQLite.
+
+Usage:
+    python scripts/migrate_curation_storage.py [--db data/curation/curation.db]
+
+Run from the project root, then start the backend with CURATION_STORAGE=sqlite.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.curation.storage import JSONStorage, SQLiteStorage
+
+def main():
+    """Copy JSON curation data into a SQLite database and verify it."""
+    parser = argparse.ArgumentParser(description="Migrate curation data from JSON to SQLite")
+    parser.add_argument("--curation-dir", type=Path, default=Path("data/curation"), help="JSON curation folder")
+    parser.add_argument("--reinforcement-dir", type=Path, default=Path("data/reinforcement"),
+                        help="JSON reinforcement folder")
+    parser.add_argument("--db", type=Path, default=Path("data/curation/curation.db"), help="SQLite database")
+    args = parser.parse_args()
+
+    print("\n🗄️ CURATION STORAGE MIGRATION")
+    print("=" * 50)
+
+    source = JSONStorage(args.curation_dir, args.reinforcement_dir)
+    history = source.load_history()
+    reinforcement = source.load_reinforcement()
+    custom_feedback = source.load_custom_feedback()
+
+    target = SQLiteStorage(args.db)
+    try:
+        target.import_data(history, reinforcement, custom_feedback)
+
+        # Read everything back before declaring success
+        migrated = target.load_custom_feedback()
+        checks = {
+            "selections": len(target.load_history()) == len(history),
+            "reinforcement": target.load_reinforcement() == reinforcement,
+            "feedback entries": len(migrated["feedback_entries"]) == len(custom_feedback["feedback_entries"]),
+            "feedback themes": migrated["common_themes"] == custom_feedback["common_themes"]
+        }
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        target.close()
+        source.close()
+
+    print(f"📊 Selections: {len(history)}")
+    print(f"📊 Reinforcement counters: {sum(len(c) for m in reinforcement.values() for c in m.values())}")
+    print(f"📊 Feedback entries: {len(custom_feedback['feedback_entries'])}")
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+
+    if not all(checks.values()):
+        sys.exit(1)
+    print(f"✅ Migrated to {args.db} - set CURATION_STORAGE=sqlite to use it")
+
+if __name__ == "__main__":
+    main()
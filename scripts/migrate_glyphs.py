@@ -5,13 +5,13 @@ Migrates existing glyphs to the new project structure.
 """
 
 import json
-import shutil
 import sys
 from pathlib import Path
 
 # Add src to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from src.processors.blobs import copy_file
 from src.processors.svg import SVGProcessor
 
 def migrate_glyphs():
@@ -76,6 +76,17 @@ def migrate_glyphs():
     glyphs = [f.stem for f in old_webp.glob("*.webp")]
     stats['total'] = len(glyphs)
     
+    # Repair every missing SVG in one vectorized binarization batch
+    repair_jobs = [
+        (old_webp / f"{name}.webp", new_svg / f"{name.replace(' ', '_').lower()}.svg")
+        for name in glyphs
+        if not (old_svg / f"{name}.svg").exists()
+    ]
+    repaired = {}
+    if repair_jobs:
+        print(f"\n🔧 Repairing {len(repair_jobs)} missing SVGs in batch...")
+        repaired = svg_processor.convert_batch(repair_jobs)
+    
     for glyph_name in glyphs:
         try:
             print(f"\n📦 Migrating {glyph_name}...")
@@ -115,7 +126,7 @@ def migrate_glyphs():
             # Copy files
             if old_webp_file.exists():
                 print(f"\n📝 Copying WebP file...")
-                shutil.copy2(old_webp_file, new_webp_file)
+                copy_file(old_webp_file, new_webp_file)
             else:
                 print(f"⚠️ Missing WebP for {glyph_name}")
                 stats['skipped'] += 1
@@ -123,10 +134,10 @@ def migrate_glyphs():
             
             if old_svg_file.exists():
                 print(f"📝 Copying SVG file...")
-                shutil.copy2(old_svg_file, new_svg_file)
+                copy_file(old_svg_file, new_svg_file)
             else:
-                print(f"⚠️ Missing SVG for {glyph_name}, attempting repair...")
-                if not svg_processor.convert_to_svg(new_webp_file, new_svg_file):
+                print(f"⚠️ Missing SVG for {glyph_name}, using batch repair...")
+                if not repaired.get(str(new_svg_file)):
                     print(f"❌ Could not repair SVG for {glyph_name}")
                     stats['failed'] += 1
                     continue
@@ -135,7 +146,7 @@ def migrate_glyphs():
             emotion_hex = glyph_metadata.get('emotion_hex', '#000000') if glyph_metadata else '#000000'
             if old_colored_file.exists():
                 print(f"📝 Copying colored SVG file...")
-                shutil.copy2(old_colored_file, new_colored_file)
+                copy_file(old_colored_file, new_colored_file)
             else:
                 print(f"⚠️ Missing colored SVG for {glyph_name}, generating...")
                 if not svg_processor.apply_color(new_svg_file, new_colored_file, emotion_hex):
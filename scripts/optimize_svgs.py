@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+SVG Optimization Script
+Minifies glyph SVGs and reports byte savings and max geometric deviation per file.
+
+Usage:
+    python scripts/optimize_svgs.py [directory ...] [--precision 1] [--write]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.processors.svg_optimizer import optimize_directory
+
+DEFAULT_DIRECTORIES = ["assets/glyphs/archetypal/svg", "assets/glyphs/archetypal/colored"]
+
+def main():
+    """Optimize SVG directories."""
+    parser = argparse.ArgumentParser(description="Optimize glyph SVGs")
+    parser.add_argument("directories", nargs="*", default=DEFAULT_DIRECTORIES, help="Directories of SVG files")
+    parser.add_argument("--precision", type=int, default=1, help="Decimal places kept in path coordinates")
+    parser.add_argument("--write", action="store_true", help="Overwrite files (default is a dry run)")
+    args = parser.parse_args()
+    
+    print("\n✂️ SVG OPTIMIZER")
+    print("=" * 50)
+    
+    for directory in args.directories:
+        print(f"\n📁 {directory}")
+        totals = optimize_directory(directory, precision=args.precision, write=args.write)
+        
+        if totals['files']:
+            saved_pct = totals['saved'] / totals['original_bytes'] * 100
+            print(f"📊 {totals['files']} files: {totals['original_bytes']/1024:.1f}KB → "
+                  f"{totals['optimized_bytes']/1024:.1f}KB ({saved_pct:.1f}% saved), "
+                  f"max deviation {totals['max_deviation']:.3g}")
+    
+    if not args.write:
+        print("\nℹ️ Dry run - pass --write to overwrite files")
+
+if __name__ == "__main__":
+    main()
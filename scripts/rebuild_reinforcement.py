@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Reinforcement Rebuild Script
+Replays the raw curation history into fresh reinforcement counters and reports how they differ
+from the stored ones.
+
+Usage:
+    python scripts/rebuild_reinforcement.py [--write]
+
+Run from the project root; restart the API after --write so it reloads the counters.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.curation.replay import diff_reinforcement, rebuild_reinforcement
+from src.curation.storage import open_storage
+
+def main():
+    """Rebuild reinforcement counters from history and diff them against storage."""
+    parser = argparse.ArgumentParser(description="Rebuild reinforcement data from curation history")
+    parser.add_argument("--storage", choices=["json", "sqlite"], help="Storage backend (default: CURATION_STORAGE)")
+    parser.add_argument("--show", type=int, default=50, help="Differences to list")
+    parser.add_argument("--write", action="store_true", help="Store the rebuilt counters (default is a dry run)")
+    args = parser.parse_args()
+
+    print("\n🔁 REINFORCEMENT REBUILD")
+    print("=" * 50)
+
+    storage = open_storage(args.storage)
+    try:
+        with storage.lock():
+            start = time.time()
+            history = storage.load_history()
+            stored = storage.load_reinforcement()
+            loaded = time.time()
+            rebuilt = rebuild_reinforcement(history)
+            differences = diff_reinforcement(stored, rebuilt)
+            done = time.time()
+
+            print(f"📊 {len(history)} selections loaded in {loaded - start:.2f}s, replayed in {done - loaded:.2f}s")
+            for model, category, key, old, new in differences[:args.show]:
+                print(f"   ⚠️ {model}.{category}[{key}]: {old} -> {new}")
+            if len(differences) > args.show:
+                print(f"   ... and {len(differences) - args.show} more")
+
+            if not differences:
+                print("✅ Stored reinforcement data matches history")
+                return
+
+            print(f"⚠️ {len(differences)} counters differ from history")
+            if args.write:
+                storage.replace_reinforcement(rebuilt)
+                print("✅ Reinforcement data rebuilt from history")
+            else:
+                print("ℹ️ Dry run - pass --write to store the rebuilt counters")
+    finally:
+        storage.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Feedback Re-classification Script
+Re-runs theme matching and prompt suggestions over every stored custom feedback entry,
+for use after the theme tables change.
+
+Usage:
+    python scripts/reclassify_feedback.py [--write]
+
+Run from the project root; restart the API afterwards so it reloads the theme counts.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.curation.storage import open_storage
+from src.curation.themes import reclassify
+
+def main():
+    """Re-classify the custom feedback corpus and report theme count changes."""
+    parser = argparse.ArgumentParser(description="Re-classify custom feedback themes")
+    parser.add_argument("--storage", choices=["json", "sqlite"], help="Storage backend (default: CURATION_STORAGE)")
+    parser.add_argument("--write", action="store_true", help="Store the result (default is a dry run)")
+    args = parser.parse_args()
+
+    print("\n🏷️ FEEDBACK RE-CLASSIFICATION")
+    print("=" * 50)
+
+    storage = open_storage(args.storage)
+    try:
+        with storage.lock():
+            data = storage.load_custom_feedback()
+            start = time.time()
+            report = reclassify(data)
+            elapsed = time.time() - start
+
+            print(f"📊 {len(data['feedback_entries'])} entries re-classified in {elapsed:.2f}s")
+            for theme in sorted(set(report["before"]) | set(report["after"])):
+                before = report["before"].get(theme, 0)
+                after = report["after"].get(theme, 0)
+                marker = "  " if before == after else "⚠️"
+                print(f"   {marker} {theme}: {before} -> {after}")
+
+            if args.write:
+                storage.replace_custom_feedback(data)
+                print("✅ Custom feedback updated")
+            else:
+                print("ℹ️ Dry run - pass --write to store the new classification")
+    finally:
+        storage.close()
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,168 @@ Simple HTTP server to serve the Celtic Dreamscape page
 import http.server
 import socketserver
 import os
+import re
+import sys
 from pathlib import Path
+from urllib.parse import urlsplit, parse_qs, unquote
+
+# Add src to Python path
+sys.path.append(str(Path(__file__).parent))
+
+from src.processors.archive import ZipAssetArchive
+from src.processors.masks import MaskStore
+from src.processors.pack import GlyphPack
+from src.processors.tint import TintCache
+
+# Tinted renditions are cached for as long as dreamscape_config.json caches glyphs
+CACHE_DURATION = 3600
+MAX_TINT_SIZE = 1024
+HEX_COLOR = re.compile(r'#?[0-9A-Fa-f]{6}')
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    tint_cache = None
+    pack = None
+    archive = None
+    
+    def do_GET(self):
+        """Serve files, tinting glyph images on request (?color=FF6600&size=128)."""
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        
+        if ('color' in query or 'size' in query) and parts.path.lower().endswith(('.png', '.webp')):
+            self.send_tinted(parts.path, query)
+        elif self.pack is not None and unquote(parts.path).startswith('/assets/') and \
+                unquote(parts.path)[len('/assets/'):] in self.pack:
+            self.send_packed(unquote(parts.path)[len('/assets/'):])
+        elif self.archive is not None and self.archive_member(parts.path):
+            self.send_archived(self.archive_member(parts.path))
+        else:
+            super().do_GET()
+    
+    def send_packed(self, key: str):
+        """Send a file straight from the memory-mapped glyph pack."""
+        entry = self.pack.entry(key)
+        etag = f'"{entry["sha1"]}"'
+        
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(key))
+        self.send_header('Content-Length', str(entry["length"]))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', f'public, max-age={CACHE_DURATION}')
+        self.end_headers()
+        
+        data = self.pack.get(key)
+        try:
+            self.wfile.write(data)
+        finally:
+            data.release()
+    
+    def send_tinted(self, url_path: str, query: dict):
+        """Send a glyph tinted and/or resized from the rendered-variant cache."""
+        color = query.get('color', [None])[0]
+        size = query.get('size', [None])[0]
+        
+        if color is not None and not HEX_COLOR.fullmatch(color):
+            self.send_error(400, "color must be a 6-digit hex value")
+            return
+        if size is not None and (not (size.isascii() and size.isdigit()) or not 0 < int(size) <= MAX_TINT_SIZE):
+            self.send_error(400, f"size must be between 1 and {MAX_TINT_SIZE}")
+            return
+        
+        source = self.tint_source(url_path)
+        if source is None:
+            self.send_error(404, "File not found")
+            return
+        path, version, read = source
+        
+        color = f"#{color.lstrip('#').upper()}" if color else None
+        size = int(size) if size else None
+        
+        try:
+            etag = self.tint_cache.etag(path, color, size, version)
+            if etag in self.headers.get('If-None-Match', ''):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            
+            data, etag = self.tint_cache.render(path, color, size, version, read)
+        except Exception as e:
+            self.send_error(500, f"Could not render glyph: {e}")
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', f'public, max-age={CACHE_DURATION}')
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def tint_source(self, url_path: str):
+        """Find the glyph to tint as (path, version, reader), looking in the pack, the zip, then on disk.
+
+        Sources on disk have no version or reader; the tint cache stats and
+        opens the path itself. None when the glyph is nowhere.
+        """
+        name = unquote(url_path)
+        path = Path(self.translate_path(url_path))
+        
+        key = name[len('/assets/'):] if name.startswith('/assets/') else None
+        if self.pack is not None and key in self.pack:
+            return path, self.pack.entry(key)["sha1"], lambda: self.read_released(self.pack.get(key))
+        
+        member = self.archive_member(url_path) if self.archive is not None else None
+        if member is not None:
+            return path, self.archive.etag(member), lambda: self.read_released(self.archive.read(member))
+        
+        return (path, None, None) if path.is_file() else None
+    
+    def read_released(self, data) -> bytes:
+        """Copy a pack or zip view into bytes and release the view."""
+        try:
+            return bytes(data)
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+    
+    def archive_member(self, url_path: str):
+        """Map a URL path to a zip member name, or None when the zip lacks it."""
+        name = unquote(url_path).lstrip('/')
+        for candidate in (name, f"{name.rstrip('/')}/index.html" if name else "index.html"):
+            if candidate in self.archive:
+                return candidate
+        return None
+    
+    def send_archived(self, name: str):
+        """Send a member straight out of the zip; stored members are sent without copying."""
+        etag = self.archive.etag(name)
+        
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        
+        data = self.archive.read(name)
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', self.guess_type(name))
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f'public, max-age={CACHE_DURATION}')
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+    
     def end_headers(self):
         # Add CORS headers for better compatibility
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -23,6 +182,22 @@ def main():
     # Change to the project directory
     os.chdir(Path(__file__).parent)
     
+    # Use the memory-mapped mask store when it has been built
+    mask_store = MaskStore() if Path("assets/masks/index.json").exists() else None
+    CustomHTTPRequestHandler.tint_cache = TintCache(mask_store=mask_store)
+    
+    # Serve /assets/ from a glyph pack: python serve_celtic_dreamscape.py --pack assets/glyphs.pack
+    if "--pack" in sys.argv:
+        pack_file = Path(sys.argv[sys.argv.index("--pack") + 1])
+        CustomHTTPRequestHandler.pack = GlyphPack(pack_file)
+        print(f"📦 Serving {len(CustomHTTPRequestHandler.pack.keys())} assets from {pack_file}")
+    
+    # Serve straight out of the lean zip: python serve_celtic_dreamscape.py --zip mythra_glyphnet_lean.zip
+    if "--zip" in sys.argv:
+        zip_file = Path(sys.argv[sys.argv.index("--zip") + 1])
+        CustomHTTPRequestHandler.archive = ZipAssetArchive(zip_file)
+        print(f"🗜️ Serving {len(CustomHTTPRequestHandler.archive.index)} files from {zip_file}")
+    
     # Create the server
     with socketserver.TCPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
         print(f"🌌 Celtic Dreamscape Server")
@@ -30,6 +205,7 @@ def main():
         print(f"🚀 Server running at: http://localhost:{PORT}")
         print(f"📄 Celtic Dreamscape: http://localhost:{PORT}/celtic_dreamscape_display.html")
         print(f"🎨 Glyph Curation App: http://localhost:{PORT}/glyph_curation_app.html")
+        print(f"🌈 Tinted glyphs: append ?color=FF6600&size=128 to any glyph PNG/WebP URL")
         print(f"📁 Serving files from: {os.getcwd()}")
         print(f"🛑 Press Ctrl+C to stop the server")
         print(f"=" * 50)
@@ -0,0 +1,150 @@
+"""
+Curation Analytics Module
+Hourly and daily buckets of selections, regenerations and feedback themes per model and style,
+maintained as selections are recorded so window comparisons and trends read only a few buckets.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .themes import match_themes
+
+# Bucket key length of an ISO timestamp and step per granularity
+GRANULARITIES = {
+    "hour": (13, timedelta(hours=1)),
+    "day": (10, timedelta(days=1))
+}
+
+def empty_metrics() -> Dict:
+    """Build zeroed bucket metrics."""
+    return {"records": 0, "selections": 0, "regenerations": 0, "selection_regenerations": 0, "themes": {}}
+
+def add_metrics(total: Dict, metrics: Dict):
+    """Add one bucket's metrics into a running total."""
+    total["records"] += metrics["records"]
+    total["selections"] += metrics["selections"]
+    total["regenerations"] += metrics["regenerations"]
+    total["selection_regenerations"] += metrics["selection_regenerations"]
+    for theme, count in metrics["themes"].items():
+        total["themes"][theme] = total["themes"].get(theme, 0) + count
+
+def summarize(metrics: Dict) -> Dict:
+    """Add derived rates to metrics."""
+    selections = metrics["selections"]
+    return {
+        **metrics,
+        "regeneration_rate": round(metrics["regenerations"] / selections, 3) if selections else 0,
+        "avg_regenerations_before_selection": round(metrics["selection_regenerations"] / selections, 3)
+        if selections else 0
+    }
+
+class TimeBuckets:
+    def __init__(self, hourly_retention_days: int = 30):
+        """Initialize empty buckets; hourly buckets older than the retention are dropped."""
+        self.hourly_retention_days = hourly_retention_days
+        # granularity -> bucket key -> (model, style) -> metrics
+        self.buckets = {granularity: defaultdict(dict) for granularity in GRANULARITIES}
+
+    def load(self, history: Iterable[Dict]):
+        """Build buckets from existing history."""
+        for record in history:
+            self.add(record)
+        self.prune()
+
+    def add(self, record: Dict):
+        """Count one selection record into its hour and day buckets.
+
+        Records with selected_variant 0 are regenerations (from
+        /api/regenerate); a selection's own regeneration_count is kept
+        apart so the two sources are never added together.
+        """
+        model = record["model_used"]
+        style = record["glyph_info"].get('style', 'default')
+        selected = record.get("selected_variant") != 0
+        regeneration_count = record.get("regeneration_count", 0) or 0
+        themes = match_themes(record["custom_feedback"]) if record.get("custom_feedback") else []
+
+        for granularity, (key_length, _) in GRANULARITIES.items():
+            key = record["timestamp"][:key_length]
+            new_hour = granularity == "hour" and key not in self.buckets["hour"]
+            bucket = self.buckets[granularity][key]
+            metrics = bucket.get((model, style))
+            if metrics is None:
+                metrics = bucket[(model, style)] = empty_metrics()
+            metrics["records"] += 1
+            if selected:
+                metrics["selections"] += 1
+                metrics["selection_regenerations"] += regeneration_count
+            else:
+                metrics["regenerations"] += max(regeneration_count, 1)
+            for theme in themes:
+                metrics["themes"][theme] = metrics["themes"].get(theme, 0) + 1
+            if new_hour:
+                self.prune()
+
+    def prune(self, now: Optional[datetime] = None):
+        """Drop hourly buckets past the retention window."""
+        cutoff = ((now or datetime.now()) - timedelta(days=self.hourly_retention_days)).isoformat()[:13]
+        hourly = self.buckets["hour"]
+        for key in [key for key in hourly if key < cutoff]:
+            del hourly[key]
+
+    def window(self, start: datetime, end: datetime, granularity: str = "day",
+               model: Optional[str] = None, style: Optional[str] = None) -> Dict:
+        """Sum the buckets from start up to (not including) end, optionally for one model or style."""
+        total = empty_metrics()
+        for key in self._keys(start, end, granularity):
+            for (bucket_model, bucket_style), metrics in self.buckets[granularity].get(key, {}).items():
+                if (model is None or bucket_model == model) and (style is None or bucket_style == style):
+                    add_metrics(total, metrics)
+        return summarize(total)
+
+    def compare(self, days: int = 7, model: Optional[str] = None, style: Optional[str] = None,
+                now: Optional[datetime] = None) -> Dict:
+        """Compare the last `days` days (including today) with the `days` before them."""
+        end = self._floor(now or datetime.now(), "day") + timedelta(days=1)
+        middle = end - timedelta(days=days)
+        current = self.window(middle, end, "day", model, style)
+        previous = self.window(middle - timedelta(days=days), middle, "day", model, style)
+        return {
+            "days": days,
+            "model": model,
+            "style": style,
+            "current": {"start": middle.date().isoformat(), **current},
+            "previous": {"start": (middle - timedelta(days=days)).date().isoformat(), **previous},
+            "change": {
+                "selections": current["selections"] - previous["selections"],
+                "regenerations": current["regenerations"] - previous["regenerations"],
+                "regeneration_rate": round(current["regeneration_rate"] - previous["regeneration_rate"], 3)
+            }
+        }
+
+    def trend(self, periods: int = 30, granularity: str = "day", model: Optional[str] = None,
+              style: Optional[str] = None, now: Optional[datetime] = None) -> List[Dict]:
+        """Get per-bucket metrics for the last `periods` hours or days, oldest first."""
+        _, step = GRANULARITIES[granularity]
+        end = self._floor(now or datetime.now(), granularity) + step
+        start = end - step * periods
+        return [{"bucket": key, **self.window(moment, moment + step, granularity, model, style)}
+                for key, moment in zip(self._keys(start, end, granularity), self._moments(start, end, step))]
+
+    def _keys(self, start: datetime, end: datetime, granularity: str) -> List[str]:
+        """List the bucket keys covering [start, end)."""
+        key_length, step = GRANULARITIES[granularity]
+        return [moment.isoformat()[:key_length] for moment in self._moments(start, end, step)]
+
+    def _moments(self, start: datetime, end: datetime, step: timedelta) -> List[datetime]:
+        """List bucket start times in [start, end)."""
+        moments = []
+        moment = start
+        while moment < end:
+            moments.append(moment)
+            moment += step
+        return moments
+
+    def _floor(self, moment: datetime, granularity: str) -> datetime:
+        """Round a time down to the start of its bucket."""
+        if granularity == "hour":
+            return moment.replace(minute=0, second=0, microsecond=0)
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
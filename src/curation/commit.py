@@ -0,0 +1,74 @@
+"""
+Group Commit Module
+Background writer that batches concurrently submitted records into one durable write,
+releasing each submitter once its batch is committed.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+class GroupCommitWriter:
+    def __init__(self, commit: Callable[[List[Any]], None], max_batch: int = 256):
+        """Start the writer thread; commit is called with each batch of submitted items."""
+        self.commit = commit
+        self.max_batch = max_batch
+        self.batches = 0
+        self.committed = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item; the future resolves once its batch is durable."""
+        if self._closed:
+            raise RuntimeError("Group commit writer is closed")
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def write(self, item: Any):
+        """Queue an item and wait for its batch to commit, re-raising a failed commit."""
+        return self.submit(item).result()
+
+    def close(self):
+        """Commit everything queued and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Commit whatever has queued up while the previous batch was being written."""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+
+            try:
+                self.commit([item for item, _ in batch])
+                self.batches += 1
+                self.committed += len(batch)
+                for _, future in batch:
+                    future.set_result(None)
+            except Exception as e:
+                print(f"❌ Group commit of {len(batch)} records failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+
+            if stop:
+                return
@@ -0,0 +1,92 @@
+"""
+Feedback Store Module
+In-memory custom feedback loaded from curation storage and reloaded when other processes change it,
+with a background thread that writes dirty state behind on an interval and at shutdown.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from .storage import CurationStorage, apply_feedback_changes
+
+class FeedbackStore:
+    def __init__(self, storage: CurationStorage, flush_interval: float = 5.0):
+        """Load custom feedback and start the write-behind flusher."""
+        self.storage = storage
+        self.flush_interval = flush_interval
+        self.lock = threading.RLock()
+        self._version = storage.feedback_version()
+        self.data = storage.load_custom_feedback()
+        self._pending = []
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="feedback-flusher", daemon=True)
+        self._thread.start()
+
+    def mark_dirty(self, entry: Dict, improvement: Dict, themes: List[str]):
+        """Queue one feedback change already applied to data (hold lock while mutating data)."""
+        with self.lock:
+            self._pending.append((entry, improvement, themes))
+
+    def snapshot(self) -> Dict:
+        """Copy the feedback containers so readers and the flusher never see them mid-update."""
+        with self.lock:
+            return {
+                "feedback_entries": list(self.data["feedback_entries"]),
+                "prompt_improvements": {model: list(entries)
+                                        for model, entries in self.data["prompt_improvements"].items()},
+                "common_themes": dict(self.data["common_themes"])
+            }
+
+    def refresh(self):
+        """Reload feedback other processes stored since our last load, keeping our unflushed changes.
+
+        Holding the flush lock keeps changes on their way to storage from
+        being missing both in memory and in what is reloaded.
+        """
+        with self._flush_lock:
+            version = self.storage.feedback_version()
+            if version == self._version:
+                return
+            data = self.storage.load_custom_feedback()
+            with self.lock:
+                apply_feedback_changes(data, self._pending)
+                self.data = data
+                self._version = version
+
+    @property
+    def dirty(self) -> bool:
+        """Whether changes are waiting to be flushed."""
+        return bool(self._pending)
+
+    def flush(self) -> Optional[int]:
+        """Persist queued changes in one storage write; returns how many were written."""
+        with self._flush_lock:
+            with self.lock:
+                if not self._pending:
+                    return 0
+                changes, self._pending = self._pending, []
+
+            try:
+                with self.storage.lock():
+                    self.storage.save_custom_feedback(changes)
+                return len(changes)
+            except Exception as e:
+                # Keep the changes queued for the next attempt
+                with self.lock:
+                    self._pending[:0] = changes
+                print(f"❌ Error flushing custom feedback: {e}")
+                return None
+
+    def close(self):
+        """Stop the flusher and write any remaining changes."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+
+    def _run(self):
+        """Flush dirty state every flush_interval seconds until closed."""
+        while not self._stop.wait(self.flush_interval):
+            if self._pending:
+                self.flush()
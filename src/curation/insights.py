@@ -0,0 +1,152 @@
+"""
+Reinforcement Insights Module
+Running aggregates and ranked counters over reinforcement data, updated per selection so insights
+are served without re-sorting, with a consistency check against raw history.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .reinforcement import CATEGORIES, MODELS, Increment, apply_increments, increments
+
+# Entries reported for preferred styles and quality feedback
+TOP_K = 3
+
+class RankedCounter:
+    """Counter kept in descending count order; each increment is O(1).
+
+    Counts only ever grow by one, so an incremented key swaps with the
+    first key of its count block and that block's start moves down one.
+    """
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None):
+        self.counts = {}
+        self.order = []
+        self.position = {}
+        self.block_start = {}
+        for key, count in sorted((counts or {}).items(), key=lambda x: x[1], reverse=True):
+            self._append(key, count)
+
+    def increment(self, key: str):
+        """Add one to a key's count and restore rank order."""
+        if key not in self.counts:
+            self._append(key, 0)
+
+        count = self.counts[key]
+        i = self.position[key]
+        j = self.block_start[count]
+        if i != j:
+            other = self.order[j]
+            self.order[i], self.order[j] = other, key
+            self.position[other], self.position[key] = i, j
+
+        # The key now closes the count+1 block; its old block starts one later
+        if j + 1 < len(self.order) and self.counts[self.order[j + 1]] == count:
+            self.block_start[count] = j + 1
+        else:
+            del self.block_start[count]
+        self.block_start.setdefault(count + 1, j)
+        self.counts[key] = count + 1
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Get the k highest (key, count) pairs, or all of them."""
+        keys = self.order if k is None else self.order[:k]
+        return [(key, self.counts[key]) for key in keys]
+
+    def _append(self, key: str, count: int):
+        """Add a key at the end of the order; only valid for the lowest count so far."""
+        self.position[key] = len(self.order)
+        self.block_start.setdefault(count, len(self.order))
+        self.order.append(key)
+        self.counts[key] = count
+
+class ModelAggregate:
+    """Ranked counters and running totals of one model."""
+
+    def __init__(self, data: Optional[Dict] = None):
+        data = data or {}
+        self.counters = {category: RankedCounter(data.get(category)) for category in CATEGORIES}
+        self.total_selections = sum(data.get("selection_patterns", {}).values())
+        self.total_regenerations = sum(int(count) * frequency
+                                       for count, frequency in data.get("regeneration_patterns", {}).items())
+
+    def increment(self, category: str, key: str):
+        """Count one increment and update running totals."""
+        self.counters[category].increment(key)
+        if category == "selection_patterns":
+            self.total_selections += 1
+        elif category == "regeneration_patterns":
+            self.total_regenerations += int(key)
+
+    def insights(self) -> Dict:
+        """Build the model's insights from the maintained aggregates."""
+        return {
+            "preferred_styles": self.counters["preferred_styles"].top(TOP_K),
+            "quality_feedback": self.counters["quality_feedback"].top(TOP_K),
+            "selection_patterns": self.counters["selection_patterns"].top(),
+            "avg_regenerations": self.total_regenerations / self.total_selections if self.total_selections > 0 else 0,
+            "total_selections": self.total_selections
+        }
+
+class InsightsAggregator:
+    def __init__(self, reinforcement_data: Dict):
+        """Initialize aggregates from reinforcement counters."""
+        self.models = {}
+        self._cache = {}
+        self.load(reinforcement_data)
+
+    def load(self, reinforcement_data: Dict):
+        """Replace all aggregates with ones built from reinforcement counters."""
+        self.models = {model: ModelAggregate(reinforcement_data.get(model)) for model in MODELS}
+        self._cache = {}
+
+    def apply(self, changes: List[Increment]):
+        """Fold one selection's counter increments into the aggregates."""
+        for model, category, key in changes:
+            if model not in self.models:
+                self.models[model] = ModelAggregate()
+            self.models[model].increment(category, key)
+            self._cache.pop(model, None)
+
+    def model_insights(self, model: str) -> Dict:
+        """Get a model's insights, rebuilt only after it received new selections."""
+        if model not in self._cache:
+            aggregate = self.models.get(model) or ModelAggregate()
+            self._cache[model] = aggregate.insights()
+        return self._cache[model]
+
+    def counts(self) -> Dict:
+        """Get the aggregated counters in reinforcement data layout."""
+        return {model: {category: dict(aggregate.counters[category].counts) for category in CATEGORIES}
+                for model, aggregate in self.models.items()}
+
+    def verify(self, history: List[Dict], rebuild: bool = False) -> Dict:
+        """Compare the aggregates with counters recomputed from raw selection history.
+
+        With rebuild, mismatching aggregates are replaced by the ones from history.
+        """
+        expected = {}
+        for record in history:
+            apply_increments(expected, increments(record))
+        expected = InsightsAggregator(expected)
+
+        mismatches = []
+        for model in sorted(set(self.models) | set(expected.models)):
+            actual_aggregate = self.models.get(model) or ModelAggregate()
+            expected_aggregate = expected.models.get(model) or ModelAggregate()
+            for category in CATEGORIES:
+                if actual_aggregate.counters[category].counts != expected_aggregate.counters[category].counts:
+                    mismatches.append(f"{model}.{category}")
+            if (actual_aggregate.total_selections, actual_aggregate.total_regenerations) != \
+                    (expected_aggregate.total_selections, expected_aggregate.total_regenerations):
+                mismatches.append(f"{model}.totals")
+
+        if mismatches and rebuild:
+            self.models = expected.models
+            self._cache = {}
+
+        return {
+            "consistent": not mismatches,
+            "mismatches": mismatches,
+            "records_checked": len(history),
+            "rebuilt": bool(mismatches and rebuild)
+        }
@@ -0,0 +1,146 @@
+"""
+Curation Journal Module
+Append-only JSONL journal of curation records with batched fsync, replayed on top of the last snapshot.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+class CurationJournal:
+    def __init__(self, journal_file: Path, fsync_every: int = 32, fsync_interval: float = 1.0):
+        """Initialize journal; fsync runs after fsync_every records or fsync_interval seconds."""
+        self.journal_file = Path(journal_file)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        # Journal file identity and bytes already read or written by this process
+        self.inode = None
+        self.offset = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._file = None
+
+    def replay(self, after_seq: int) -> List[Dict]:
+        """Read journaled records with seq >= after_seq.
+
+        Records below after_seq were already folded into a snapshot (a crash
+        can land between writing the snapshot and truncating the journal).
+        A torn final line from a crash mid-write is dropped.
+        """
+        records = []
+        self.count = 0
+        self.offset = 0
+        self.inode = None
+        if not self.journal_file.exists():
+            return records
+        self.inode = self.journal_file.stat().st_ino
+
+        valid_bytes = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"⚠️ Dropping torn journal record at byte {valid_bytes}")
+                    break
+                valid_bytes += len(line)
+                self.count += 1
+                if record.get("seq", 0) >= after_seq:
+                    records.append(record)
+
+        if valid_bytes < self.journal_file.stat().st_size:
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(valid_bytes)
+
+        self.offset = valid_bytes
+        return records
+
+    def read_new(self) -> Optional[List[Dict]]:
+        """Read records other processes appended since this one last read or wrote.
+
+        Returns None when another process compacted the journal (it is
+        replaced by a new file on truncate); the caller must resync from
+        the snapshot. Call while holding the storage lock.
+        """
+        if not self.journal_file.exists():
+            return [] if self.inode is None else None
+        stat = self.journal_file.stat()
+        if self.inode is None:
+            self.inode = stat.st_ino
+        elif stat.st_ino != self.inode or stat.st_size < self.offset:
+            return None
+        if stat.st_size == self.offset:
+            return []
+
+        records = []
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self.offset)
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    return None
+                self.offset += len(line)
+
+        self.count += len(records)
+        return records
+
+    def append(self, record: Dict):
+        """Append one record; cost does not depend on history size."""
+        self._open()
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._file.flush()
+        self.count += 1
+        self._pending += 1
+
+        if self._pending >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def append_batch(self, records: List[Dict]):
+        """Append records with a single write and fsync (group commit)."""
+        self._open()
+        self._file.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records))
+        self._file.flush()
+        self.count += len(records)
+        self._pending += len(records)
+        self.sync()
+        self.offset = os.fstat(self._file.fileno()).st_size
+
+    def sync(self):
+        """Force journaled records to disk."""
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def truncate(self):
+        """Empty the journal once its records are in a snapshot.
+
+        The empty journal is a new file, so other processes holding the old
+        one notice the compaction instead of appending to a stale file.
+        """
+        self.close()
+        temp_file = self.journal_file.with_suffix('.jsonl.tmp')
+        with open(temp_file, 'w') as f:
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.journal_file)
+        self.inode = self.journal_file.stat().st_ino
+        self.count = 0
+        self.offset = 0
+
+    def _open(self):
+        """Open the journal for appending, adopting the file's identity."""
+        if self._file is None:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.journal_file, 'a', encoding='utf-8')
+            self.inode = os.fstat(self._file.fileno()).st_ino
+
+    def close(self):
+        """Sync and close the journal file."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,45 @@
+"""
+Reinforcement Counters Module
+Derives the reinforcement counter increments of a curation record, shared by the backend, storage replay and migration.
+"""
+
+from typing import Dict, List, Tuple
+
+MODELS = ("celtic", "meru")
+CATEGORIES = ("preferred_styles", "quality_feedback", "regeneration_patterns", "selection_patterns")
+
+# (model, category, key) of one counter to increment
+Increment = Tuple[str, str, str]
+
+def empty_reinforcement() -> Dict:
+    """Build empty reinforcement data for every model."""
+    return {model: {category: {} for category in CATEGORIES} for model in MODELS}
+
+def model_for(glyph_info: Dict) -> str:
+    """Pick the model a glyph's style is generated with."""
+    return "celtic" if glyph_info.get('style', '').startswith('celtic') else "meru"
+
+def increments(record: Dict) -> List[Increment]:
+    """List the counters a selection record increments.
+
+    Counter keys are strings, as they are after a JSON round trip.
+    """
+    model = record["model_used"]
+    style = record["glyph_info"].get('style', 'default')
+    result = [(model, "preferred_styles", style)]
+
+    if record.get('feedback'):
+        result.append((model, "quality_feedback", record['feedback']))
+
+    regeneration_count = record.get('regeneration_count', 0) or 0
+    if regeneration_count > 0:
+        result.append((model, "regeneration_patterns", str(regeneration_count)))
+
+    result.append((model, "selection_patterns", str(record["selected_variant"])))
+    return result
+
+def apply_increments(data: Dict, changes: List[Increment]):
+    """Apply counter increments to reinforcement data in place."""
+    for model, category, key in changes:
+        counters = data.setdefault(model, {c: {} for c in CATEGORIES}).setdefault(category, {})
+        counters[key] = counters.get(key, 0) + 1
@@ -0,0 +1,90 @@
+"""
+Reinforcement Replay Module
+Rebuilds reinforcement counters from raw curation history with columnar numpy aggregation
+and diffs them against the stored counters.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .reinforcement import CATEGORIES, empty_reinforcement
+
+def factorize(values: Iterable, size: int) -> Tuple[np.ndarray, List]:
+    """Encode values as integer codes into a list of distinct values, in one pass."""
+    index = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.int64, count=size)
+    return codes, list(index)
+
+def history_columns(history: List[Dict]) -> Dict[str, Tuple[np.ndarray, List]]:
+    """Extract the fields reinforcement counts from records as factorized columns."""
+    size = len(history)
+    return {
+        "model": factorize((record["model_used"] for record in history), size),
+        "style": factorize((record["glyph_info"].get('style', 'default') for record in history), size),
+        "feedback": factorize((record.get('feedback') or '' for record in history), size),
+        "regeneration_count": factorize((record.get('regeneration_count', 0) or 0 for record in history), size),
+        "selected_variant": factorize((record["selected_variant"] for record in history), size)
+    }
+
+def count_by_model(models: Tuple[np.ndarray, List], keys: Tuple[np.ndarray, List],
+                   mask: Optional[np.ndarray] = None) -> Dict[str, Dict[str, int]]:
+    """Count (model, key) pairs with one bincount over combined codes; keys become strings."""
+    model_codes, model_names = models
+    key_codes, key_names = keys
+    if mask is not None:
+        model_codes, key_codes = model_codes[mask], key_codes[mask]
+    counts = np.bincount(model_codes * len(key_names) + key_codes,
+                         minlength=len(model_names) * len(key_names)).reshape(len(model_names), len(key_names))
+
+    result = {}
+    for m, model in enumerate(model_names):
+        counters = result.setdefault(model, {})
+        for k in np.nonzero(counts[m])[0]:
+            # Values such as 1 and "1" collapse onto one string key
+            key = str(key_names[k])
+            counters[key] = counters.get(key, 0) + int(counts[m, k])
+    return result
+
+def rebuild_reinforcement(history: List[Dict]) -> Dict:
+    """Recompute reinforcement counters from history, with string keys as increments() produces."""
+    columns = history_columns(history)
+    models = columns["model"]
+    feedback_codes, feedback_names = columns["feedback"]
+    regeneration_codes, regeneration_names = columns["regeneration_count"]
+
+    # Only non-empty feedback and positive regeneration counts are counted
+    has_feedback = np.array([bool(name) for name in feedback_names], dtype=bool)[feedback_codes]
+    regenerated = np.array([int(name) > 0 for name in regeneration_names], dtype=bool)[regeneration_codes]
+
+    categories = {
+        "preferred_styles": count_by_model(models, columns["style"]),
+        "quality_feedback": count_by_model(models, columns["feedback"], has_feedback),
+        "regeneration_patterns": count_by_model(models, columns["regeneration_count"], regenerated),
+        "selection_patterns": count_by_model(models, columns["selected_variant"])
+    }
+
+    data = empty_reinforcement()
+    for category, per_model in categories.items():
+        for model, counters in per_model.items():
+            if counters or model in data:
+                data.setdefault(model, {c: {} for c in CATEGORIES})[category] = counters
+    return data
+
+def diff_reinforcement(stored: Dict, rebuilt: Dict) -> List[Tuple[str, str, str, int, int]]:
+    """List (model, category, key, stored, rebuilt) for every counter that differs.
+
+    Stored keys are normalised to strings first, so int and str keys of the
+    same counter (from before the JSON round trip) are merged, not reported twice.
+    """
+    differences = []
+    for model in sorted(set(stored) | set(rebuilt)):
+        for category in CATEGORIES:
+            old = {}
+            for key, count in stored.get(model, {}).get(category, {}).items():
+                old[str(key)] = old.get(str(key), 0) + count
+            new = rebuilt.get(model, {}).get(category, {})
+            for key in sorted(set(old) | set(new)):
+                if old.get(key, 0) != new.get(key, 0):
+                    differences.append((model, category, key, old.get(key, 0), new.get(key, 0)))
+    return differences
@@ -0,0 +1,98 @@
+"""
+Glyph Status Module
+Per-glyph curation status for the target glyph list, kept current as selections are recorded so
+progress, next-uncurated and per-glyph lookups never scan history.
+"""
+
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+GLYPH_LIST_FILE = Path("108_glyphs_list.json")
+
+def load_targets(glyph_list_file: Path = GLYPH_LIST_FILE) -> List[Dict]:
+    """Load the glyphs to curate."""
+    try:
+        with open(glyph_list_file, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Could not load glyph list {glyph_list_file}: {e}")
+        return []
+
+class GlyphStatusIndex:
+    def __init__(self, targets: List[Dict]):
+        """Initialize every target glyph as uncurated, in list order."""
+        self.targets = OrderedDict((glyph['name'], glyph) for glyph in targets)
+        self.status = {name: {"status": "uncurated", "selections": 0, "regenerations": 0, "latest_selection": None}
+                       for name in self.targets}
+        # Uncurated glyphs in list order; the first key is the next one to curate
+        self.uncurated = OrderedDict((name, None) for name in self.targets)
+        self.curated = 0
+        self.untracked_selections = 0
+        self.last_curated = None
+
+    def load(self, history: Iterable[Dict]):
+        """Apply existing history."""
+        for record in history:
+            self.add(record)
+
+    def add(self, record: Dict):
+        """Update the glyph a selection record belongs to.
+
+        Records with selected_variant 0 are regenerations and never count
+        as curation; repeat selections only replace the latest selection.
+        """
+        name = record["glyph_info"].get('name')
+        entry = self.status.get(name)
+        if entry is None:
+            self.untracked_selections += 1
+            return
+
+        if record.get("selected_variant") == 0:
+            entry["regenerations"] += max(record.get("regeneration_count", 0) or 0, 1)
+            if entry["status"] == "uncurated":
+                entry["status"] = "regenerating"
+            return
+
+        entry["selections"] += 1
+        entry["latest_selection"] = {
+            "seq": record.get("seq"),
+            "timestamp": record["timestamp"],
+            "selected_variant": record["selected_variant"],
+            "style": record["glyph_info"].get('style'),
+            "feedback": record.get("feedback"),
+            "regeneration_count": record.get("regeneration_count", 0)
+        }
+        if entry["status"] != "curated":
+            entry["status"] = "curated"
+            self.curated += 1
+            self.uncurated.pop(name, None)
+        self.last_curated = record
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Get a glyph's definition and curation status."""
+        entry = self.status.get(name)
+        if entry is None:
+            return None
+        return {"glyph": self.targets[name], **entry}
+
+    def next_uncurated(self) -> Optional[Dict]:
+        """Get the first glyph in list order that has no selection yet."""
+        name = next(iter(self.uncurated), None)
+        return self.get(name) if name is not None else None
+
+    def progress(self) -> Dict:
+        """Summarize curation progress over the target glyphs."""
+        total_target = len(self.targets)
+        return {
+            "total_curated": self.curated,
+            "total_target": total_target,
+            "completion_percentage": round((self.curated / total_target) * 100, 1) if total_target else 0,
+            "remaining": total_target - self.curated,
+            "last_curated": self.last_curated
+        }
+
+    def summary(self) -> List[Dict]:
+        """List every target glyph's status in list order."""
+        return [{"name": name, **self.status[name]} for name in self.targets]
@@ -0,0 +1,483 @@
+"""
+Curation Storage Module
+Pluggable persistence for curation history, reinforcement counters and custom feedback:
+JSON snapshots with an append-only journal, or SQLite in WAL mode.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .journal import CurationJournal
+from .reinforcement import CATEGORIES, Increment, apply_increments, empty_reinforcement, increments
+
+try:
+    import fcntl
+except ImportError:
+    # No flock (Windows): only the backend's thread locks apply, so run a single API worker
+    fcntl = None
+
+# Journaled selections folded into the JSON snapshots at a time
+COMPACT_EVERY = 1000
+
+# (feedback entry, prompt improvement, matched themes) of one custom feedback
+FeedbackChange = Tuple[Dict, Dict, List[str]]
+
+def empty_custom_feedback() -> Dict:
+    """Build empty custom feedback data."""
+    return {"feedback_entries": [], "prompt_improvements": {}, "common_themes": {}}
+
+def apply_feedback_changes(data: Dict, changes: List[FeedbackChange]):
+    """Add feedback changes to custom feedback data in place."""
+    for entry, improvement, themes in changes:
+        data["feedback_entries"].append(entry)
+        data["prompt_improvements"].setdefault(entry["model_used"], []).append(improvement)
+        for theme in themes:
+            data["common_themes"][theme] = data["common_themes"].get(theme, 0) + 1
+
+class CurationStorage(ABC):
+    """Abstract base class for curation storage backends.
+
+    Writers hold lock() across refresh() and the write so that selection
+    sequence numbers stay unique when several processes share the data.
+    """
+
+    lock_file = None
+
+    @contextmanager
+    def lock(self):
+        """Hold the exclusive cross-process lock of this storage."""
+        if fcntl is None:
+            yield
+            return
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @abstractmethod
+    def load_history(self) -> List[Dict]:
+        """Load every selection record, oldest first."""
+        pass
+
+    @abstractmethod
+    def load_reinforcement(self) -> Dict:
+        """Load reinforcement counters per model."""
+        pass
+
+    @abstractmethod
+    def refresh(self, known: int) -> List[Dict]:
+        """Get selections with seq >= known, i.e. those committed by other processes."""
+        pass
+
+    @abstractmethod
+    def append_selections(self, batch: List[Tuple[Dict, List[Increment]]]):
+        """Durably add selection records and their counter increments in one write."""
+        pass
+
+    @abstractmethod
+    def replace_reinforcement(self, data: Dict):
+        """Overwrite all reinforcement counters, e.g. after rebuilding them from history."""
+        pass
+
+    @abstractmethod
+    def load_custom_feedback(self) -> Dict:
+        """Load custom feedback entries, prompt improvements and theme counts."""
+        pass
+
+    @abstractmethod
+    def save_custom_feedback(self, changes: List[FeedbackChange]):
+        """Persist new feedback entries, their prompt improvements and matched themes."""
+        pass
+
+    @abstractmethod
+    def feedback_version(self) -> Any:
+        """Get a cheap token that changes whenever stored custom feedback changes."""
+        pass
+
+    @abstractmethod
+    def replace_custom_feedback(self, data: Dict):
+        """Overwrite all custom feedback, e.g. after re-classifying the corpus."""
+        pass
+
+    @abstractmethod
+    def selections_for(self, glyph_name: str, style: Optional[str] = None) -> List[Dict]:
+        """Get selection records of a glyph, optionally under one style."""
+        pass
+
+    def checkpoint(self):
+        """Fold recent writes into snapshots when due (call holding lock, after memory is updated)."""
+        pass
+
+    def close(self):
+        """Flush and release resources."""
+        pass
+
+class JSONStorage(CurationStorage):
+    def __init__(self, curation_path: Path = Path("data/curation"),
+                 reinforcement_path: Path = Path("data/reinforcement"), compact_every: int = COMPACT_EVERY):
+        """Initialize JSON snapshot storage with a selection journal."""
+        self.curation_path = Path(curation_path)
+        self.reinforcement_path = Path(reinforcement_path)
+        self.compact_every = compact_every
+        self.history_file = self.curation_path / "curation_history.json"
+        self.reinforcement_file = self.reinforcement_path / "reinforcement_data.json"
+        self.feedback_file = self.reinforcement_path / "custom_feedback.json"
+        self.lock_file = self.curation_path / ".curation.lock"
+        self.journal = CurationJournal(self.curation_path / "curation_journal.jsonl")
+        self.curation_path.mkdir(parents=True, exist_ok=True)
+        self.reinforcement_path.mkdir(parents=True, exist_ok=True)
+
+        # Shared with the caller, which applies new selections to them
+        self.history = None
+        self.reinforcement = None
+        self._by_glyph = defaultdict(list)
+
+    def load_history(self) -> List[Dict]:
+        """Load the history snapshot plus journaled selections (replayed once, then shared)."""
+        if self.history is None:
+            self._load()
+        return self.history
+
+    def load_reinforcement(self) -> Dict:
+        """Load reinforcement snapshot plus journaled increments."""
+        if self.reinforcement is None:
+            self._load()
+        return self.reinforcement
+
+    def refresh(self, known: int) -> List[Dict]:
+        """Read selections other processes journaled, resyncing from the snapshot after their compaction."""
+        records = self.journal.read_new()
+        if records is None or (records and records[0]["seq"] != known):
+            self.journal.close()
+            snapshot = []
+            if self.history_file.exists():
+                with open(self.history_file, 'r') as f:
+                    snapshot = json.load(f)
+            records = snapshot[known:]
+            start = max(known, len(snapshot))
+            records += self.journal.replay(start)
+
+        records = [record for record in records if record["seq"] >= known]
+        for record in records:
+            self._by_glyph[record["glyph_info"].get('name')].append(record)
+        return records
+
+    def append_selections(self, batch: List[Tuple[Dict, List[Increment]]]):
+        """Journal selections with one fsync; counters are rebuilt from the journal on replay."""
+        self.journal.append_batch([record for record, _ in batch])
+        for record, _ in batch:
+            self._by_glyph[record["glyph_info"].get('name')].append(record)
+
+    def replace_reinforcement(self, data: Dict):
+        """Swap in new counters and compact, so the snapshot covers every journaled selection."""
+        self.load_reinforcement()
+        self.reinforcement.clear()
+        self.reinforcement.update(data)
+        self.compact()
+
+    def checkpoint(self):
+        """Fold the journal into the snapshots once it grows large."""
+        if self.journal.count >= self.compact_every:
+            self.compact()
+
+    def load_custom_feedback(self) -> Dict:
+        """Load custom feedback from its JSON file."""
+        if self.feedback_file.exists():
+            with open(self.feedback_file, 'r') as f:
+                return json.load(f)
+        return empty_custom_feedback()
+
+    def save_custom_feedback(self, changes: List[FeedbackChange]):
+        """Merge changes into the custom feedback file as it is on disk, keeping other processes' entries."""
+        data = self.load_custom_feedback()
+        apply_feedback_changes(data, changes)
+        self._write_json_atomic(self.feedback_file, data)
+
+    def feedback_version(self) -> Any:
+        """Identify the custom feedback file by its modification time and size (it is replaced on write)."""
+        if not self.feedback_file.exists():
+            return None
+        stat = self.feedback_file.stat()
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def replace_custom_feedback(self, data: Dict):
+        """Rewrite the custom feedback file."""
+        self._write_json_atomic(self.feedback_file, data)
+
+    def selections_for(self, glyph_name: str, style: Optional[str] = None) -> List[Dict]:
+        """Look up selections of a glyph in the in-memory name index."""
+        self.load_history()
+        return [record for record in self._by_glyph.get(glyph_name, [])
+                if style is None or record["glyph_info"].get('style') == style]
+
+    def compact(self):
+        """Fold the journal into the JSON snapshots and truncate it.
+
+        Reinforcement data is written first with the sequence it covers,
+        so a crash between the two writes never double-counts or drops a
+        selection on replay.
+        """
+        self.journal.sync()
+        self._write_json_atomic(self.reinforcement_file, {**self.reinforcement, "journal_seq": len(self.history)})
+        self._write_json_atomic(self.history_file, self.history)
+        self.journal.truncate()
+        print(f"🗜️ Compacted curation journal into {len(self.history)} snapshot records")
+
+    def close(self):
+        """Sync the journal."""
+        self.journal.close()
+
+    def _load(self):
+        """Load both snapshots and replay selections journaled since."""
+        self.history = []
+        if self.history_file.exists():
+            with open(self.history_file, 'r') as f:
+                self.history = json.load(f)
+
+        self.reinforcement = empty_reinforcement()
+        reinforcement_seq = 0
+        if self.reinforcement_file.exists():
+            with open(self.reinforcement_file, 'r') as f:
+                self.reinforcement = json.load(f)
+            # Selections already counted in the snapshot (older files predate the marker)
+            reinforcement_seq = self.reinforcement.pop("journal_seq", len(self.history))
+
+        snapshot_length = len(self.history)
+        tail = self.journal.replay(min(snapshot_length, reinforcement_seq))
+        for record in tail:
+            if record["seq"] >= reinforcement_seq:
+                apply_increments(self.reinforcement, increments(record))
+            if record["seq"] >= snapshot_length:
+                self.history.append(record)
+
+        for record in self.history:
+            self._by_glyph[record["glyph_info"].get('name')].append(record)
+
+        if tail:
+            print(f"📜 Replayed {len(tail)} journaled selections")
+
+    def _write_json_atomic(self, path: Path, data: Any):
+        """Write JSON to a temp file and rename it into place."""
+        temp_file = path.with_suffix('.json.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS selections (
+    seq INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    glyph_name TEXT,
+    style TEXT,
+    model TEXT NOT NULL,
+    selected_variant INTEGER,
+    feedback TEXT,
+    regeneration_count INTEGER,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS selections_glyph ON selections (glyph_name, style);
+CREATE INDEX IF NOT EXISTS selections_time ON selections (timestamp);
+
+CREATE TABLE IF NOT EXISTS reinforcement (
+    model TEXT NOT NULL,
+    category TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (model, category, key)
+);
+
+CREATE TABLE IF NOT EXISTS feedback_entries (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    glyph_name TEXT,
+    model TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS feedback_glyph ON feedback_entries (glyph_name);
+
+CREATE TABLE IF NOT EXISTS prompt_improvements (
+    id INTEGER PRIMARY KEY,
+    model TEXT NOT NULL,
+    glyph_name TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS improvements_model ON prompt_improvements (model);
+
+CREATE TABLE IF NOT EXISTS feedback_themes (
+    theme TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+class SQLiteStorage(CurationStorage):
+    def __init__(self, db_path: Path = Path("data/curation/curation.db")):
+        """Initialize SQLite storage in WAL mode with indexed tables."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_file = self.db_path.with_suffix('.lock')
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # The connection is shared with background writer threads; one statement at a time
+        self._conn_lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # Group commit amortises the fsync of every transaction
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript(SQLITE_SCHEMA)
+
+    def load_history(self) -> List[Dict]:
+        """Load every selection record in sequence order."""
+        rows = self.conn.execute("SELECT record FROM selections ORDER BY seq")
+        return [json.loads(record) for (record,) in rows]
+
+    def load_reinforcement(self) -> Dict:
+        """Assemble reinforcement counters from their table."""
+        data = empty_reinforcement()
+        for model, category, key, count in self.conn.execute("SELECT model, category, key, count FROM reinforcement"):
+            data.setdefault(model, {c: {} for c in CATEGORIES}).setdefault(category, {})[key] = count
+        return data
+
+    def refresh(self, known: int) -> List[Dict]:
+        """Get selections other processes inserted after the known ones."""
+        with self._conn_lock:
+            rows = self.conn.execute("SELECT record FROM selections WHERE seq >= ? ORDER BY seq", (known,)).fetchall()
+        return [json.loads(record) for (record,) in rows]
+
+    def append_selections(self, batch: List[Tuple[Dict, List[Increment]]]):
+        """Insert selections and bump their counters in one transaction."""
+        with self._conn_lock, self.conn:
+            for record, changes in batch:
+                self._insert_selection(record)
+                self.conn.executemany(
+                    "INSERT INTO reinforcement (model, category, key, count) VALUES (?, ?, ?, 1) "
+                    "ON CONFLICT (model, category, key) DO UPDATE SET count = count + 1",
+                    changes)
+
+    def replace_reinforcement(self, data: Dict):
+        """Replace the reinforcement table in one transaction."""
+        with self._conn_lock, self.conn:
+            self.conn.execute("DELETE FROM reinforcement")
+            self._insert_reinforcement(data)
+
+    def load_custom_feedback(self) -> Dict:
+        """Assemble custom feedback data from its tables."""
+        data = empty_custom_feedback()
+        data["feedback_entries"] = [json.loads(entry) for (entry,) in
+                                    self.conn.execute("SELECT entry FROM feedback_entries ORDER BY id")]
+        for model, entry in self.conn.execute("SELECT model, entry FROM prompt_improvements ORDER BY id"):
+            data["prompt_improvements"].setdefault(model, []).append(json.loads(entry))
+        data["common_themes"] = dict(self.conn.execute("SELECT theme, count FROM feedback_themes"))
+        return data
+
+    def save_custom_feedback(self, changes: List[FeedbackChange]):
+        """Insert new entries and improvements and bump matched themes in one transaction."""
+        with self._conn_lock, self.conn:
+            for entry, improvement, themes in changes:
+                self._insert_feedback(entry, improvement)
+                self.conn.executemany(
+                    "INSERT INTO feedback_themes (theme, count) VALUES (?, 1) "
+                    "ON CONFLICT (theme) DO UPDATE SET count = count + 1",
+                    [(theme,) for theme in themes])
+
+    def feedback_version(self) -> Any:
+        """Fingerprint the feedback tables by row counts, last row ids and the theme total."""
+        with self._conn_lock:
+            return self.conn.execute(
+                "SELECT (SELECT COUNT(*) FROM feedback_entries), (SELECT MAX(id) FROM feedback_entries), "
+                "(SELECT COUNT(*) FROM prompt_improvements), (SELECT MAX(id) FROM prompt_improvements), "
+                "(SELECT TOTAL(count) FROM feedback_themes), (SELECT COUNT(*) FROM feedback_themes)").fetchone()
+
+    def selections_for(self, glyph_name: str, style: Optional[str] = None) -> List[Dict]:
+        """Look up selections of a glyph through the (glyph_name, style) index."""
+        with self._conn_lock:
+            if style is None:
+                rows = self.conn.execute("SELECT record FROM selections WHERE glyph_name = ? ORDER BY seq",
+                                         (glyph_name,)).fetchall()
+            else:
+                rows = self.conn.execute("SELECT record FROM selections WHERE glyph_name = ? AND style = ? ORDER BY seq",
+                                         (glyph_name, style)).fetchall()
+        return [json.loads(record) for (record,) in rows]
+
+    def import_data(self, history: List[Dict], reinforcement: Dict, custom_feedback: Dict):
+        """Replace all stored data in one transaction (used by the JSON migrator)."""
+        with self.conn:
+            for table in ("selections", "reinforcement", "feedback_entries", "prompt_improvements", "feedback_themes"):
+                self.conn.execute(f"DELETE FROM {table}")
+
+            for seq, record in enumerate(history):
+                self._insert_selection({**record, "seq": record.get("seq", seq)})
+
+            self._insert_reinforcement(reinforcement)
+
+            self._replace_feedback(custom_feedback)
+
+    def replace_custom_feedback(self, data: Dict):
+        """Replace all feedback rows in one transaction."""
+        with self._conn_lock, self.conn:
+            for table in ("feedback_entries", "prompt_improvements", "feedback_themes"):
+                self.conn.execute(f"DELETE FROM {table}")
+            self._replace_feedback(data)
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def _insert_selection(self, record: Dict):
+        """Insert one selection row."""
+        glyph_info = record["glyph_info"]
+        self.conn.execute(
+            "INSERT INTO selections (seq, timestamp, glyph_name, style, model, selected_variant, feedback, "
+            "regeneration_count, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (record["seq"], record["timestamp"], glyph_info.get('name'), glyph_info.get('style'),
+             record["model_used"], record["selected_variant"], record.get("feedback"),
+             record.get("regeneration_count", 0), json.dumps(record)))
+
+    def _insert_reinforcement(self, reinforcement: Dict):
+        """Insert reinforcement counters into the emptied table, merging int and str keys of one counter."""
+        self.conn.executemany(
+            "INSERT INTO reinforcement (model, category, key, count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (model, category, key) DO UPDATE SET count = count + excluded.count",
+            [(model, category, str(key), count)
+             for model, categories in reinforcement.items() if isinstance(categories, dict)
+             for category, counters in categories.items()
+             for key, count in counters.items()])
+
+    def _replace_feedback(self, custom_feedback: Dict):
+        """Insert a whole custom feedback document into the emptied feedback tables."""
+        # Improvements are stored separately; entries and improvements are matched by order only
+        for entry in custom_feedback.get("feedback_entries", []):
+            self._insert_feedback(entry, None)
+        for model, improvements in custom_feedback.get("prompt_improvements", {}).items():
+            for improvement in improvements:
+                self.conn.execute("INSERT INTO prompt_improvements (model, glyph_name, entry) VALUES (?, ?, ?)",
+                                  (model, improvement.get("glyph_name"), json.dumps(improvement)))
+
+        self.conn.executemany("INSERT INTO feedback_themes (theme, count) VALUES (?, ?)",
+                              custom_feedback.get("common_themes", {}).items())
+
+    def _insert_feedback(self, entry: Dict, improvement: Optional[Dict]):
+        """Insert a feedback entry and, when given, its prompt improvement."""
+        self.conn.execute("INSERT INTO feedback_entries (timestamp, glyph_name, model, entry) VALUES (?, ?, ?, ?)",
+                          (entry["timestamp"], entry.get("glyph_name"), entry.get("model_used"), json.dumps(entry)))
+        if improvement is not None:
+            self.conn.execute("INSERT INTO prompt_improvements (model, glyph_name, entry) VALUES (?, ?, ?)",
+                              (entry.get("model_used"), improvement.get("glyph_name"), json.dumps(improvement)))
+
+def open_storage(kind: Optional[str] = None) -> CurationStorage:
+    """Open the storage backend named by kind or the CURATION_STORAGE env var ('json' or 'sqlite')."""
+    kind = (kind or os.getenv('CURATION_STORAGE', 'json')).lower()
+    if kind == 'json':
+        return JSONStorage()
+    if kind == 'sqlite':
+        return SQLiteStorage(Path(os.getenv('CURATION_DB', 'data/curation/curation.db')))
+    raise ValueError(f"Unknown curation storage: {kind}")
@@ -0,0 +1,131 @@
+"""
+Feedback Themes Module
+Theme and prompt suggestion tables for custom feedback, matched with one compiled regex pass
+per text, plus batch re-classification of the whole feedback corpus.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+# Common improvement themes and the phrases that signal them
+FEEDBACK_THEMES = {
+    "detail": ["more detail", "intricate", "complex", "detailed", "fine lines"],
+    "balance": ["balance", "symmetry", "proportion", "harmony", "centered"],
+    "movement": ["dynamic", "flow", "movement", "energy", "rhythm"],
+    "style": ["celtic", "tribal", "knotwork", "spiral", "ornament"],
+    "contrast": ["contrast", "bold", "strong", "clear", "sharp"],
+    "composition": ["composition", "layout", "arrangement", "design", "structure"]
+}
+
+# Prompt suggestions, in report order, with the words that trigger them
+PROMPT_SUGGESTIONS = [
+    (["detail", "intricate", "complex"], [
+        "Add 'highly detailed' and 'intricate patterns' to prompts",
+        "Emphasize 'fine line work' and 'precise ornamentation'"
+    ]),
+    (["balance", "symmetry", "proportion"], [
+        "Add 'perfect symmetry' and 'balanced composition' to prompts",
+        "Emphasize 'harmonious proportions' and 'centered design'"
+    ]),
+    (["dynamic", "flow", "movement"], [
+        "Add 'dynamic movement' and 'flowing lines' to prompts",
+        "Emphasize 'rhythmic patterns' and 'energetic composition'"
+    ]),
+    (["celtic", "knotwork", "spiral"], [
+        "Strengthen Celtic knotwork and spiral motifs in prompts",
+        "Add 'traditional Celtic patterns' and 'ancient knotwork'"
+    ]),
+    (["contrast", "bold", "strong"], [
+        "Emphasize 'strong contrast' and 'bold lines' in prompts",
+        "Add 'high contrast' and 'sharp definition'"
+    ]),
+    (["composition", "layout", "design"], [
+        "Focus on 'strong composition' and 'balanced layout'",
+        "Emphasize 'well-structured design' and 'harmonious arrangement'"
+    ])
+]
+
+class ThemeMatcher:
+    """Finds every label whose keywords occur in a text, in one regex pass.
+
+    Matches are substring matches, like `keyword in text`. A lookahead at
+    each position finds the longest keyword starting there; each keyword
+    also carries the labels of every keyword it contains, so shorter
+    overlapping keywords are never missed. Keywords are compiled as a
+    prefix trie so each position costs one branch per character.
+    """
+
+    def __init__(self, table: Iterable[Tuple[str, List[str]]]):
+        self.labels = []
+        keyword_labels = {}
+        for label, keywords in table:
+            self.labels.append(label)
+            for keyword in keywords:
+                keyword_labels.setdefault(keyword.lower(), set()).add(label)
+
+        self.keyword_labels = {
+            keyword: frozenset().union(*(labels for other, labels in keyword_labels.items() if other in keyword))
+            for keyword in keyword_labels
+        }
+        alternation = _trie_pattern(self.keyword_labels)
+        self.pattern = re.compile(f'(?=({alternation}))') if alternation else None
+
+    def match(self, text: str) -> List[str]:
+        """Get the labels found in text, in table order."""
+        if self.pattern is None:
+            return []
+        found = set()
+        for keyword in set(self.pattern.findall(text.lower())):
+            found |= self.keyword_labels[keyword]
+        return [label for label in self.labels if label in found]
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex alternation of keywords factored by common prefix, preferring longer matches."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A keyword may end here; the greedy optional still tries longer ones first
+        return f"(?:{body})?" if '' in node else body
+
+    return render(trie)
+
+THEME_MATCHER = ThemeMatcher(FEEDBACK_THEMES.items())
+SUGGESTION_MATCHER = ThemeMatcher(enumerate(keywords for keywords, _ in PROMPT_SUGGESTIONS))
+
+def match_themes(feedback: str) -> List[str]:
+    """Get the improvement themes a piece of feedback mentions."""
+    return THEME_MATCHER.match(feedback)
+
+def suggest_improvements(feedback: str) -> List[str]:
+    """Get prompt suggestions for a piece of feedback."""
+    suggestions = []
+    for index in SUGGESTION_MATCHER.match(feedback):
+        suggestions.extend(PROMPT_SUGGESTIONS[index][1])
+    return suggestions
+
+def reclassify(custom_feedback_data: Dict) -> Dict:
+    """Re-derive theme counts and prompt suggestions for the whole feedback corpus in place.
+
+    Returns the theme counts before and after, for reporting.
+    """
+    before = dict(custom_feedback_data.get("common_themes", {}))
+    counts = Counter()
+    for entry in custom_feedback_data.get("feedback_entries", []):
+        counts.update(match_themes(entry.get("feedback", "")))
+    custom_feedback_data["common_themes"] = {theme: counts[theme] for theme in FEEDBACK_THEMES if counts[theme]}
+
+    for improvements in custom_feedback_data.get("prompt_improvements", {}).values():
+        for improvement in improvements:
+            improvement["suggested_improvements"] = suggest_improvements(improvement.get("feedback", ""))
+
+    return {"before": before, "after": custom_feedback_data["common_themes"]}
@@ -10,6 +10,7 @@ from PIL import Image
 import numpy as np
 
 from ..utils.model_interface import get_model
+from ..processors.blobs import save_image
 from ..processors.svg import SVGProcessor
 
 def convert_to_transparent(input_path: Path, output_path: Path = None, threshold: int = 30):
@@ -39,7 +40,7 @@ def convert_to_transparent(input_path: Path, output_path: Path = None, threshold
         if output_path is None:
             output_path = input_path
         
-        transparent_img.save(output_path, 'PNG')
+        save_image(transparent_img, output_path, 'PNG')
         
         print(f"✅ Converted to transparent background: {output_path.name}")
         return output_path
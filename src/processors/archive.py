@@ -0,0 +1,214 @@
+"""
+Archive Processing Module
+Packs the lean asset zip incrementally and serves its members in place from a preloaded central-directory index.
+"""
+
+import mmap
+import os
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Already-compressed formats are stored so they can be served as raw slices
+STORED_SUFFIXES = ('.png', '.webp', '.jpg', '.jpeg', '.gif', '.gz', '.zip', '.pack')
+
+# Project paths that make up the lean deploy
+LEAN_MEMBERS = ("assets", "celtic_dreamscape_display.html", "glyph_curation_app.html")
+
+LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+
+class ZipAssetArchive:
+    def __init__(self, zip_path: Union[str, Path]):
+        """Open a zip and index its members by name, resolving stored data offsets once."""
+        self.zip_path = Path(zip_path)
+        self._zip = zipfile.ZipFile(self.zip_path)
+        self._file = open(self.zip_path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = {}
+
+        for info in self._zip.infolist():
+            if info.is_dir():
+                continue
+            offset = None
+            if info.compress_type == zipfile.ZIP_STORED:
+                header = LOCAL_HEADER.unpack_from(self._map, info.header_offset)
+                offset = info.header_offset + LOCAL_HEADER.size + header[9] + header[10]
+            self.index[info.filename] = (info, offset)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def info(self, name: str) -> Optional[zipfile.ZipInfo]:
+        """Get a member's central-directory entry."""
+        entry = self.index.get(name)
+        return entry[0] if entry else None
+
+    def etag(self, name: str) -> str:
+        """Build a strong ETag from the member's CRC and size."""
+        info = self.info(name)
+        return f'"{info.CRC:08x}-{info.file_size}"'
+
+    def read(self, name: str) -> Union[memoryview, bytes]:
+        """Read a member: a zero-copy slice when stored, decompressed bytes otherwise."""
+        info, offset = self.index[name]
+        if offset is not None:
+            return memoryview(self._map)[offset:offset + info.file_size]
+        return self._zip.read(info)
+
+    def close(self):
+        """Close the archive."""
+        self._map.close()
+        self._file.close()
+        self._zip.close()
+
+def compress_type(path: Union[str, Path]) -> int:
+    """Pick the zip compression for a file: stored for compressed media, deflated otherwise."""
+    return zipfile.ZIP_STORED if Path(path).suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+def discover_members(base_path: Path, members: Tuple[str, ...] = LEAN_MEMBERS) -> Iterator[Tuple[str, Path]]:
+    """Find files to pack, keyed by their archive name relative to base_path."""
+    for member in members:
+        path = base_path / member
+        files = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+        for file in files:
+            name = file.relative_to(base_path).as_posix()
+            if not any(part.startswith('.') for part in name.split('/')):
+                yield name, file
+
+def update_zip(zip_path: Union[str, Path], base_path: Path = Path("."),
+               members: Tuple[str, ...] = LEAN_MEMBERS) -> Optional[Dict[str, int]]:
+    """Incrementally bring a zip in line with the project files.
+
+    Members are compared by size and CRC. When files were only added they
+    are appended in place; otherwise a new archive is written, copying
+    unchanged members' compressed bytes from the old one, and renamed over it.
+    """
+    try:
+        zip_path = Path(zip_path)
+        sources = dict(discover_members(base_path, members))
+        existing = {}
+        if zip_path.exists():
+            with zipfile.ZipFile(zip_path) as zf:
+                existing = {info.filename: info for info in zf.infolist() if not info.is_dir()}
+
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        changed = []
+
+        for name, path in sources.items():
+            info = existing.get(name)
+            if info is None:
+                stats['added'] += 1
+                changed.append(name)
+            elif info.file_size == path.stat().st_size and info.CRC == _file_crc(path) and \
+                    info.compress_type == compress_type(path):
+                stats['unchanged'] += 1
+            else:
+                stats['updated'] += 1
+                changed.append(name)
+        stats['removed'] = len(set(existing) - set(sources))
+
+        if stats['updated'] or stats['removed']:
+            _rewrite_zip(zip_path, sources, existing, set(changed))
+        elif changed or not zip_path.exists():
+            with zipfile.ZipFile(zip_path, 'a') as zf:
+                for name in changed:
+                    zf.write(sources[name], name, compress_type=compress_type(name))
+
+        print(f"✅ {zip_path.name}: {len(sources)} members ({stats['added']} added, {stats['updated']} updated, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged), {zip_path.stat().st_size/1024/1024:.1f}MB")
+        return stats
+
+    except Exception as e:
+        print(f"❌ Error updating {Path(zip_path).name}: {e}")
+        return None
+
+def _rewrite_zip(zip_path: Path, sources: Dict[str, Path], existing: Dict[str, zipfile.ZipInfo], changed: set):
+    """Write a fresh archive from changed files and unchanged old members, check it, then swap it in."""
+    temp_path = zip_path.with_suffix('.zip.tmp')
+
+    try:
+        with open(zip_path, 'rb') as old, zipfile.ZipFile(temp_path, 'w') as new:
+            for name in sorted(sources):
+                if name in changed:
+                    new.write(sources[name], name, compress_type=compress_type(name))
+                else:
+                    # Unchanged members come from the old archive, not the working tree
+                    _copy_raw(old, existing[name], new)
+
+        _check_raw_copies(zip_path, temp_path, [existing[name] for name in sorted(set(sources) - changed)])
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+    os.replace(temp_path, zip_path)
+
+def _copy_raw(old, info: zipfile.ZipInfo, new: zipfile.ZipFile):
+    """Copy a member's compressed bytes verbatim into an archive being written, without recompressing.
+
+    zipfile has no public API for this, so it relies on how ZipFile writes
+    in 'w' mode (as in CPython 3.11): the next local header
+    goes at new.fp.tell(), close() writes the central directory at
+    new.start_dir from new.filelist, and NameToInfo backs getinfo() and the
+    duplicate-name warning. _check_raw_copies verifies every rewrite, so a
+    change in those internals fails the update instead of corrupting the zip.
+    """
+    copy = _copy_info(info)
+    copy.CRC = info.CRC
+    copy.compress_size = info.compress_size
+    # Sizes go in the new local header, so no data descriptor follows the data
+    copy.flag_bits = info.flag_bits & ~0x08
+    copy.header_offset = new.fp.tell()
+    new.fp.write(copy.FileHeader())
+
+    for chunk in _raw_chunks(old, info):
+        new.fp.write(chunk)
+
+    new.filelist.append(copy)
+    new.NameToInfo[copy.filename] = copy
+    new.start_dir = new.fp.tell()
+
+def _raw_chunks(f, info: zipfile.ZipInfo) -> Iterator[bytes]:
+    """Read a member's compressed bytes from an open zip file in chunks."""
+    f.seek(info.header_offset)
+    header = LOCAL_HEADER.unpack(f.read(LOCAL_HEADER.size))
+    f.seek(header[9] + header[10], os.SEEK_CUR)
+
+    remaining = info.compress_size
+    while remaining:
+        chunk = f.read(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise EOFError(f"Truncated member in {info.filename}")
+        remaining -= len(chunk)
+        yield chunk
+
+def _check_raw_copies(old_path: Path, new_path: Path, copied: List[zipfile.ZipInfo]):
+    """Check a rewritten archive: every member's CRC holds and raw-copied members kept their exact bytes."""
+    with zipfile.ZipFile(new_path) as zf, open(old_path, 'rb') as old, open(new_path, 'rb') as new:
+        bad = zf.testzip()
+        if bad is not None:
+            raise zipfile.BadZipFile(f"Rewritten archive fails its CRC check at {bad}")
+
+        for info in copied:
+            written = zf.getinfo(info.filename)
+            if written.compress_size != info.compress_size or written.CRC != info.CRC or \
+                    any(a != b for a, b in zip(_raw_chunks(old, info), _raw_chunks(new, written))):
+                raise zipfile.BadZipFile(f"Raw copy of {info.filename} does not match the original")
+
+def _copy_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Clone a member's name, timestamp and compression for writing into a new archive."""
+    copy = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    copy.compress_type = info.compress_type
+    copy.external_attr = info.external_attr
+    copy.file_size = info.file_size
+    return copy
+
+def _file_crc(path: Path) -> int:
+    """Compute a file's zip CRC-32 in chunks."""
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
@@ -0,0 +1,178 @@
+"""
+Atlas Processing Module
+Packs glyph renditions of one style and size tier into sprite sheets with a JSON coordinate index.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from PIL import Image
+
+from .blobs import write_file
+from .png import PNGEncoder
+
+# Tiers rendered from full-size webp sources for styles without png tiers (meru)
+WEBP_TIERS = (64, 128, 256, 512)
+
+class AtlasBuilder:
+    def __init__(self, style: str, tier: int, base_path: Path = Path("assets/glyphs"),
+                 sheet_size: int = 2048, padding: int = 1):
+        """Initialize atlas builder for a style (celtic, meru) and size tier (64, 128, ...)."""
+        self.style = style
+        self.tier = tier
+        self.padding = padding
+        self.cell = tier + 2 * padding
+        self.columns = max(1, sheet_size // self.cell)
+        self.capacity = self.columns * self.columns
+
+        self.source_path = base_path / style / "png" / f"{tier}x{tier}"
+        self.source_pattern = "*.png"
+        if not self.source_path.exists() and (base_path / style / "webp").exists():
+            # No pre-sized tier; glyphs are downscaled from the webp originals
+            self.source_path = base_path / style / "webp"
+            self.source_pattern = "*.webp"
+        self.atlas_path = base_path / style / "atlas" / f"{tier}x{tier}"
+        self.index_file = self.atlas_path / "index.json"
+        self.encoder = PNGEncoder()
+
+    def build(self, force: bool = False) -> Optional[Dict]:
+        """Build or incrementally repack the atlas.
+
+        Unchanged glyphs keep their cell, changed glyphs are redrawn in place,
+        new glyphs fill free cells, and only sheets that changed are re-encoded.
+        """
+        try:
+            if not self.source_path.exists():
+                print(f"❌ Source directory not found: {self.source_path}")
+                return None
+
+            sources = {f.stem: f for f in sorted(self.source_path.glob(self.source_pattern))}
+            hashes = {name: hashlib.sha1(path.read_bytes()).hexdigest() for name, path in sources.items()}
+
+            index = None if force else self._load_index()
+            placements = index["glyphs"] if index else {}
+            sheet_count = len(index["sheets"]) if index else 0
+            dirty = set()
+
+            # Drop removed glyphs and mark changed ones for redraw
+            for name in list(placements):
+                if name not in sources:
+                    dirty.add(placements.pop(name)["sheet"])
+                elif placements[name]["hash"] != hashes[name]:
+                    placements[name]["hash"] = hashes[name]
+                    dirty.add(placements[name]["sheet"])
+
+            # Place new glyphs in the first free cells
+            occupied = {(p["sheet"], p["cell"]) for p in placements.values()}
+            free_cells = self._free_cells(occupied)
+            for name in sources:
+                if name in placements:
+                    continue
+                sheet, cell = next(free_cells)
+                placements[name] = {"sheet": sheet, "cell": cell, "hash": hashes[name]}
+                dirty.add(sheet)
+
+            sheet_count = max([p["sheet"] + 1 for p in placements.values()], default=0)
+            self.atlas_path.mkdir(parents=True, exist_ok=True)
+
+            # Re-render dirty sheets from source glyphs
+            sheets = index["sheets"][:sheet_count] if index else []
+            for sheet in range(sheet_count):
+                if sheet < len(sheets) and sheet not in dirty and (self.atlas_path / sheets[sheet]["file"]).exists():
+                    continue
+                members = {name: p for name, p in placements.items() if p["sheet"] == sheet}
+                info = self._render_sheet(sheet, members, sources)
+                if sheet < len(sheets):
+                    sheets[sheet] = info
+                else:
+                    sheets.append(info)
+
+            # Remove sheets left over from a larger previous atlas
+            for stale in self.atlas_path.glob("sheet_*.png"):
+                if stale.name not in {s["file"] for s in sheets}:
+                    stale.unlink()
+
+            index = {
+                "style": self.style,
+                "tier": self.tier,
+                "cell": self.cell,
+                "padding": self.padding,
+                "columns": self.columns,
+                "sheets": sheets,
+                "glyphs": dict(sorted(placements.items()))
+            }
+
+            write_file(self.index_file, json.dumps(index, indent=2).encode())
+
+            print(f"✅ Atlas {self.style} {self.tier}x{self.tier}: {len(placements)} glyphs in "
+                  f"{len(sheets)} sheet(s), {len(dirty)} repacked")
+            return index
+
+        except Exception as e:
+            print(f"❌ Error building atlas: {e}")
+            return None
+
+    def _load_index(self) -> Optional[Dict]:
+        """Load the existing index if it was built with the same layout."""
+        if not self.index_file.exists():
+            return None
+
+        with open(self.index_file, 'r') as f:
+            index = json.load(f)
+
+        if index.get("cell") != self.cell or index.get("columns") != self.columns:
+            print("⚠️ Atlas layout changed, repacking from scratch")
+            return None
+
+        return index
+
+    def _free_cells(self, occupied: set):
+        """Yield free (sheet, cell) slots, opening new sheets as needed."""
+        sheet = 0
+        while True:
+            for cell in range(self.capacity):
+                if (sheet, cell) not in occupied:
+                    yield sheet, cell
+            sheet += 1
+
+    def _cell_origin(self, cell: int) -> Tuple[int, int]:
+        """Get the top-left pixel of a glyph inside its cell."""
+        row, column = divmod(cell, self.columns)
+        return column * self.cell + self.padding, row * self.cell + self.padding
+
+    def _render_sheet(self, sheet: int, members: Dict[str, Dict], sources: Dict[str, Path]) -> Dict:
+        """Paste member glyphs onto a sheet and save it."""
+        rows = max([p["cell"] // self.columns + 1 for p in members.values()], default=1)
+        canvas = Image.new('RGBA', (self.columns * self.cell, rows * self.cell), (0, 0, 0, 0))
+
+        for name, placement in members.items():
+            glyph = Image.open(sources[name]).convert('RGBA')
+            if glyph.width > self.tier or glyph.height > self.tier:
+                # Never let a glyph spill into its neighbours' cells
+                glyph.thumbnail((self.tier, self.tier), Image.LANCZOS)
+            x, y = self._cell_origin(placement["cell"])
+            canvas.paste(glyph, (x, y))
+            placement.update({"x": x, "y": y, "w": glyph.width, "h": glyph.height})
+
+        # Sheets stay PNG so every browser can use them
+        encoding, data, _ = self.encoder.encode_smallest(canvas, ('palette', 'rgba'))
+        filename = f"sheet_{sheet}.png"
+        write_file(self.atlas_path / filename, data)
+
+        print(f"   ✅ {filename}: {len(members)} glyphs, {len(data)/1024:.1f}KB ({encoding})")
+        return {"file": filename, "width": canvas.width, "height": canvas.height}
+
+def list_tiers(style: str, base_path: Path = Path("assets/glyphs")) -> List[int]:
+    """List size tiers available for a style."""
+    png_path = base_path / style / "png"
+    if not png_path.exists():
+        return list(WEBP_TIERS) if (base_path / style / "webp").exists() else []
+
+    tiers = []
+    for folder in png_path.iterdir():
+        width, _, height = folder.name.partition('x')
+        if folder.is_dir() and width.isdigit() and width == height:
+            tiers.append(int(width))
+
+    return sorted(tiers)
@@ -0,0 +1,266 @@
+"""
+Blob Store Module
+Content-addressed storage for generated assets: writers produce plain files, and dedupe then keeps
+each distinct file once under its hash, with per-style/per-size paths hardlinked to it and tracked in a manifest.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import urllib.request
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from PIL import Image
+
+# Generated asset types managed by the store; JSON metadata is small, never duplicated
+# and rewritten in place by many writers, so it is left out
+MANAGED_SUFFIXES = ('.png', '.webp', '.svg')
+
+TIER_FOLDER = re.compile(r'^(\d+)x(\d+)$')
+BACKUP_NAME = re.compile(r'_backup_\d+$')
+
+@contextmanager
+def replace_file(path: Union[str, Path], mode: str = 'wb', encoding: Optional[str] = None):
+    """Open a sibling temp file for writing and rename it over path once the block succeeds.
+
+    Deduplicated asset paths are hardlinks to a shared blob; writing in
+    place would change every linked copy and the blob itself, while the
+    rename gives the path a new inode of its own. Readers never see a
+    partly written file.
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+def write_file(path: Union[str, Path], data: bytes):
+    """Replace a file's contents through replace_file."""
+    with replace_file(path) as f:
+        f.write(data)
+
+def save_image(img: Image.Image, path: Union[str, Path], format: str, **params):
+    """Save an image like Image.save, but through write_file so hardlinked copies are left alone."""
+    buffer = io.BytesIO()
+    img.save(buffer, format, **params)
+    write_file(path, buffer.getvalue())
+
+def copy_file(source: Union[str, Path], path: Union[str, Path]):
+    """Copy a file like shutil.copy2, but through write_file so hardlinked copies are left alone."""
+    write_file(path, Path(source).read_bytes())
+    shutil.copystat(source, path)
+
+def download_file(url: str, path: Union[str, Path]):
+    """Download a URL like urlretrieve, but through write_file so hardlinked copies are left alone."""
+    with urllib.request.urlopen(url) as response:
+        write_file(path, response.read())
+
+class BlobStore:
+    def __init__(self, root: Path = Path("assets"), blob_dir: Optional[Path] = None):
+        """Initialize blob store for the asset tree under root (blobs in root/.blobs)."""
+        self.root = Path(root)
+        self.blob_dir = Path(blob_dir) if blob_dir else self.root / ".blobs"
+        self.manifest_file = self.blob_dir / "manifest.json"
+        self.manifest = self._load_manifest()
+
+    def ingest(self, path: Path) -> Optional[str]:
+        """Move an existing file into the store, replacing it with a link to its blob.
+
+        Returns the content hash, or None when the file could not be linked
+        (the store is on another device); it then stays a separate copy and
+        is left out of the manifest.
+        """
+        path = Path(path)
+        digest = self._hash_file(path)
+        blob = self.blob_path(digest)
+
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, blob)
+            except OSError:
+                blob.write_bytes(path.read_bytes())
+        if not os.path.samefile(blob, path):
+            self._link(blob, path)
+
+        if not os.path.samefile(blob, path):
+            self.manifest.pop(self._key(path), None)
+            return None
+        self.manifest[self._key(path)] = digest
+        return digest
+
+    def blob_path(self, digest: str) -> Path:
+        """Get the blob file for a content hash."""
+        return self.blob_dir / digest[:2] / digest
+
+    def dedupe(self, write: bool = False) -> Dict:
+        """Ingest every managed file, collapsing identical content onto one blob."""
+        files = list(self._discover())
+        groups = defaultdict(list)
+        for path in files:
+            groups[self._hash_file(path)].append(path)
+
+        duplicates = {digest: paths for digest, paths in groups.items() if len(paths) > 1}
+        reclaimable = 0
+        for paths in duplicates.values():
+            inodes = {(p.stat().st_dev, p.stat().st_ino) for p in paths}
+            reclaimable += paths[0].stat().st_size * (len(inodes) - 1)
+
+        for digest, paths in sorted(duplicates.items(), key=lambda item: item[1][0]):
+            print(f"   🔗 {len(paths)} copies ({paths[0].stat().st_size/1024:.1f}KB): "
+                  f"{', '.join(str(p.relative_to(self.root)) for p in paths)}")
+
+        unlinked = 0
+        if write:
+            for path in files:
+                try:
+                    if self.ingest(path) is None:
+                        unlinked += 1
+                except Exception as e:
+                    print(f"❌ Error ingesting {path}: {e}")
+            self._save_manifest()
+            if unlinked:
+                print(f"⚠️ {unlinked} files could not be hardlinked to {self.blob_dir} "
+                      f"(another device?) and were kept as separate copies")
+
+        print(f"✅ {len(files)} files, {len(groups)} unique, {len(duplicates)} duplicated "
+              f"({reclaimable/1024:.1f}KB reclaimable)")
+        if not write:
+            print("ℹ️ Dry run - pass --write to link duplicates to shared blobs")
+
+        return {'files': len(files), 'unique': len(groups), 'duplicated': len(duplicates), 'reclaimable': reclaimable,
+                'unlinked': unlinked}
+
+    def gc(self, write: bool = False) -> Dict:
+        """Drop manifest entries for deleted paths and blobs nothing references.
+
+        A blob with other hardlinks is still some file's content, even when
+        the manifest lost track of it, so it is kept. A blob whose content no
+        longer matches its hash was rewritten in place through a link; its
+        store name and manifest entries are dropped so dedupe can re-ingest.
+        """
+        blobs = [blob for blob in self.blob_dir.glob("??/*") if blob.suffix != '.tmp']
+        corrupt = {blob.name for blob in blobs if self._hash_file(blob) != blob.name}
+        stale = [key for key, digest in self.manifest.items()
+                 if digest in corrupt or not (self.root / key).exists() or
+                 Path(key).suffix.lower() not in MANAGED_SUFFIXES]
+        live = {digest for key, digest in self.manifest.items() if key not in stale}
+        orphans = [blob for blob in blobs if blob.name in corrupt or
+                   (blob.name not in live and blob.stat().st_nlink == 1)]
+        freed = sum(blob.stat().st_size for blob in orphans if blob.stat().st_nlink == 1)
+
+        for blob in orphans:
+            marker = "⚠️ corrupt" if blob.name in corrupt else "🗑️"
+            print(f"   {marker} {blob.name[:12]}: {blob.stat().st_size/1024:.1f}KB")
+
+        if write:
+            for key in stale:
+                del self.manifest[key]
+            for blob in orphans:
+                blob.unlink()
+            self._save_manifest()
+
+        print(f"✅ {len(stale)} stale references, {len(orphans)} orphan blobs ({len(corrupt)} corrupt), "
+              f"{freed/1024:.1f}KB freed")
+        if corrupt:
+            print("ℹ️ Run dedupe --write to re-ingest files whose blobs were rewritten in place")
+        return {'stale': len(stale), 'orphans': len(orphans), 'corrupt': len(corrupt), 'freed': freed}
+
+    def stats(self) -> Dict:
+        """Report logical vs physical size and suspicious files in the tree."""
+        files = list(self._discover())
+        logical = sum(path.stat().st_size for path in files)
+        inodes = {}
+        for path in files:
+            stat = path.stat()
+            inodes[(stat.st_dev, stat.st_ino)] = stat.st_size
+
+        backups = [path for path in files if BACKUP_NAME.search(path.stem)]
+        misplaced = self._misplaced(files)
+
+        print(f"📊 Files: {len(files)} ({len(self.manifest)} in manifest)")
+        print(f"📊 Logical size: {logical/1024/1024:.2f}MB")
+        print(f"📊 Physical size: {sum(inodes.values())/1024/1024:.2f}MB")
+        print(f"📊 Backup files: {len(backups)}")
+        for path in backups:
+            print(f"   - {path.relative_to(self.root)}")
+        print(f"📊 Renditions in the wrong size folder: {len(misplaced)}")
+        for path, size in misplaced:
+            print(f"   - {path.relative_to(self.root)} is {size[0]}x{size[1]}")
+
+        return {
+            'files': len(files),
+            'logical_bytes': logical,
+            'physical_bytes': sum(inodes.values()),
+            'backups': [str(path) for path in backups],
+            'misplaced': [str(path) for path, _ in misplaced]
+        }
+
+    def _misplaced(self, files: List[Path]) -> List:
+        """Find images in NxN folders whose dimensions fit a different tier."""
+        misplaced = []
+        for path in files:
+            match = TIER_FOLDER.match(path.parent.name)
+            if not match or path.suffix.lower() not in ('.png', '.webp'):
+                continue
+            with Image.open(path) as img:
+                size = img.size
+            # Renditions keep aspect ratio, so the longer side must match the tier
+            if max(size) != max(int(match.group(1)), int(match.group(2))):
+                misplaced.append((path, size))
+        return misplaced
+
+    def _link(self, blob: Path, path: Path):
+        """Point path at a blob with a hardlink, falling back to a copy across devices."""
+        temp_file = path.with_name(f".{path.name}.link")
+        try:
+            os.link(blob, temp_file)
+        except OSError:
+            temp_file.write_bytes(blob.read_bytes())
+        os.replace(temp_file, path)
+
+    def _discover(self):
+        """Find managed files, skipping hidden folders such as the blob store itself."""
+        for path in sorted(self.root.rglob("*")):
+            relative = path.relative_to(self.root).parts
+            if path.is_file() and path.suffix.lower() in MANAGED_SUFFIXES and \
+                    not any(part.startswith('.') for part in relative):
+                yield path
+
+    def _key(self, path: Path) -> str:
+        """Get the manifest key of a path under root."""
+        return Path(os.path.abspath(path)).relative_to(os.path.abspath(self.root)).as_posix()
+
+    def _hash_file(self, path: Path) -> str:
+        """Hash a file in chunks."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_manifest(self) -> Dict[str, str]:
+        """Load the path-to-hash manifest."""
+        if not self.manifest_file.exists():
+            return {}
+        with open(self.manifest_file, 'r') as f:
+            return json.load(f)
+
+    def _save_manifest(self):
+        """Write the manifest atomically."""
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.manifest_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(dict(sorted(self.manifest.items())), f, indent=2)
+        os.replace(temp_file, self.manifest_file)
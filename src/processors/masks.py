@@ -0,0 +1,180 @@
+"""
+Mask Store Module
+Keeps every glyph's coverage mask at each size tier in one memory-mapped file with an offset index.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from PIL import Image
+
+from .blobs import write_file
+from .tint import coverage_mask
+
+# Size tiers from assets/metadata/dreamscape_config.json zoom levels
+DEFAULT_TIERS = (64, 128, 256, 512)
+
+# How masks are derived; stores built another way are rebuilt from scratch
+COVERAGE = "ink"
+
+class MaskStore:
+    def __init__(self, root: Path = Path("assets/masks"), glyph_root: Path = Path("assets/glyphs"),
+                 tiers: Tuple[int, ...] = DEFAULT_TIERS, compact_ratio: float = 0.5):
+        """Initialize mask store backed by root/masks.bin and root/index.json."""
+        self.root = Path(root)
+        self.glyph_root = Path(glyph_root)
+        self.tiers = tuple(tiers)
+        self.compact_ratio = compact_ratio
+        self.data_file = self.root / "masks.bin"
+        self.index_file = self.root / "index.json"
+        self.index = self._load_index()
+        self._data = None
+
+    def get(self, glyph: str, tier: int) -> Optional[np.ndarray]:
+        """Get a read-only mask view for 'style/name' at a tier without decoding."""
+        entry = self.index["glyphs"].get(glyph)
+        if entry is None or str(tier) not in entry["masks"]:
+            return None
+
+        offset, height, width = entry["masks"][str(tier)]
+        data = self._mapped()
+        return data[offset:offset + height * width].reshape(height, width)
+
+    def glyphs(self) -> List[str]:
+        """List glyphs in the store."""
+        return sorted(self.index["glyphs"])
+
+    def __contains__(self, glyph: str) -> bool:
+        return glyph in self.index["glyphs"]
+
+    def build(self) -> Dict[str, int]:
+        """Incrementally rebuild the store from the glyph tree.
+
+        Masks of new or changed glyphs are appended to the data file; stale
+        bytes are counted as garbage and reclaimed by compaction once they
+        exceed compact_ratio of the file.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        sources = dict(discover_sources(self.glyph_root))
+        glyphs = self.index["glyphs"]
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+        for glyph in list(glyphs):
+            if glyph not in sources:
+                self.index["garbage"] += self._entry_bytes(glyphs.pop(glyph))
+                stats['removed'] += 1
+
+        with open(self.data_file, 'ab') as f:
+            for glyph, source in sorted(sources.items()):
+                stat = source.stat()
+                entry = glyphs.get(glyph)
+                fresh = {"source": str(source), "mtime_ns": stat.st_mtime_ns, "bytes": stat.st_size}
+
+                if entry and all(entry[k] == v for k, v in fresh.items()) and \
+                        all(str(t) in entry["masks"] for t in self.tiers):
+                    stats['unchanged'] += 1
+                    continue
+
+                try:
+                    masks = {}
+                    for tier, mask in self._render_tiers(source):
+                        masks[str(tier)] = [f.tell(), mask.shape[0], mask.shape[1]]
+                        f.write(mask.tobytes())
+                except Exception as e:
+                    print(f"❌ Error building masks for {glyph}: {e}")
+                    continue
+
+                if entry:
+                    self.index["garbage"] += self._entry_bytes(entry)
+                    stats['updated'] += 1
+                else:
+                    stats['added'] += 1
+                glyphs[glyph] = {**fresh, "masks": masks}
+
+        self._data = None
+        total = self.data_file.stat().st_size
+        if total and self.index["garbage"] / total > self.compact_ratio:
+            self.compact()
+        else:
+            self._save_index()
+
+        print(f"✅ Mask store: {len(glyphs)} glyphs ({stats['added']} added, {stats['updated']} updated, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged)")
+        return stats
+
+    def compact(self):
+        """Rewrite the data file with only live masks."""
+        data = self._mapped()
+        temp_file = self.data_file.with_suffix('.bin.tmp')
+
+        with open(temp_file, 'wb') as f:
+            for entry in self.index["glyphs"].values():
+                for tier, (offset, height, width) in entry["masks"].items():
+                    length = height * width
+                    entry["masks"][tier] = [f.tell(), height, width]
+                    f.write(data[offset:offset + length].tobytes())
+
+        self._data = None
+        os.replace(temp_file, self.data_file)
+        self.index["garbage"] = 0
+        self._save_index()
+        print(f"🧹 Compacted mask store: {self.data_file.stat().st_size/1024:.1f}KB")
+
+    def _render_tiers(self, source: Path) -> Iterator[Tuple[int, np.ndarray]]:
+        """Decode a source once and yield its mask fitted to each tier."""
+        img = Image.open(source).convert('RGBA')
+        mask = Image.fromarray(coverage_mask(img), 'L')
+
+        for tier in self.tiers:
+            tiered = mask.copy()
+            tiered.thumbnail((tier, tier), Image.Resampling.LANCZOS)
+            yield tier, np.ascontiguousarray(np.array(tiered, dtype=np.uint8))
+
+    def _entry_bytes(self, entry: Dict) -> int:
+        """Count the data bytes referenced by an index entry."""
+        return sum(height * width for _, height, width in entry["masks"].values())
+
+    def _mapped(self) -> np.ndarray:
+        """Memory-map the data file read-only (pages are shared across processes)."""
+        if self._data is None:
+            if not self.data_file.exists() or self.data_file.stat().st_size == 0:
+                return np.zeros(0, dtype=np.uint8)
+            self._data = np.memmap(self.data_file, dtype=np.uint8, mode='r')
+        return self._data
+
+    def _load_index(self) -> Dict:
+        """Load the offset index, starting empty if the data file is missing."""
+        if self.index_file.exists() and self.data_file.exists():
+            with open(self.index_file, 'r') as f:
+                index = json.load(f)
+            if index.get("tiers") == list(self.tiers) and index.get("coverage") == COVERAGE:
+                return index
+            print("⚠️ Mask store tiers or coverage changed, rebuilding from scratch")
+
+        if self.data_file.exists():
+            self.data_file.unlink()
+        return {"tiers": list(self.tiers), "coverage": COVERAGE, "garbage": 0, "glyphs": {}}
+
+    def _save_index(self):
+        """Write the index atomically."""
+        write_file(self.index_file, json.dumps(self.index, indent=2).encode())
+
+def discover_sources(glyph_root: Path = Path("assets/glyphs")) -> Iterator[Tuple[str, Path]]:
+    """Find the largest source image for each style/name glyph."""
+    best = {}
+    patterns = ["*/png/original/*.png", "*/png/*.png", "*/webp/*.webp", "*/png/*x*/*.png"]
+
+    # Earlier patterns win, larger tier folders win within the last pattern
+    for rank, pattern in enumerate(patterns):
+        for path in Path(glyph_root).glob(pattern):
+            style = path.relative_to(glyph_root).parts[0]
+            key = f"{style}/{path.stem}"
+            size_rank = -int(path.parent.name.split('x')[0]) if path.parent.name[0].isdigit() else 0
+            score = (rank, size_rank)
+            if key not in best or score < best[key][0]:
+                best[key] = (score, path)
+
+    for key, (_, path) in best.items():
+        yield key, path
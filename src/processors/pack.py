@@ -0,0 +1,211 @@
+"""
+Glyph Pack Module
+Stores every rendition and metadata record in one binary pack, read through mmap with a name/tier/format index.
+
+Layout: a fixed header (magic, version, index offset, index length) followed
+by the data blobs and a JSON index. Updates append new blobs and a new index,
+then rewrite the header, so the previous index stays valid until the end.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b'GLYPACK1'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQ')
+
+# File types packed from the asset tree
+PACKED_SUFFIXES = ('.png', '.webp', '.svg', '.json')
+
+class GlyphPack:
+    def __init__(self, pack_file: Path = Path("assets/glyphs.pack"), root: Path = Path("assets"),
+                 compact_ratio: float = 0.5):
+        """Initialize a pack of the asset tree under root."""
+        self.pack_file = Path(pack_file)
+        self.root = Path(root)
+        self.compact_ratio = compact_ratio
+        self.index = {"garbage": 0, "entries": {}}
+        self._file = None
+        self._map = None
+
+        if self.pack_file.exists():
+            self._open()
+
+    def get(self, key: str) -> Optional[memoryview]:
+        """Get a zero-copy view of a packed file by its path relative to root."""
+        entry = self.index["entries"].get(key)
+        if entry is None:
+            return None
+        return memoryview(self._map)[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def entry(self, key: str) -> Optional[Dict]:
+        """Get the index entry of a packed file."""
+        return self.index["entries"].get(key)
+
+    def find(self, style: Optional[str] = None, name: Optional[str] = None, tier: Optional[str] = None,
+             format: Optional[str] = None) -> List[str]:
+        """List keys matching the given style, name, tier and format."""
+        wanted = {"style": style, "name": name, "tier": tier, "format": format}
+        return sorted(key for key, entry in self.index["entries"].items()
+                      if all(value is None or entry[field] == value for field, value in wanted.items()))
+
+    def keys(self) -> List[str]:
+        """List packed files."""
+        return sorted(self.index["entries"])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index["entries"]
+
+    def update(self) -> Dict[str, int]:
+        """Bring the pack in line with the asset tree.
+
+        New and changed files are appended after the current index; replaced
+        data and the old index are counted as garbage and reclaimed by
+        compaction once they exceed compact_ratio of the pack.
+        """
+        sources = dict(self._discover())
+        entries = self.index["entries"]
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        appended = []
+
+        for key in list(entries):
+            if key not in sources:
+                self.index["garbage"] += entries.pop(key)["length"]
+                stats['removed'] += 1
+
+        for key, path in sorted(sources.items()):
+            stat = path.stat()
+            entry = entries.get(key)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["length"] == stat.st_size:
+                stats['unchanged'] += 1
+                continue
+
+            data = path.read_bytes()
+            sha1 = hashlib.sha1(data).hexdigest()
+            if entry and entry["sha1"] == sha1:
+                entry["mtime_ns"] = stat.st_mtime_ns
+                stats['unchanged'] += 1
+                continue
+
+            if entry:
+                self.index["garbage"] += entry["length"]
+                stats['updated'] += 1
+            else:
+                stats['added'] += 1
+            appended.append((key, path, stat, data, sha1))
+
+        if appended or stats['removed'] or not self.pack_file.exists():
+            self._append(appended)
+
+        total = self.pack_file.stat().st_size
+        if total and self.index["garbage"] / total > self.compact_ratio:
+            self.compact()
+
+        print(f"✅ Glyph pack: {len(entries)} files ({stats['added']} added, {stats['updated']} updated, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged)")
+        return stats
+
+    def compact(self):
+        """Rewrite the pack with only live data."""
+        temp_file = self.pack_file.with_suffix('.pack.tmp')
+        entries = self.index["entries"]
+
+        with open(temp_file, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+            for key in sorted(entries):
+                entry = entries[key]
+                data = self.get(key)
+                entry["offset"] = f.tell()
+                f.write(data)
+                data.release()
+
+            self.index["garbage"] = 0
+            self._write_index(f)
+
+        self.close()
+        os.replace(temp_file, self.pack_file)
+        self._open()
+        print(f"🧹 Compacted glyph pack: {self.pack_file.stat().st_size/1024/1024:.1f}MB")
+
+    def close(self):
+        """Release the memory map."""
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+    def _append(self, appended: List[Tuple[str, Path, os.stat_result, bytes, str]]):
+        """Append blobs and a new index, then point the header at it."""
+        new_pack = not self.pack_file.exists()
+        if new_pack:
+            self.pack_file.parent.mkdir(parents=True, exist_ok=True)
+            self.pack_file.write_bytes(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+        self.close()
+        with open(self.pack_file, 'r+b') as f:
+            _, _, _, index_offset, index_length = HEADER.unpack(f.read(HEADER.size))
+            self.index["garbage"] += index_length
+
+            f.seek(0, os.SEEK_END)
+            for key, path, stat, data, sha1 in appended:
+                self.index["entries"][key] = {
+                    **self._describe(key),
+                    "offset": f.tell(),
+                    "length": len(data),
+                    "sha1": sha1,
+                    "mtime_ns": stat.st_mtime_ns
+                }
+                f.write(data)
+
+            self._write_index(f)
+        self._open()
+
+    def _write_index(self, f):
+        """Write the index at the end of an open pack and point the header at it."""
+        index_offset = f.tell()
+        index_data = json.dumps(self.index, separators=(',', ':')).encode()
+        f.write(index_data)
+        f.flush()
+        os.fsync(f.fileno())
+
+        # The header only changes once the new index is on disk
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, index_offset, len(index_data)))
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _open(self):
+        """Map the pack and load its index."""
+        self._file = open(self.pack_file, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, index_offset, index_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a glyph pack: {self.pack_file}")
+
+        if index_length:
+            self.index = json.loads(self._map[index_offset:index_offset + index_length])
+
+    def _discover(self) -> Iterator[Tuple[str, Path]]:
+        """Find packable files under root, keyed by their relative path."""
+        for path in sorted(self.root.rglob("*")):
+            key = path.relative_to(self.root).as_posix()
+            if path.suffix.lower() in PACKED_SUFFIXES and path.is_file() and \
+                    not any(part.startswith('.') for part in key.split('/')):
+                yield key, path
+
+    def _describe(self, key: str) -> Dict[str, Optional[str]]:
+        """Derive style, name, tier and format from a key like glyphs/celtic/png/64x64/name.png."""
+        parts = key.split('/')
+        stem, _, suffix = parts[-1].rpartition('.')
+        style = parts[1] if parts[0] == "glyphs" and len(parts) > 2 else None
+        folders = parts[2:-1] if style else parts[1:-1]
+        tier = next((folder for folder in folders if folder == "original" or 'x' in folder and
+                     folder.replace('x', '').isdigit()), None)
+        return {"style": style, "name": stem, "tier": tier, "format": suffix.lower()}
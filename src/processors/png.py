@@ -0,0 +1,169 @@
+"""
+PNG Processing Module
+Handles raster rendition encoding: indexed-palette quantization, format selection, border trimming and size reporting.
+"""
+
+import io
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+import numpy as np
+from PIL import Image
+
+from .blobs import write_file
+
+# Encodings considered when picking the smallest rendition
+ENCODINGS = ('palette', 'rgba', 'webp')
+
+def content_bbox(img: Image.Image, threshold: int = 30) -> Optional[Tuple[int, int, int, int]]:
+    """Get the bounding box of glyph content, or None for an empty image.
+
+    Uses the alpha channel when the image has transparency, otherwise the
+    pixels brighter than threshold (glyphs on a black background).
+    """
+    if 'A' in img.getbands():
+        alpha = img.getchannel('A')
+        if alpha.getextrema()[0] < 255:
+            return alpha.getbbox()
+
+    return img.convert('L').point(lambda value: 255 if value > threshold else 0).getbbox()
+
+def trim(img: Image.Image, padding: int = 4, threshold: int = 30) -> Tuple[Image.Image, Dict]:
+    """Crop empty borders around a glyph, keeping padding pixels of margin.
+
+    Returns the cropped image and its placement on the original canvas, so
+    layout can put the trimmed rendition back where the full canvas had it.
+    """
+    width, height = img.size
+    bbox = content_bbox(img, threshold)
+
+    if bbox is None:
+        left, top, right, bottom = 0, 0, width, height
+    else:
+        left = max(bbox[0] - padding, 0)
+        top = max(bbox[1] - padding, 0)
+        right = min(bbox[2] + padding, width)
+        bottom = min(bbox[3] + padding, height)
+
+    cropped = img if (left, top, right, bottom) == (0, 0, width, height) else img.crop((left, top, right, bottom))
+    return cropped, {
+        'canvas': [width, height],
+        'offset': [left, top],
+        'size': [right - left, bottom - top]
+    }
+
+def scale_placement(placement: Dict, size: Tuple[int, int]) -> Dict:
+    """Scale a trim placement to a rendition of the trimmed image resized to size."""
+    scale_x = size[0] / placement['size'][0]
+    scale_y = size[1] / placement['size'][1]
+    return {
+        'canvas': [round(placement['canvas'][0] * scale_x, 2), round(placement['canvas'][1] * scale_y, 2)],
+        'offset': [round(placement['offset'][0] * scale_x, 2), round(placement['offset'][1] * scale_y, 2)],
+        'size': list(size)
+    }
+
+class PNGEncoder:
+    def __init__(self, colors: int = 64, alpha_levels: int = 16, webp_quality: int = 85):
+        """Initialize PNG encoder with palette and WebP settings."""
+        self.colors = colors
+        self.alpha_levels = alpha_levels
+        self.webp_quality = webp_quality
+
+    def quantize(self, img: Image.Image) -> Image.Image:
+        """Quantize a two-tone glyph to a small palette with a tRNS alpha table.
+
+        Colors and alpha are quantized separately so anti-aliased edges keep
+        their coverage ramp instead of collapsing onto a handful of entries.
+        """
+        data = np.array(img.convert('RGBA'))
+        alpha = data[:, :, 3]
+
+        # Alpha levels: exact when the glyph has few, evenly spaced otherwise
+        alpha_values = np.unique(alpha[alpha > 0])
+        if len(alpha_values) <= self.alpha_levels:
+            levels = alpha_values
+        else:
+            levels = np.round(np.linspace(255 / self.alpha_levels, 255, self.alpha_levels)).astype(np.uint8)
+
+        # Pixels closer to transparent than to the first level stay transparent
+        visible = alpha > (levels[0] / 2 if len(levels) else 255)
+        index = np.zeros(alpha.shape, dtype=np.uint8)
+
+        if not visible.any():
+            result = Image.fromarray(index, 'P')
+            result.putpalette([0, 0, 0])
+            result.info['transparency'] = bytes([0])
+            return result
+
+        # Quantize ink colors of visible pixels only (index 0 is reserved)
+        n_colors = max(1, min(self.colors, 255 // len(levels)))
+        strip = Image.fromarray(data[:, :, :3][visible].reshape(1, -1, 3), 'RGB')
+        strip = strip.quantize(colors=n_colors, method=Image.Quantize.MEDIANCUT)
+        color_index = np.array(strip).reshape(-1).astype(np.int32)
+        inks = np.array(strip.getpalette()[:3 * n_colors], dtype=np.uint8).reshape(-1, 3)
+
+        # Nearest alpha level per visible pixel
+        midpoints = (levels[:-1].astype(np.float64) + levels[1:]) / 2
+        alpha_index = np.searchsorted(midpoints, alpha[visible])
+        index[visible] = 1 + color_index * len(levels) + alpha_index
+
+        # Palette is inks x alpha levels, entry 0 fully transparent
+        palette = np.zeros((1 + len(inks) * len(levels), 3), dtype=np.uint8)
+        palette[1:] = np.repeat(inks, len(levels), axis=0)
+        trns = np.zeros(len(palette), dtype=np.uint8)
+        trns[1:] = np.tile(levels, len(inks))
+
+        result = Image.fromarray(index, 'P')
+        result.putpalette(palette.tobytes())
+        result.info['transparency'] = trns.tobytes()
+        return result
+
+    def encode(self, img: Image.Image, encoding: str) -> bytes:
+        """Encode an image with the given encoding ('palette', 'rgba' or 'webp')."""
+        buffer = io.BytesIO()
+
+        if encoding == 'palette':
+            self.quantize(img).save(buffer, 'PNG', optimize=True)
+        elif encoding == 'rgba':
+            img.convert('RGBA').save(buffer, 'PNG', optimize=True, compress_level=9)
+        elif encoding == 'webp':
+            img.convert('RGBA').save(buffer, 'WEBP', quality=self.webp_quality, method=6)
+        else:
+            raise ValueError(f"Unknown encoding: {encoding}")
+
+        return buffer.getvalue()
+
+    def encode_smallest(self, img: Image.Image, encodings: Tuple[str, ...] = ENCODINGS) -> Tuple[str, bytes, Dict[str, int]]:
+        """Encode with every candidate and return (encoding, data, candidate sizes)."""
+        candidates = {encoding: self.encode(img, encoding) for encoding in encodings}
+        best = min(candidates, key=lambda encoding: len(candidates[encoding]))
+        return best, candidates[best], {encoding: len(data) for encoding, data in candidates.items()}
+
+    def save(self, img: Image.Image, output_path: Union[str, Path], encoding: str = 'smallest') -> Optional[Dict]:
+        """Save an image with the given encoding and return size information.
+
+        With 'smallest' the output suffix follows the winning format, so a
+        WebP winner is written next to the requested PNG path.
+        """
+        try:
+            output_path = Path(output_path)
+
+            if encoding == 'smallest':
+                encoding, data, candidates = self.encode_smallest(img)
+            else:
+                data = self.encode(img, encoding)
+                candidates = {encoding: len(data)}
+
+            suffix = '.webp' if encoding == 'webp' else '.png'
+            output_path = output_path.with_suffix(suffix)
+            write_file(output_path, data)
+
+            return {
+                'path': output_path,
+                'encoding': encoding,
+                'size': len(data),
+                'candidates': candidates
+            }
+
+        except Exception as e:
+            print(f"❌ Error encoding {Path(output_path).name}: {e}")
+            return None
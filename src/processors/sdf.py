@@ -0,0 +1,222 @@
+"""
+SDF Processing Module
+Builds signed distance field textures from glyph coverage masks, so one file renders crisp outlines at every zoom.
+"""
+
+import io
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from PIL import Image
+from scipy import ndimage
+
+from .blobs import write_file
+from .masks import discover_sources
+from .tint import coverage_mask
+
+# Ladder tiers the SDF replaces, from assets/metadata/dreamscape_config.json zoom levels
+LADDER_TIERS = (64, 128, 256, 512)
+
+# Celtic strokes are a few source pixels wide, so the texture must resolve them at the 512 tier;
+# a spread of 8 texels still covers one screen pixel at the 64 tier
+DEFAULT_SIZE = 512
+DEFAULT_SPREAD = 8.0
+
+# A tier passes when the SDF keeps this share of the fidelity exact source coverage reaches
+MIN_FIDELITY = 0.8
+
+class SDFGenerator:
+    def __init__(self, size: int = DEFAULT_SIZE, spread: float = DEFAULT_SPREAD, threshold: int = 128, background_threshold: int = 30,
+                 supersample: int = 8):
+        """Initialize SDF generator.
+
+        size is the texture edge in pixels; spread is the distance in texture
+        pixels on either side of the outline covered by the 0..255 range.
+        Sources larger than supersample x size are reduced before the
+        distance transforms, which is far more precision than a texel holds.
+        """
+        if spread <= 0 or size <= 2 * spread:
+            raise ValueError(f"SDF size ({size}) must be larger than twice the spread ({spread}), and spread positive")
+        self.size = size
+        self.spread = spread
+        self.threshold = threshold
+        self.background_threshold = background_threshold
+        self.supersample = supersample
+
+    def coverage(self, img: Image.Image) -> np.ndarray:
+        """Get glyph coverage: alpha when transparent, anti-aliased ink brightness otherwise."""
+        return coverage_mask(img, self.background_threshold)
+
+    def generate(self, img: Image.Image) -> Image.Image:
+        """Build an SDF texture; 128 marks the outline, higher values are inside."""
+        mask = self.coverage(img)
+        limit = self.size * self.supersample
+        if max(mask.shape) > limit:
+            reduced = Image.fromarray(mask, 'L')
+            reduced.thumbnail((limit, limit), Image.Resampling.BOX)
+            mask = np.array(reduced)
+        height, width = mask.shape
+
+        # Center on a square canvas with room for the spread outside the glyph
+        edge = self.canvas_edge(max(height, width))
+        scale = edge / self.size
+        canvas = np.zeros((edge, edge), dtype=np.uint8)
+        top, left = (edge - height) // 2, (edge - width) // 2
+        canvas[top:top + height, left:left + width] = mask
+
+        signed = self.signed_distance(canvas)
+
+        # Interpolate the exact field at texel centers, distances in texture pixels
+        centers = (np.arange(self.size) + 0.5) * scale - 0.5
+        rows, columns = np.meshgrid(centers, centers, indexing='ij')
+        field = ndimage.map_coordinates(signed, [rows, columns], order=1, mode='nearest') / scale
+
+        encoded = 128 - field * (127 / self.spread)
+        return Image.fromarray(np.clip(np.round(encoded), 0, 255).astype(np.uint8), 'L')
+
+    def canvas_edge(self, extent: int) -> int:
+        """Get the source-pixel edge of the square canvas a glyph extent is centered on."""
+        margin = int(np.ceil(self.spread * extent / (self.size - 2 * self.spread)))
+        return extent + 2 * margin
+
+    def signed_distance(self, mask: np.ndarray) -> np.ndarray:
+        """Signed distance in pixels to the outline of a coverage mask, negative inside.
+
+        Exact Euclidean transforms give the distance to the far side of the
+        outline; anti-aliased pixels on the outline use their coverage
+        instead, which keeps the sub-pixel edge position of the source.
+        Partial coverage away from the outline (noisy solid ink) is ignored.
+        """
+        inside = mask >= self.threshold
+        outside_distance = ndimage.distance_transform_edt(~inside)
+        inside_distance = ndimage.distance_transform_edt(inside)
+        signed = np.where(inside, 0.5 - inside_distance, outside_distance - 0.5)
+
+        partial = (mask > 0) & (mask < 255) & (np.abs(signed) < 1)
+        signed[partial] = 0.5 - mask[partial] / 255.0
+        return signed
+
+    def reconstruct(self, sdf: Image.Image, size: int, window: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """Render an SDF texture as 0..1 glyph coverage at any size, like an SDF shader does.
+
+        window is the (start, length) texel span to render on both axes,
+        the whole texture by default. Each pixel center samples the texture
+        with plain bilinear interpolation, as a GPU texture lookup does; a
+        resampling filter would average the field across thin lines. The
+        edge is anti-aliased over one output pixel, so strokes thinner than
+        a pixel stay visible at partial coverage instead of vanishing.
+        """
+        start, length = window or (0.0, float(sdf.width))
+        centers = start + (np.arange(size) + 0.5) * length / size - 0.5
+        rows, columns = np.meshgrid(centers, centers, indexing='ij')
+        field = ndimage.map_coordinates(np.array(sdf, dtype=np.float32), [rows, columns], order=1, mode='nearest')
+        distance = (128 - field) * (self.spread / 127) * (size / length)
+        return np.clip(0.5 - distance, 0, 1)
+
+    def glyph_window(self, extent: int) -> Tuple[float, float]:
+        """Get the (start, length) texel span covering a glyph extent inside its spread margin."""
+        edge = self.canvas_edge(extent)
+        scale = edge / self.size
+        return ((edge - extent) // 2) / scale, extent / scale
+
+    def encode(self, sdf: Image.Image) -> bytes:
+        """Encode an SDF texture as grayscale PNG."""
+        buffer = io.BytesIO()
+        sdf.save(buffer, 'PNG', optimize=True)
+        return buffer.getvalue()
+
+def build_sdf_codex(glyph_root: Path = Path("assets/glyphs"), styles: Optional[List[str]] = None,
+                    size: int = DEFAULT_SIZE, spread: float = DEFAULT_SPREAD) -> Dict[str, Dict]:
+    """Build an SDF texture for every glyph into <style>/sdf/ with an index.json per style."""
+    generator = SDFGenerator(size=size, spread=spread)
+    indexes = {}
+
+    for glyph, source in sorted(discover_sources(glyph_root)):
+        style, name = glyph.split('/', 1)
+        if styles and style not in styles:
+            continue
+
+        try:
+            data = generator.encode(generator.generate(Image.open(source)))
+        except Exception as e:
+            print(f"❌ Error building SDF for {glyph}: {e}")
+            continue
+
+        sdf_path = glyph_root / style / "sdf"
+        sdf_path.mkdir(parents=True, exist_ok=True)
+        write_file(sdf_path / f"{name}.png", data)
+
+        index = indexes.setdefault(style, {"size": size, "spread": spread, "glyphs": {}})
+        index["glyphs"][name] = {"file": f"{name}.png", "source": str(source), "bytes": len(data)}
+        print(f"   ✅ {glyph}: {len(data)/1024:.1f}KB")
+
+    for style, index in indexes.items():
+        write_file(glyph_root / style / "sdf" / "index.json", json.dumps(index, indent=2).encode())
+        print(f"✅ SDF {style}: {len(index['glyphs'])} glyphs at {size}x{size}")
+
+    return indexes
+
+def benchmark_ladder(glyph_root: Path = Path("assets/glyphs"), styles: Optional[List[str]] = None,
+                     size: int = DEFAULT_SIZE, spread: float = DEFAULT_SPREAD) -> Dict:
+    """Compare SDF bytes and outline fidelity against the per-tier PNG ladder.
+
+    Only glyphs with a complete ladder are counted. Fidelity is the soft
+    IoU (sum of minimum over sum of maximum) of the anti-aliased SDF
+    rendering against each ladder rendition's coverage. Hairline strokes
+    have no exact match at small tiers, so each tier also reports the IoU of
+    the source's exact area coverage as the best any rendering can reach.
+    """
+    generator = SDFGenerator(size=size, spread=spread)
+    totals = {'glyphs': 0, 'ladder_bytes': 0, 'sdf_bytes': 0,
+              'iou': {tier: [] for tier in LADDER_TIERS}, 'exact_iou': {tier: [] for tier in LADDER_TIERS}}
+
+    for glyph, source in sorted(discover_sources(glyph_root)):
+        style, name = glyph.split('/', 1)
+        ladder = [glyph_root / style / "png" / f"{tier}x{tier}" / f"{name}.png" for tier in LADDER_TIERS]
+        if (styles and style not in styles) or not all(path.exists() for path in ladder):
+            continue
+        # Pre-sized renditions (name_64x64) have "ladders" that are not at their tiers
+        if any(max(Image.open(path).size) != tier for tier, path in zip(LADDER_TIERS, ladder)):
+            continue
+
+        img = Image.open(source)
+        extent = max(img.size)
+        source_coverage = Image.fromarray(generator.coverage(img), 'L')
+        sdf = generator.generate(img)
+        sdf_bytes = len(generator.encode(sdf))
+        ladder_bytes = sum(path.stat().st_size for path in ladder)
+
+        for tier, path in zip(LADDER_TIERS, ladder):
+            target = square_canvas(generator.coverage(Image.open(path)), tier)
+            exact = source_coverage.copy()
+            exact.thumbnail((tier, tier), Image.Resampling.BOX)
+
+            # The SDF texture keeps a spread margin around the glyph
+            outline = generator.reconstruct(sdf, tier, generator.glyph_window(extent))
+
+            totals['iou'][tier].append(soft_iou(outline, target))
+            totals['exact_iou'][tier].append(soft_iou(square_canvas(np.array(exact), tier), target))
+
+        totals['glyphs'] += 1
+        totals['ladder_bytes'] += ladder_bytes
+        totals['sdf_bytes'] += sdf_bytes
+        print(f"   {glyph}: ladder {ladder_bytes/1024:.1f}KB vs SDF {sdf_bytes/1024:.1f}KB")
+
+    for key in ('iou', 'exact_iou'):
+        totals[key] = {tier: float(np.mean(values)) if values else None for tier, values in totals[key].items()}
+    totals['passed'] = {tier: totals['iou'][tier] >= MIN_FIDELITY * totals['exact_iou'][tier]
+                        for tier in LADDER_TIERS if totals['iou'][tier] is not None}
+    return totals
+
+def square_canvas(coverage: np.ndarray, tier: int) -> np.ndarray:
+    """Center 0..255 coverage on a tier x tier canvas as 0..1 (ladder renditions keep aspect ratio)."""
+    canvas = np.zeros((tier, tier), dtype=np.float32)
+    top, left = (tier - coverage.shape[0]) // 2, (tier - coverage.shape[1]) // 2
+    canvas[top:top + coverage.shape[0], left:left + coverage.shape[1]] = coverage / 255.0
+    return canvas
+
+def soft_iou(a: np.ndarray, b: np.ndarray) -> float:
+    """IoU of two 0..1 coverage maps: sum of the minimum over sum of the maximum."""
+    union = np.maximum(a, b).sum()
+    return float(np.minimum(a, b).sum() / union) if union else 1.0
@@ -5,18 +5,35 @@ Handles all SVG-related operations including conversion, normalization, and colo
 
 import os
 import re
-import tempfile
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from xml.etree import ElementTree
+from xml.sax.saxutils import quoteattr
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 import numpy as np
 from PIL import Image
 from scipy import ndimage
 
+from .blobs import replace_file, write_file
+
+# Bytes fed to the incremental XML parser at a time
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Elements copied to normalized output; anything else (metadata, defs, ...) is dropped
+CONTAINER_TAGS = {'svg', 'g', 'a'}
+SHAPE_TAGS = {'path', 'polygon', 'polyline', 'rect', 'circle', 'ellipse', 'line'}
+CONTAINER_ATTRIBUTES = ('transform',)
+SHAPE_ATTRIBUTES = ('d', 'points', 'x', 'y', 'width', 'height', 'rx', 'ry', 'cx', 'cy', 'r',
+                    'x1', 'y1', 'x2', 'y2', 'fill-rule', 'transform')
+
 class SVGProcessor:
-    def __init__(self, output_size: int = 256):
-        """Initialize SVG processor with output size configuration."""
+    def __init__(self, output_size: int = 256, max_workers: Optional[int] = None, trace_timeout: int = 60):
+        """Initialize SVG processor with output size and potrace pool configuration."""
         self.output_size = output_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.trace_timeout = trace_timeout
+        self._executor = None
         
     def convert_to_svg(self, image_path: Union[str, Path], output_path: Union[str, Path]) -> bool:
         """Convert image to SVG using optimized processing pipeline."""
@@ -45,31 +62,7 @@ class SVGProcessor:
     def apply_color(self, svg_path: Union[str, Path], output_path: Union[str, Path], color_hex: str) -> bool:
         """Apply color to SVG while maintaining shape integrity."""
         try:
-            # Convert paths to Path objects
-            svg_path = Path(svg_path)
-            output_path = Path(output_path)
-            
-            with open(svg_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract path data
-            path_match = re.search(r'<path[^>]*d="([^"]*)"[^>]*>', content)
-            if not path_match:
-                print(f"❌ Could not extract path data from SVG")
-                return False
-            
-            # Create new SVG with color
-            colored_svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{self.output_size}" height="{self.output_size}" viewBox="0 0 {self.output_size} {self.output_size}" xmlns="http://www.w3.org/2000/svg">
-  <g fill="{color_hex}" stroke="none">
-    <path d="{path_match.group(1)}"/>
-  </g>
-</svg>'''
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(colored_svg)
-            
-            return True
+            return self._stream_transform(Path(svg_path), Path(output_path), color_hex)
             
         except Exception as e:
             print(f"❌ Error applying color: {e}")
@@ -78,43 +71,118 @@ class SVGProcessor:
     def normalize_svg(self, svg_path: Union[str, Path], output_path: Union[str, Path]) -> bool:
         """Normalize SVG for consistent display."""
         try:
-            # Convert paths to Path objects
-            svg_path = Path(svg_path)
-            output_path = Path(output_path)
-            
-            with open(svg_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract path data
-            path_matches = re.findall(r'<path[^>]*d="([^"]*)"[^>]*>', content)
-            if not path_matches:
-                print(f"❌ No path data found in SVG")
-                return False
-            
-            # Create normalized SVG
-            normalized_svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="{self.output_size}" height="{self.output_size}" viewBox="0 0 {self.output_size} {self.output_size}" xmlns="http://www.w3.org/2000/svg">
-  <g fill="#000000" stroke="none">
-'''
-            
-            for path_data in path_matches:
-                clean_path = re.sub(r'\s+', ' ', path_data.strip())
-                normalized_svg += f'    <path d="{clean_path}"/>\n'
-            
-            normalized_svg += '''  </g>
-</svg>'''
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(normalized_svg)
-            
-            return True
+            return self._stream_transform(Path(svg_path), Path(output_path), "#000000")
             
         except Exception as e:
             print(f"❌ Error normalizing SVG: {e}")
             return False
     
+    def process_directory(self, input_dir: Union[str, Path], output_dir: Union[str, Path],
+                          color_hex: Optional[str] = None, suffix: str = "") -> Dict[str, bool]:
+        """Color (or normalize, without color_hex) every SVG in a directory in parallel.
+        
+        Files are spread over a process pool; each worker streams its
+        documents, so memory stays bounded by the pool size.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        jobs = [(str(svg_file), str(output_dir / f"{svg_file.stem}{suffix}.svg"))
+                for svg_file in sorted(Path(input_dir).glob("*.svg"))]
+        
+        if not jobs:
+            return {}
+        
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+            results = pool.map(_transform_file, [(self.output_size, job, color_hex) for job in jobs],
+                               chunksize=max(1, len(jobs) // (self.max_workers * 4)))
+            return {output_path: success for (_, output_path), success in zip(jobs, results)}
+    
+    def convert_batch(self, jobs: List[Tuple[Union[str, Path], Union[str, Path]]]) -> Dict[str, bool]:
+        """Convert many images to SVG, binarizing the whole batch in vectorized NumPy.
+
+        jobs is a list of (image_path, output_path) pairs; returns success per output path.
+        """
+        results = {str(output_path): False for _, output_path in jobs}
+        
+        # Load every image that decodes cleanly into one stack
+        loaded = []
+        for image_path, output_path in jobs:
+            gray = self._preprocess_image(Path(image_path))
+            if gray is not None:
+                loaded.append((gray, Path(output_path)))
+        
+        if not loaded:
+            return results
+        
+        try:
+            masks = self.binarize_batch(np.stack([gray for gray, _ in loaded]))
+        except Exception as e:
+            print(f"❌ Error binarizing batch: {e}")
+            return results
+        
+        # Trace concurrently, bounded by CPU cores
+        output_paths = [output_path for _, output_path in loaded]
+        for output_path, success in zip(output_paths, self._trace_many(list(masks), output_paths)):
+            results[str(output_path)] = success
+        
+        return results
+    
+    def binarize_batch(self, grays: np.ndarray) -> np.ndarray:
+        """Binarize a (N, H, W) uint8 grayscale stack; True marks glyph pixels.
+        
+        One histogram per image drives both the 2%/98% contrast stretch and
+        Otsu's threshold, so the stretched image is never materialized:
+        the threshold is mapped back onto the original gray levels.
+        """
+        count = grays.shape[0]
+        levels = np.arange(256, dtype=np.float64)
+        
+        # Shared per-image histograms in a single bincount
+        offsets = (np.arange(count, dtype=np.int64) * 256)[:, None]
+        hist = np.bincount((grays.reshape(count, -1) + offsets).ravel(), minlength=count * 256)
+        hist = hist.reshape(count, 256).astype(np.float64)
+        total = hist.sum(axis=1, keepdims=True)
+        cdf = np.cumsum(hist, axis=1)
+        
+        # Contrast stretch bounds from histogram quantiles
+        p2 = (cdf < 0.02 * total).sum(axis=1)
+        p98 = (cdf < 0.98 * total).sum(axis=1)
+        scale = 255.0 / np.maximum(p98 - p2, 1)
+        stretch = np.clip((levels[None, :] - p2[:, None]) * scale[:, None], 0, 255)
+        
+        # Histogram of the stretched image, binned like np.histogram over [0, 256)
+        bins = np.minimum(stretch.astype(np.int64), 255)
+        stretched = np.zeros_like(hist)
+        np.add.at(stretched, (np.arange(count)[:, None], bins), hist)
+        
+        # Otsu's threshold from cumulative sums
+        weight_bg = np.cumsum(stretched, axis=1)
+        weight_fg = total - weight_bg
+        sum_bg = np.cumsum(stretched * levels, axis=1)
+        sum_total = sum_bg[:, -1:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = (sum_total * weight_bg - sum_bg * total) ** 2 / (weight_bg * weight_fg)
+        variance[(weight_bg == 0) | (weight_fg == 0)] = -1
+        threshold = np.argmax(variance, axis=1)
+        
+        # Pixels above threshold after stretching, looked up per original level
+        above = stretch > threshold[:, None]
+        binary = np.take_along_axis(above, grays.reshape(count, -1).astype(np.int64), axis=1)
+        binary = binary.reshape(grays.shape)
+        
+        # Clean up on booleans; padding slices and an in-plane structure keep images independent
+        structure = np.zeros((3, 3, 3), dtype=bool)
+        structure[1] = ndimage.generate_binary_structure(2, 1)
+        padded = np.pad(binary, ((1, 1), (0, 0), (0, 0)), constant_values=True)
+        padded = ndimage.binary_fill_holes(padded, structure=structure)
+        binary = padded[1:-1]
+        binary = ndimage.binary_opening(binary, structure=structure, iterations=1)
+        binary = ndimage.binary_closing(binary, structure=structure, iterations=1)
+        
+        return binary
+    
     def _preprocess_image(self, image_path: Path) -> Optional[np.ndarray]:
-        """Preprocess image for conversion."""
+        """Load image as a 512x512 uint8 grayscale array."""
         try:
             # Load and resize image
             img = Image.open(image_path).convert('RGB')
@@ -124,11 +192,7 @@ class SVGProcessor:
             img_array = np.array(img)
             gray = np.dot(img_array, [0.299, 0.587, 0.114])
             
-            # Enhance contrast
-            p2, p98 = np.percentile(gray, (2, 98))
-            gray = np.clip((gray - p2) * (255.0 / (p98 - p2)), 0, 255)
-            
-            return gray
+            return np.clip(gray, 0, 255).astype(np.uint8)
             
         except Exception as e:
             print(f"❌ Error preprocessing image: {e}")
@@ -137,83 +201,147 @@ class SVGProcessor:
     def _create_binary_image(self, gray: np.ndarray) -> Optional[np.ndarray]:
         """Create binary image using Otsu's method."""
         try:
-            # Calculate Otsu's threshold
-            hist, bins = np.histogram(gray.flatten(), 256, [0, 256])
-            total = gray.size
-            
-            sum_total = np.sum(np.arange(256) * hist)
-            sum_bg = weight_bg = 0
-            max_variance = threshold = 0
-            
-            for i in range(256):
-                weight_bg += hist[i]
-                if weight_bg == 0:
-                    continue
-                
-                weight_fg = total - weight_bg
-                if weight_fg == 0:
-                    break
-                
-                sum_bg += i * hist[i]
-                mean_bg = sum_bg / weight_bg
-                mean_fg = (sum_total - sum_bg) / weight_fg
-                
-                variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
-                if variance > max_variance:
-                    max_variance = variance
-                    threshold = i
-            
-            # Create binary image
-            binary = (gray > threshold).astype(np.uint8) * 255
-            
-            # Clean up binary image
-            binary = ndimage.binary_fill_holes(binary).astype(np.uint8) * 255
-            binary = ndimage.binary_opening(binary, iterations=1).astype(np.uint8) * 255
-            binary = ndimage.binary_closing(binary, iterations=1).astype(np.uint8) * 255
-            
-            # Invert to make glyph black on white
-            binary = 255 - binary
-            
-            return binary
+            return self._to_potrace_bitmap(self.binarize_batch(gray[None])[0])
             
         except Exception as e:
             print(f"❌ Error creating binary image: {e}")
             return None
     
+    def _to_potrace_bitmap(self, mask: np.ndarray) -> np.ndarray:
+        """Invert a glyph mask to black-on-white uint8 for potrace."""
+        return np.where(mask, 0, 255).astype(np.uint8)
+    
     def _potrace_convert(self, binary: np.ndarray, output_path: Path) -> bool:
-        """Convert binary image to SVG using potrace."""
+        """Convert binary image to SVG by streaming a PBM through potrace.
+        
+        Accepts a boolean glyph mask or a black-on-white uint8 bitmap. The SVG
+        is validated in memory and written atomically, so no temp PBM exists
+        and a failed trace never leaves a partial file behind.
+        """
         try:
-            # Save as temporary PBM
-            temp_pbm = tempfile.NamedTemporaryFile(suffix='.pbm', delete=False)
-            Image.fromarray(binary).save(temp_pbm.name, 'PPM')
+            output_path = Path(output_path)
             
-            # Convert using potrace
+            # Convert using potrace, PBM on stdin and SVG on stdout
             cmd = [
                 'potrace',
-                temp_pbm.name,
                 '-s',                # SVG output
                 '-k', '0.5',        # Corner threshold
                 '-t', '5',          # Optimization tolerance
                 '-a', '1',          # Corner alignment
                 '-O', '1.0',        # Optimize paths
                 '--tight',          # Remove whitespace
-                '-o', str(output_path)
+                '-o', '-'
             ]
             
-            subprocess.run(cmd, check=True, capture_output=True)
-            os.unlink(temp_pbm.name)
+            result = subprocess.run(cmd, input=self._encode_pbm(binary), check=True,
+                                    capture_output=True, timeout=self.trace_timeout)
+            svg = result.stdout
             
-            # Verify output
-            if output_path.exists():
-                with open(output_path, 'r') as f:
-                    content = f.read()
-                if '<path' not in content:
-                    print("❌ Generated SVG has no path data")
-                    return False
-                return True
+            # Verify output is well-formed and has path data
+            ElementTree.fromstring(svg)
+            if b'<path' not in svg:
+                print("❌ Generated SVG has no path data")
+                return False
             
-            return False
+            write_file(output_path, svg)
+            return True
             
         except Exception as e:
             print(f"❌ Error in potrace conversion: {e}")
-            return False 
\ No newline at end of file
+            return False
+    
+    def _trace_many(self, masks: List[np.ndarray], output_paths: List[Path]) -> List[bool]:
+        """Trace many masks concurrently on the bounded worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return list(self._executor.map(self._potrace_convert, masks, output_paths))
+    
+    def close(self):
+        """Shut down the potrace worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _encode_pbm(self, binary: np.ndarray) -> bytes:
+        """Encode a bitmap as binary PBM (P4), 1 bits are traced as ink."""
+        black = binary if binary.dtype == bool else binary < 128
+        height, width = black.shape
+        return f"P4\n{width} {height}\n".encode() + np.packbits(black, axis=1).tobytes()
+    
+    def _stream_transform(self, svg_path: Path, output_path: Path, fill: str) -> bool:
+        """Rewrite an SVG as a sized, single-fill document without loading it whole.
+        
+        The source is fed to an incremental parser in chunks. Every shape
+        (not just the first path) is written out as soon as it closes and is
+        then discarded, and group transforms are kept so potrace coordinates
+        still land inside the source viewBox.
+        """
+        parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        stack = []
+        skipped = 0
+        shapes = 0
+        
+        with replace_file(output_path, 'w', encoding='utf-8') as out:
+            with open(svg_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                    parser.feed(chunk)
+                    for event, element in parser.read_events():
+                        tag = element.tag.rpartition('}')[2]
+                        
+                        if event == 'start':
+                            stack.append(element)
+                            if skipped or tag not in CONTAINER_TAGS | SHAPE_TAGS:
+                                skipped += 1
+                            elif tag == 'svg' and len(stack) == 1:
+                                out.write(self._svg_header(element, fill))
+                            elif tag in CONTAINER_TAGS:
+                                out.write(f"<g{self._attributes(element, CONTAINER_ATTRIBUTES)}>\n")
+                            continue
+                        
+                        stack.pop()
+                        if skipped:
+                            skipped -= 1
+                        elif tag == 'svg' and not stack:
+                            out.write('  </g>\n</svg>\n')
+                        elif tag in CONTAINER_TAGS:
+                            out.write('</g>\n')
+                        elif tag in SHAPE_TAGS:
+                            out.write(f"    <{tag}{self._attributes(element, SHAPE_ATTRIBUTES)}/>\n")
+                            shapes += 1
+                        
+                        # Drop finished elements so the tree never grows
+                        element.clear()
+                        if stack:
+                            stack[-1].remove(element)
+            parser.close()
+            
+            if not shapes:
+                raise ValueError(f"No path data found in {svg_path.name}")
+        
+        return True
+    
+    def _svg_header(self, root: ElementTree.Element, fill: str) -> str:
+        """Open the output document, keeping the source coordinate system."""
+        view_box = root.get('viewBox')
+        if not view_box:
+            width = re.match(r'[\d.]+', root.get('width', ''))
+            height = re.match(r'[\d.]+', root.get('height', ''))
+            view_box = f"0 0 {width.group(0) if width else self.output_size} {height.group(0) if height else self.output_size}"
+        
+        return f'''<?xml version="1.0" encoding="UTF-8"?>
+<svg width="{self.output_size}" height="{self.output_size}" viewBox={quoteattr(view_box)} xmlns="http://www.w3.org/2000/svg">
+  <g fill={quoteattr(fill)} stroke="none">
+'''
+    
+    def _attributes(self, element: ElementTree.Element, names: Tuple[str, ...]) -> str:
+        """Serialize the kept attributes of an element, collapsing whitespace."""
+        return ''.join(f" {name}={quoteattr(' '.join(element.get(name).split()))}"
+                       for name in names if element.get(name) is not None)
+
+def _transform_file(job: Tuple[int, Tuple[str, str], Optional[str]]) -> bool:
+    """Process pool entry point for SVGProcessor.process_directory."""
+    output_size, (svg_path, output_path), color_hex = job
+    processor = SVGProcessor(output_size=output_size, max_workers=1)
+    if color_hex:
+        return processor.apply_color(svg_path, output_path, color_hex)
+    return processor.normalize_svg(svg_path, output_path)
@@ -0,0 +1,348 @@
+"""
+SVG Optimizer Module
+Minifies glyph SVGs: rounds path coordinates, rewrites paths as relative commands,
+merges sibling paths and strips redundant markup.
+"""
+
+import math
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+from .blobs import write_file
+
+SVG_NS = "http://www.w3.org/2000/svg"
+ElementTree.register_namespace('', SVG_NS)
+
+PATH_TOKEN = re.compile(r'([MmLlHhVvCcSsQqTtAaZz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)')
+
+# Number of values per segment, and which of them are x / y coordinates
+COMMAND_SHAPES = {
+    'M': 'xy', 'L': 'xy', 'T': 'xy',
+    'H': 'x', 'V': 'y',
+    'C': 'xyxyxy', 'S': 'xyxy', 'Q': 'xyxy',
+    'A': 'rr-ffxy',
+    'Z': ''
+}
+
+# Attributes whose numbers are rewritten without trailing zeros
+NUMERIC_ATTRIBUTES = ('width', 'height', 'viewBox', 'transform', 'x', 'y')
+
+# Attributes with no rendering effect, or equal to the SVG default
+REDUNDANT_ATTRIBUTES = {
+    'version': None,
+    'preserveAspectRatio': 'xMidYMid meet',
+    'stroke-width': '1',
+    'fill-rule': 'nonzero',
+    'fill-opacity': '1',
+    'opacity': '1'
+}
+
+def parse_path(d: str) -> List[Tuple[str, List[float]]]:
+    """Parse path data into (absolute command, absolute values) segments."""
+    segments = []
+    command = None
+    values = []
+
+    def flush():
+        if command is None:
+            return
+        upper = command.upper()
+        shape = COMMAND_SHAPES[upper]
+        if not shape:
+            segments.append(('Z', []))
+            return
+        if len(values) % len(shape):
+            raise ValueError(f"Bad argument count for '{command}'")
+        for i in range(0, len(values), len(shape)):
+            # Implicit repeats of a moveto are linetos
+            repeat = upper if i == 0 or upper != 'M' else 'L'
+            segments.append((repeat, values[i:i + len(shape)], command.islower()))
+
+    for match in PATH_TOKEN.finditer(d):
+        if match.group(1):
+            flush()
+            command = match.group(1)
+            values = []
+            if command in 'Zz':
+                flush()
+                command = None
+        else:
+            values.append(float(match.group(2)))
+    flush()
+
+    # Resolve relative values against the current point
+    absolute = []
+    x = y = start_x = start_y = 0.0
+    for segment in segments:
+        if segment[0] == 'Z':
+            absolute.append(('Z', []))
+            x, y = start_x, start_y
+            continue
+
+        upper, values, relative = segment
+        shape = COMMAND_SHAPES[upper]
+        resolved = []
+        for kind, value in zip(shape, values):
+            if kind == 'x':
+                resolved.append(value + x if relative else value)
+            elif kind == 'y':
+                resolved.append(value + y if relative else value)
+            else:
+                resolved.append(value)
+
+        if upper == 'H':
+            x = resolved[0]
+        elif upper == 'V':
+            y = resolved[0]
+        else:
+            x, y = resolved[-2], resolved[-1]
+        if upper == 'M':
+            start_x, start_y = x, y
+        absolute.append((upper, resolved))
+
+    return absolute
+
+def format_path(segments: List[Tuple[str, List[float]]]) -> str:
+    """Write parsed segments back as absolute path data, without losing precision."""
+    return ' '.join(upper + ' '.join(repr(value).removesuffix('.0') for value in values)
+                    for upper, values in segments)
+
+class SVGOptimizer:
+    def __init__(self, precision: int = 1, merge_paths: bool = True):
+        """Initialize optimizer with coordinate precision (decimal places)."""
+        self.precision = precision
+        self.merge_paths = merge_paths
+
+    def optimize(self, svg_path: Union[str, Path], output_path: Union[str, Path, None] = None) -> Optional[Dict]:
+        """Optimize an SVG file and return size and deviation statistics.
+
+        Without output_path only the statistics are computed (dry run).
+        """
+        try:
+            svg_path = Path(svg_path)
+            original = svg_path.read_bytes()
+            optimized, deviation = self.optimize_bytes(original)
+
+            if output_path is not None:
+                write_file(output_path, optimized)
+
+            return {
+                'path': svg_path,
+                'original_bytes': len(original),
+                'optimized_bytes': len(optimized),
+                'saved': len(original) - len(optimized),
+                'max_deviation': deviation
+            }
+
+        except Exception as e:
+            print(f"❌ Error optimizing {Path(svg_path).name}: {e}")
+            return None
+
+    def optimize_bytes(self, data: bytes) -> Tuple[bytes, float]:
+        """Optimize SVG markup; returns (optimized bytes, max deviation in user units)."""
+        root = ElementTree.fromstring(data)
+        max_deviation = 0.0
+
+        self._strip(root)
+        for parent, scale in self._walk(root, 1.0):
+            if self.merge_paths:
+                paths = self._merge(parent)
+            else:
+                paths = [child for child in parent if child.tag == f"{{{SVG_NS}}}path" and child.get('d')]
+            for path in paths:
+                d, deviation = self.rewrite_path(path.get('d'))
+                path.set('d', d)
+                max_deviation = max(max_deviation, deviation * scale * self._scale(path.get('transform')))
+
+        return ElementTree.tostring(root, encoding='utf-8', xml_declaration=False), max_deviation
+
+    def rewrite_path(self, d: str) -> Tuple[str, float]:
+        """Rewrite path data as rounded relative commands; returns (d, max deviation).
+
+        Relative offsets are taken between rounded absolute points, so the
+        rounding error never accumulates along a path.
+        """
+        parts = []
+        previous = last = None
+        deviation = 0.0
+        x = y = start_x = start_y = 0.0
+
+        for upper, values in parse_path(d):
+            if upper == 'Z':
+                parts.append('z')
+                previous = 'z'
+                x, y = start_x, start_y
+                continue
+
+            shape = COMMAND_SHAPES[upper]
+            rounded = [self._round(value) for value in values]
+            for kind, value, exact in zip(shape, rounded, values):
+                if kind in 'xy':
+                    deviation = max(deviation, abs(value - exact))
+
+            # First moveto stays absolute so the path has a fixed origin
+            if upper == 'M' and not parts:
+                command, numbers = 'M', rounded
+            else:
+                command = upper.lower()
+                numbers = []
+                for kind, value in zip(shape, rounded):
+                    if kind == 'x':
+                        numbers.append(self._round(value - x))
+                    elif kind == 'y':
+                        numbers.append(self._round(value - y))
+                    else:
+                        numbers.append(value)
+
+                # Axis-aligned lines are shorter as h / v
+                if command == 'l' and numbers[1] == 0:
+                    command, numbers = 'h', numbers[:1]
+                elif command == 'l' and numbers[0] == 0:
+                    command, numbers = 'v', numbers[1:]
+
+            if upper == 'H':
+                x = rounded[0]
+            elif upper == 'V':
+                y = rounded[0]
+            else:
+                x, y = rounded[-2], rounded[-1]
+            if upper == 'M':
+                start_x, start_y = x, y
+
+            # Repeated commands are implicit (a repeated moveto would mean lineto)
+            if command != previous or command in 'Mm':
+                parts.append(command)
+                last = None
+            for number in numbers:
+                formatted = self._format(number)
+                if last is not None and self._needs_separator(last, formatted):
+                    parts.append(' ')
+                parts.append(formatted)
+                last = formatted
+            previous = command
+
+        return ''.join(parts), deviation
+
+    def _merge(self, parent: ElementTree.Element) -> List[ElementTree.Element]:
+        """Merge runs of adjacent sibling paths whose other attributes are identical.
+
+        Potrace emits disjoint shapes as separate paths, so joining them as
+        subpaths of one path does not change the filled area. A relative
+        moveto would count from where the previous path ended, so appended
+        paths are written in absolute form, and each merged path must parse
+        to exactly the absolute segments of its parts.
+        """
+        runs = []
+        run_attributes = None
+
+        for child in list(parent):
+            if child.tag != f"{{{SVG_NS}}}path" or not child.get('d'):
+                run_attributes = None
+                continue
+
+            attributes = {k: v for k, v in child.attrib.items() if k != 'd'}
+            segments = parse_path(child.get('d'))
+            if run_attributes is not None and attributes == run_attributes and segments and segments[0][0] == 'M':
+                runs[-1][1].append(format_path(segments))
+                runs[-1][2].extend(segments)
+                parent.remove(child)
+            else:
+                run_attributes = attributes
+                runs.append((child, [child.get('d')], segments))
+
+        for path, parts, segments in runs:
+            if len(parts) > 1:
+                d = ' '.join(parts)
+                if parse_path(d) != segments:
+                    raise ValueError("Merged path data does not match the paths it joined")
+                path.set('d', d)
+
+        return [path for path, _, _ in runs]
+
+    def _strip(self, root: ElementTree.Element):
+        """Remove metadata, data-* attributes and attributes equal to their default."""
+        for parent in root.iter():
+            for child in list(parent):
+                if child.tag in (f"{{{SVG_NS}}}metadata", f"{{{SVG_NS}}}title", f"{{{SVG_NS}}}desc"):
+                    parent.remove(child)
+            for name in list(parent.attrib):
+                default = REDUNDANT_ATTRIBUTES.get(name, '')
+                if name.startswith('data-') or (name in REDUNDANT_ATTRIBUTES and default in (None, parent.get(name))):
+                    del parent.attrib[name]
+            for name in NUMERIC_ATTRIBUTES:
+                if name in parent.attrib:
+                    parent.set(name, re.sub(r'(\d+\.\d*?)0+\b', self._trim_zeros, parent.get(name)))
+            if parent.text and not parent.text.strip():
+                parent.text = None
+            if parent.tail and not parent.tail.strip():
+                parent.tail = None
+
+    def _trim_zeros(self, match: re.Match) -> str:
+        """Drop trailing zeros (and a bare decimal point) from a matched number."""
+        return match.group(1).rstrip('.')
+
+    def _walk(self, element: ElementTree.Element, scale: float):
+        """Yield (element, accumulated transform scale) for every container."""
+        scale *= self._scale(element.get('transform'))
+        yield element, scale
+        for child in element:
+            if child.tag != f"{{{SVG_NS}}}path":
+                yield from self._walk(child, scale)
+
+    def _scale(self, transform: Optional[str]) -> float:
+        """Estimate the largest axis scale a transform list applies."""
+        scale = 1.0
+        for name, args in re.findall(r'(\w+)\s*\(([^)]*)\)', transform or ''):
+            numbers = [float(n) for n in re.findall(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?', args)]
+            if name == 'scale' and numbers:
+                scale *= max(abs(n) for n in numbers)
+            elif name == 'matrix' and len(numbers) == 6:
+                a, b, c, d = numbers[:4]
+                scale *= max(math.hypot(a, b), math.hypot(c, d))
+        return scale
+
+    def _round(self, value: float) -> float:
+        """Round a value to the configured precision."""
+        return round(value, self.precision)
+
+    def _format(self, value: float) -> str:
+        """Format a number as compactly as possible."""
+        text = f"{value:.{self.precision}f}".rstrip('0').rstrip('.') if self.precision > 0 else f"{value:.0f}"
+        if text in ('-0', ''):
+            return '0'
+        if text.startswith('0.'):
+            return text[1:]
+        if text.startswith('-0.'):
+            return '-' + text[2:]
+        return text
+
+    def _needs_separator(self, last: str, formatted: str) -> bool:
+        """Check whether two adjacent numbers need a separator to parse apart."""
+        if formatted.startswith('-'):
+            return False
+        if formatted.startswith('.') and '.' in last:
+            return False
+        return True
+
+def optimize_directory(directory: Union[str, Path], precision: int = 1, write: bool = False) -> Dict:
+    """Optimize every SVG in a directory and report savings per file."""
+    optimizer = SVGOptimizer(precision=precision)
+    totals = {'files': 0, 'original_bytes': 0, 'optimized_bytes': 0, 'max_deviation': 0.0}
+
+    for svg_file in sorted(Path(directory).glob("*.svg")):
+        result = optimizer.optimize(svg_file, svg_file if write else None)
+        if result is None:
+            continue
+
+        totals['files'] += 1
+        totals['original_bytes'] += result['original_bytes']
+        totals['optimized_bytes'] += result['optimized_bytes']
+        totals['max_deviation'] = max(totals['max_deviation'], result['max_deviation'])
+
+        print(f"   {svg_file.name}: {result['original_bytes']/1024:.1f}KB → "
+              f"{result['optimized_bytes']/1024:.1f}KB, max deviation {result['max_deviation']:.3g}")
+
+    totals['saved'] = totals['original_bytes'] - totals['optimized_bytes']
+    return totals
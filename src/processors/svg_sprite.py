@@ -0,0 +1,155 @@
+"""
+SVG Sprite Module
+Builds one SVG sprite holding every glyph as a <symbol> filled with currentColor, plus a JSON id index.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional
+from xml.etree import ElementTree
+
+from .blobs import write_file
+from .svg_optimizer import SVGOptimizer
+
+SVG_NS = "http://www.w3.org/2000/svg"
+ElementTree.register_namespace('', SVG_NS)
+
+# Elements that carry no glyph geometry
+SKIPPED_TAGS = {f"{{{SVG_NS}}}{tag}" for tag in ('metadata', 'title', 'desc')}
+
+class SVGSpriteBuilder:
+    def __init__(self, source_dir: Path = Path("assets/glyphs/archetypal/svg"),
+                 output_dir: Path = Path("assets/glyphs/archetypal/sprite"),
+                 id_prefix: str = "glyph-", precision: Optional[int] = 1):
+        """Initialize sprite builder; precision None keeps path data untouched."""
+        self.source_dir = Path(source_dir)
+        self.output_dir = Path(output_dir)
+        self.id_prefix = id_prefix
+        self.precision = precision
+        self.optimizer = SVGOptimizer(precision=precision) if precision is not None else None
+        self.sprite_file = self.output_dir / "glyphs.svg"
+        self.index_file = self.output_dir / "index.json"
+
+    def build(self, force: bool = False) -> Optional[Dict]:
+        """Build or incrementally update the sprite.
+
+        Symbols of unchanged sources are carried over from the existing
+        sprite as-is; only new or changed glyphs are parsed again, and the
+        sprite is not rewritten when nothing changed.
+        """
+        try:
+            if not self.source_dir.exists():
+                print(f"❌ Source directory not found: {self.source_dir}")
+                return None
+
+            sources = {f.stem: f for f in sorted(self.source_dir.glob("*.svg"))}
+            index = None if force else self._load_index()
+            entries = index["symbols"] if index else {}
+            existing = self._load_symbols() if index else {}
+            stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+            for name in list(entries):
+                if name not in sources:
+                    del entries[name]
+                    stats['removed'] += 1
+
+            symbols = {}
+            for name, source in sources.items():
+                stat = source.stat()
+                fresh = {"mtime_ns": stat.st_mtime_ns, "bytes": stat.st_size}
+                entry = entries.get(name)
+
+                if entry and all(entry[k] == v for k, v in fresh.items()) and entry["id"] in existing:
+                    symbols[name] = existing[entry["id"]]
+                    stats['unchanged'] += 1
+                    continue
+
+                symbol = self._symbol(name, source)
+                if symbol is None:
+                    entries.pop(name, None)
+                    continue
+
+                stats['updated' if entry else 'added'] += 1
+                symbols[name] = symbol
+                entries[name] = {"id": symbol.get('id'), "viewBox": symbol.get('viewBox'),
+                                 "source": str(source), **fresh}
+
+            index = {"sprite": self.sprite_file.name, "id_prefix": self.id_prefix,
+                     "precision": self.precision, "symbols": dict(sorted(entries.items()))}
+            changed = stats['added'] + stats['updated'] + stats['removed']
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+            if changed or not self.sprite_file.exists():
+                sprite = ElementTree.Element(f"{{{SVG_NS}}}svg", {'style': 'display:none'})
+                for name in sorted(symbols):
+                    sprite.append(symbols[name])
+                write_file(self.sprite_file, ElementTree.tostring(sprite, encoding='utf-8'))
+                write_file(self.index_file, json.dumps(index, indent=2).encode())
+
+            print(f"✅ Sprite: {len(entries)} symbols, {self.sprite_file.stat().st_size/1024:.1f}KB "
+                  f"({stats['added']} added, {stats['updated']} updated, {stats['removed']} removed, "
+                  f"{stats['unchanged']} unchanged)")
+            return index
+
+        except Exception as e:
+            print(f"❌ Error building sprite: {e}")
+            return None
+
+    def _symbol(self, name: str, source: Path) -> Optional[ElementTree.Element]:
+        """Convert a glyph SVG into a <symbol> that inherits its fill."""
+        try:
+            root = ElementTree.parse(source).getroot()
+            view_box = root.get('viewBox') or f"0 0 {self._length(root.get('width'))} {self._length(root.get('height'))}"
+
+            symbol = ElementTree.Element(f"{{{SVG_NS}}}symbol", {
+                'id': f"{self.id_prefix}{name}",
+                'viewBox': view_box,
+                'fill': 'currentColor'
+            })
+
+            for child in root:
+                if child.tag not in SKIPPED_TAGS:
+                    symbol.append(child)
+
+            # Baked-in colors would override currentColor
+            for element in symbol.iter():
+                if element is not symbol and element.get('fill') not in (None, 'none'):
+                    del element.attrib['fill']
+                for attribute in [a for a in element.attrib if a.startswith('data-')]:
+                    del element.attrib[attribute]
+                element.tail = None
+                if element.text and not element.text.strip():
+                    element.text = None
+                if self.optimizer and element.tag == f"{{{SVG_NS}}}path" and element.get('d'):
+                    element.set('d', self.optimizer.rewrite_path(element.get('d'))[0])
+
+            return symbol
+
+        except Exception as e:
+            print(f"❌ Error reading {source.name}: {e}")
+            return None
+
+    def _length(self, value: Optional[str]) -> str:
+        """Strip units from a width/height attribute."""
+        match = re.match(r'[-+]?(?:\d+\.?\d*|\.\d+)', value or '')
+        return match.group(0) if match else '0'
+
+    def _load_index(self) -> Optional[Dict]:
+        """Load the existing id index if it was built with the same settings."""
+        if not self.index_file.exists() or not self.sprite_file.exists():
+            return None
+
+        with open(self.index_file, 'r') as f:
+            index = json.load(f)
+
+        if index.get("id_prefix") != self.id_prefix or index.get("precision") != self.precision:
+            print("⚠️ Sprite settings changed, rebuilding from scratch")
+            return None
+
+        return index
+
+    def _load_symbols(self) -> Dict[str, ElementTree.Element]:
+        """Load symbols of the existing sprite keyed by id."""
+        root = ElementTree.parse(self.sprite_file).getroot()
+        return {symbol.get('id'): symbol for symbol in root.iter(f"{{{SVG_NS}}}symbol")}
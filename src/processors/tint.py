@@ -0,0 +1,228 @@
+"""
+Tint Processing Module
+Applies emotion colors to glyph alpha masks, producing many color variants in one vectorized pass.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+import numpy as np
+from PIL import Image
+
+from .blobs import save_image
+from .png import PNGEncoder
+
+# Variant colors: gold on black plus emotional colors
+VARIANT_COLORS = {
+    'gold_on_black': '#FFD700',  # Gold
+    'passion': '#FF4444',        # Red
+    'wisdom': '#4444FF',         # Blue
+    'growth': '#44FF44',         # Green
+    'spirit': '#FF44FF',         # Magenta
+    'earth': '#8B4513',          # Brown
+    'water': '#0066CC',          # Blue
+    'fire': '#FF6600',           # Orange
+    'air': '#CCCCFF',            # Light blue
+    'sacred': '#FFD700',         # Gold
+    'mystic': '#9932CC'          # Purple
+}
+
+# Variants gathered per fancy-indexing pass; bounds peak memory to a couple of images
+DEFAULT_BATCH_SIZE = 2
+
+def parse_hex(color_hex: str) -> Tuple[int, int, int]:
+    """Convert '#RRGGBB' (or 'RRGGBB') to an RGB tuple."""
+    color_hex = color_hex.lstrip('#')
+    if len(color_hex) != 6:
+        raise ValueError(f"Invalid hex color: {color_hex}")
+    return tuple(int(color_hex[i:i+2], 16) for i in (0, 2, 4))
+
+def alpha_mask(img: Image.Image) -> np.ndarray:
+    """Get a glyph's alpha coverage mask as a uint8 array."""
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    return np.array(img.getchannel('A'))
+
+def coverage_mask(img: Image.Image, background_threshold: int = 30) -> np.ndarray:
+    """Get a glyph's coverage mask: alpha when it has transparency, ink brightness otherwise.
+
+    Most glyphs are opaque (gold on black, or black ink on white for meru),
+    so their alpha is uniform. Ink is measured against the background seen
+    on the image border and ramped from the background threshold up to the
+    glyph's own peak, keeping anti-aliased line edges.
+    """
+    mask = alpha_mask(img)
+    if mask.min() != mask.max():
+        return mask
+
+    rgb = np.array(img.convert('RGB'))
+    ink = rgb.max(axis=2)
+    border = np.concatenate([ink[0], ink[-1], ink[:, 0], ink[:, -1]])
+    if np.median(border) > 127:
+        # Dark ink on a light background
+        ink = 255 - rgb.min(axis=2)
+
+    foreground = ink[ink > background_threshold]
+    if not foreground.size:
+        return np.zeros(ink.shape, dtype=np.uint8)
+
+    peak = max(float(np.percentile(foreground, 99)), background_threshold + 1)
+    ramp = (ink.astype(np.float32) - background_threshold) * (255 / (peak - background_threshold))
+    return np.clip(np.round(ramp), 0, 255).astype(np.uint8)
+
+class TintEngine:
+    def __init__(self, background: Tuple[int, int, int, int] = (0, 0, 0, 255)):
+        """Initialize tint engine with the background used for solid variants."""
+        self.background = np.array(background, dtype=np.uint8)
+
+    def color_table(self, colors: Dict[str, str]) -> np.ndarray:
+        """Build an (N, 2, 4) lookup table of [background, color] per variant."""
+        table = np.empty((len(colors), 2, 4), dtype=np.uint8)
+        table[:, 0] = self.background
+        for i, color_hex in enumerate(colors.values()):
+            table[i, 1] = parse_hex(color_hex) + (255,)
+        return table
+
+    def iter_variants(self, mask: np.ndarray, colors: Dict[str, str],
+                      batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Tuple[str, Image.Image]]:
+        """Yield (name, image) solid color variants of a mask.
+
+        The coverage index is computed once and gathered against the color
+        table for each batch of variants with a single fancy-indexing pass,
+        so only batch_size images are held at a time. Pixels with any
+        coverage take the variant color, the rest take the background.
+        """
+        names = list(colors)
+        table = self.color_table(colors)
+        coverage = (mask > 0).astype(np.uint8)
+        batch_size = max(1, batch_size)
+
+        for start in range(0, len(names), batch_size):
+            variants = table[start:start + batch_size][:, coverage]
+            for offset, data in enumerate(variants):
+                yield names[start + offset], Image.fromarray(data, 'RGBA')
+
+    def tint(self, mask: np.ndarray, color_hex: str) -> Image.Image:
+        """Color a mask on a transparent background, keeping anti-aliased coverage."""
+        data = np.empty(mask.shape + (4,), dtype=np.uint8)
+        data[:, :, :3] = parse_hex(color_hex)
+        data[:, :, 3] = mask
+        return Image.fromarray(data, 'RGBA')
+
+    def write_variants(self, img: Image.Image, output_dir: Union[str, Path], symbol_name: str,
+                       colors: Dict[str, str], batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+        """Stream every color variant of an image to disk as soon as it is encoded."""
+        output_dir = Path(output_dir)
+        sizes = {}
+
+        for variant_name, variant_img in self.iter_variants(alpha_mask(img), colors, batch_size):
+            output_path = output_dir / f"{symbol_name}_{variant_name}.png"
+            save_image(variant_img, output_path, 'PNG', optimize=True, compress_level=9)
+
+            sizes[variant_name] = output_path.stat().st_size
+            print(f"   ✅ {variant_name}: {sizes[variant_name]/1024:.1f}KB")
+
+        return sizes
+
+class TintCache:
+    def __init__(self, engine: Optional[TintEngine] = None, max_renders: int = 512, max_masks: int = 128,
+                 mask_store=None):
+        """Initialize on-demand tinting with LRU caches for masks and rendered PNGs.
+
+        When a MaskStore is given, masks at its size tiers are read from the
+        memory-mapped store instead of decoding the source image.
+        """
+        self.engine = engine or TintEngine()
+        self.mask_store = mask_store
+        self.encoder = PNGEncoder()
+        self.max_renders = max_renders
+        self.max_masks = max_masks
+        self._renders = OrderedDict()
+        self._masks = OrderedDict()
+        self._lock = threading.Lock()
+
+    def etag(self, path: Path, color_hex: Optional[str], size: Optional[int], version: Optional[str] = None) -> str:
+        """Build a strong ETag from the source state and render parameters.
+
+        version identifies the content of a source served from memory (a
+        pack sha1 or a zip CRC); a file on disk is identified by its stat.
+        """
+        key = f"{path.resolve()}|{version or self._file_version(path)}|{color_hex}|{size}"
+        return '"' + hashlib.sha1(key.encode()).hexdigest() + '"'
+
+    def render(self, path: Path, color_hex: Optional[str] = None, size: Optional[int] = None,
+               version: Optional[str] = None, read: Optional[Callable[[], bytes]] = None) -> Tuple[bytes, str]:
+        """Render a glyph tinted and/or resized, returning (png bytes, etag).
+
+        With read set, the source image bytes come from it (a pack or zip
+        member, identified by version) instead of the file at path.
+        """
+        etag = self.etag(path, color_hex, size, version)
+
+        with self._lock:
+            if etag in self._renders:
+                self._renders.move_to_end(etag)
+                return self._renders[etag], etag
+
+        if color_hex:
+            img = self.engine.tint(self._mask(path, size, version, read), color_hex)
+        else:
+            img = self._resized(path, size, read)
+        data = self.encoder.encode(img, 'palette')
+
+        with self._lock:
+            self._renders[etag] = data
+            while len(self._renders) > self.max_renders:
+                self._renders.popitem(last=False)
+
+        return data, etag
+
+    def _mask(self, path: Path, size: Optional[int], version: Optional[str] = None,
+              read: Optional[Callable[[], bytes]] = None) -> np.ndarray:
+        """Get the (cached) coverage mask of a glyph at a size."""
+        stored = self._stored_mask(path, size)
+        if stored is not None:
+            return stored
+
+        key = (str(path.resolve()), version or self._file_version(path), size)
+
+        with self._lock:
+            if key in self._masks:
+                self._masks.move_to_end(key)
+                return self._masks[key]
+
+        mask = coverage_mask(self._resized(path, size, read))
+
+        with self._lock:
+            self._masks[key] = mask
+            while len(self._masks) > self.max_masks:
+                self._masks.popitem(last=False)
+
+        return mask
+
+    def _file_version(self, path: Path) -> str:
+        """Identify a file's content on disk by its modification time and size."""
+        stat = path.stat()
+        return f"{stat.st_mtime_ns}|{stat.st_size}"
+
+    def _stored_mask(self, path: Path, size: Optional[int]) -> Optional[np.ndarray]:
+        """Look a glyph up in the mask store by style/name when size is a stored tier."""
+        if self.mask_store is None or size not in self.mask_store.tiers:
+            return None
+
+        try:
+            parts = path.resolve().relative_to(self.mask_store.glyph_root.resolve()).parts
+        except ValueError:
+            return None
+
+        return self.mask_store.get(f"{parts[0]}/{path.stem}", size)
+
+    def _resized(self, path: Path, size: Optional[int], read: Optional[Callable[[], bytes]] = None) -> Image.Image:
+        """Load a glyph as RGBA, fitted within size x size."""
+        img = Image.open(io.BytesIO(read()) if read else path).convert('RGBA')
+        if size:
+            img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        return img
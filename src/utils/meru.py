@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional, List
 from dotenv import load_dotenv
 
+from ..processors.blobs import download_file
+
 class MERUInterface:
     def __init__(self):
         """Initialize MERU interface."""
@@ -36,8 +38,7 @@ class MERUInterface:
                 return False
             
             # Download the generated image
-            import urllib.request
-            urllib.request.urlretrieve(output[0].url, output_path)
+            download_file(output[0].url, output_path)
             print(f"📥 Downloaded image to: {output_path}")
             
             return True
@@ -10,6 +10,8 @@ import os
 import replicate
 from dotenv import load_dotenv
 
+from ..processors.blobs import copy_file, download_file
+
 class ModelInterface(ABC):
     """Abstract base class for AI model interfaces."""
     
@@ -65,8 +67,7 @@ class MERUInterface(ModelInterface):
                 return False
             
             # Download the generated image
-            import urllib.request
-            urllib.request.urlretrieve(output[0].url, output_path)
+            download_file(output[0].url, output_path)
             print(f"📥 Downloaded image to: {output_path}")
             
             return True
@@ -120,8 +121,7 @@ class SDXLInterface(ModelInterface):
                 return False
             
             # Download the generated image
-            import urllib.request
-            urllib.request.urlretrieve(output[0], output_path)
+            download_file(output[0], output_path)
             print(f"📥 Downloaded image to: {output_path}")
             
             return True
@@ -172,8 +172,7 @@ class MidjourneyInterface(ModelInterface):
                 return False
             
             # Download the generated image
-            import urllib.request
-            urllib.request.urlretrieve(output[0], output_path)
+            download_file(output[0], output_path)
             print(f"📥 Downloaded image to: {output_path}")
             
             return True
@@ -237,15 +236,13 @@ class CelticInterface(ModelInterface):
             for i, variant in enumerate(output):
                 # Change extension to .png and use PNG directory
                 variant_path = output_path.parent.parent / "png" / f"{output_path.stem}_variant_{i+1}.png"
-                import urllib.request
-                urllib.request.urlretrieve(variant.url, variant_path)
+                download_file(variant.url, variant_path)
                 variants.append(variant_path)
                 print(f"📥 Downloaded Celtic variant {i+1} to: {variant_path}")
             
             # For API usage, don't require interactive selection
             # Just save the first variant as the main output and keep all variants
-            import shutil
-            shutil.copy2(variants[0], output_path)
+            copy_file(variants[0], output_path)
             print(f"✅ Generated {len(variants)} variants, using first as default")
             return True
             
@@ -287,8 +284,7 @@ class CelticInterface(ModelInterface):
             for i, variant in enumerate(output):
                 # Change extension to .png and use PNG directory
                 variant_path = output_path.parent.parent / "png" / f"{output_path.stem}_variant_{i+1}.png"
-                import urllib.request
-                urllib.request.urlretrieve(variant.url, variant_path)
+                download_file(variant.url, variant_path)
                 variants.append(variant_path)
                 print(f"📥 Downloaded Celtic variant {i+1} to: {variant_path}")
             
@@ -332,8 +328,7 @@ class CelticInterface(ModelInterface):
                         selected_variant = variant_paths[choice_num - 1]
                         
                         # Copy selected variant to final path
-                        import shutil
-                        shutil.copy2(selected_variant, final_path)
+                        copy_file(selected_variant, final_path)
                         
                         # Clean up other variants
                         for variant_path in variant_paths:
@@ -452,8 +447,7 @@ class CustomModelInterface(ModelInterface):
                 return False
             
             # Download the generated image
-            import urllib.request
-            urllib.request.urlretrieve(output[0], output_path)
+            download_file(output[0], output_path)
             print(f"📥 Downloaded image to: {output_path}")
             
             return True